@@ -0,0 +1,68 @@
+
+
+def benchmark_cacher_backends():
+    """
+    Compare the time to save and load numpy-heavy data with each Cacher
+    backend.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_cacher.py
+    """
+    import ubelt as ub
+    import timerit
+    import numpy as np
+    dpath = ub.Path.appdir('ubelt/bench/cacher').ensuredir()
+    rng = np.random.RandomState(0)
+    data = {
+        'key{}'.format(idx): rng.rand(256, 256, 8)
+        for idx in range(16)
+    }
+    basis = [
+        {'backend': 'pickle', 'compress': None},
+        {'backend': 'pickle5', 'compress': None},
+        {'backend': 'npz', 'compress': None},
+        {'backend': 'pickle', 'compress': 'gzip'},
+        {'backend': 'pickle5', 'compress': 'gzip'},
+    ]
+    try:
+        import zstandard  # NOQA
+        basis.append({'backend': 'pickle5', 'compress': 'zstd'})
+    except ImportError:
+        pass
+    try:
+        import lz4  # NOQA
+        basis.append({'backend': 'pickle5', 'compress': 'lz4'})
+    except ImportError:
+        pass
+
+    ti = timerit.Timerit(5, bestof=3, verbose=1)
+    sizes = {}
+    for kw in basis:
+        key = ub.repr2(kw, nl=0, nobr=1, sk=1, itemsep='')
+        cacher = ub.Cacher('bench', depends=key, dpath=dpath, verbose=0,
+                           **kw)
+        for timer in ti.reset('save ' + key):
+            with timer:
+                cacher.save(data)
+        sizes[key] = ub.Path(cacher.get_fpath()).stat().st_size
+        for timer in ti.reset('load ' + key):
+            with timer:
+                loaded = cacher.load()
+        for timer in ti.reset('load+sum ' + key):
+            with timer:
+                loaded = cacher.load()
+                # touch the data, which is lazy for memory mapped backends
+                [v.sum() for v in loaded.values()]
+        cacher.clear()
+    print('mean seconds')
+    print(ub.repr2(ti.rankings['mean'], precision=4, align=':'))
+    print('file sizes')
+    print(ub.repr2(sizes, align=':'))
+
+
+if __name__ == '__main__':
+    """
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_cacher.py
+    """
+    benchmark_cacher_backends()
@@ -83,9 +83,42 @@ def benchmark_hash_extensions():
             for data in datas:
                 ub.hash_data(data)
 
+
+def benchmark_hash_data_many():
+    """
+    Compare hashing many small items one at a time to hashing them in batch
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_hash.py benchmark_hash_data_many
+    """
+    import ubelt as ub
+    import timerit
+    import numpy as np
+    N = 10000
+    datasets = {
+        'strings': [str(i) for i in range(N)],
+        'ints': list(range(N)),
+        'records': [(i, str(i), {'a': i}) for i in range(N)],
+        'ndarray-rows': np.random.rand(N, 8),
+    }
+    ti = timerit.Timerit(5, bestof=3, verbose=1)
+    for key, items in datasets.items():
+        for timer in ti.reset('{} - loop'.format(key)):
+            with timer:
+                [ub.hash_data(item, hasher='sha1') for item in items]
+        for timer in ti.reset('{} - hash_data_many'.format(key)):
+            with timer:
+                ub.hash_data_many(items, hasher='sha1')
+    print(ub.repr2(ti.rankings['mean'], precision=6, align=':'))
+
+
 if __name__ == '__main__':
     """
     CommandLine:
         python ~/code/ubelt/dev/bench_hash.py
     """
-    benchmark_hash_data()
+    import sys
+    if 'benchmark_hash_data_many' in sys.argv:
+        benchmark_hash_data_many()
+    else:
+        benchmark_hash_data()
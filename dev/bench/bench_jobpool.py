@@ -0,0 +1,60 @@
+
+
+def _tiny_task(x):
+    return x + 1
+
+
+def benchmark_jobpool_overhead():
+    """
+    Measure the per-task overhead of JobPool for tiny tasks in serial, thread,
+    and process mode, with and without batching.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_jobpool.py
+    """
+    import ubelt as ub
+    import timerit
+    N = 20_000
+    max_workers = 4
+
+    basis = [
+        {'mode': 'serial', 'batchsize': None},
+        {'mode': 'thread', 'batchsize': None},
+        {'mode': 'thread', 'batchsize': 'auto'},
+        {'mode': 'process', 'batchsize': None},
+        {'mode': 'process', 'batchsize': 64},
+        {'mode': 'process', 'batchsize': 'auto'},
+    ]
+
+    ti = timerit.Timerit(3, bestof=1, verbose=1)
+    for kw in basis:
+        key = ub.repr2(kw, nl=0, nobr=1, sk=1, itemsep='')
+        for timer in ti.reset('submit ' + key):
+            pool = ub.JobPool(max_workers=max_workers, **kw)
+            with timer:
+                for x in range(N):
+                    pool.submit(_tiny_task, x)
+                for job in pool.as_completed():
+                    job.result()
+            pool.shutdown()
+        for timer in ti.reset('imap ' + key):
+            pool = ub.JobPool(max_workers=max_workers, **kw)
+            with timer:
+                for _ in pool.imap(_tiny_task, range(N)):
+                    pass
+            pool.shutdown()
+
+    overhead = {
+        key: seconds / N * 1e6
+        for key, seconds in ti.rankings['min'].items()
+    }
+    print('microseconds per task')
+    print(ub.repr2(overhead, precision=2, align=':'))
+
+
+if __name__ == '__main__':
+    """
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_jobpool.py
+    """
+    benchmark_jobpool_overhead()
@@ -0,0 +1,69 @@
+
+
+def benchmark_progiter_overhead():
+    """
+    Measure the per-item overhead of ProgIter compared to a bare loop and to
+    tqdm over a tight loop of cheap items.
+
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_progiter.py
+    """
+    import ubelt as ub
+    import timerit
+    import io
+    N = 1_000_000
+    file = io.StringIO()
+
+    def bare_loop():
+        for _ in range(N):
+            pass
+
+    def progiter_loop():
+        for _ in ub.ProgIter(range(N), file=file):
+            pass
+
+    def progiter_fixed_freq_loop():
+        for _ in ub.ProgIter(range(N), file=file, freq=1000, adjust=False):
+            pass
+
+    def progiter_disabled_loop():
+        for _ in ub.ProgIter(range(N), file=file, enabled=False):
+            pass
+
+    basis = {
+        'bare': bare_loop,
+        'progiter': progiter_loop,
+        'progiter-freq1000': progiter_fixed_freq_loop,
+        'progiter-disabled': progiter_disabled_loop,
+    }
+    try:
+        import tqdm
+    except ImportError:
+        print('tqdm is not installed, skipping')
+    else:
+        def tqdm_loop():
+            for _ in tqdm.tqdm(range(N), file=file):
+                pass
+        basis['tqdm'] = tqdm_loop
+
+    ti = timerit.Timerit(5, bestof=3, verbose=1)
+    for key, func in basis.items():
+        for timer in ti.reset(key):
+            with timer:
+                func()
+
+    baseline = ti.rankings['min']['bare']
+    overhead = {
+        key: (seconds - baseline) / N * 1e9
+        for key, seconds in ti.rankings['min'].items()
+    }
+    print('overhead in nanoseconds per item')
+    print(ub.repr2(overhead, precision=1, align=':'))
+
+
+if __name__ == '__main__':
+    """
+    CommandLine:
+        python ~/code/ubelt/dev/bench/bench_progiter.py
+    """
+    benchmark_progiter_overhead()
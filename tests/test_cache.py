@@ -208,6 +208,241 @@ def test_cache_stamp_with_hash():
         stamp._expire_checks['hash'] = False
         assert not stamp.expired()
 
+
+def test_cacher_backends():
+    """
+    Each builtin backend can roundtrip data, with and without compression.
+    """
+    dpath = ub.Path.appdir('ubelt/tests/test-cacher-backends').ensuredir()
+    data = {'a': [1, 2, 3], 'b': 'string'}
+    for backend in ['pickle', 'json', 'pickle5']:
+        for compress in [None, 'gzip']:
+            cacher = ub.Cacher('backend', depends=[backend, compress],
+                               dpath=dpath, backend=backend,
+                               compress=compress, verbose=0)
+            cacher.clear()
+            cacher.save(data)
+            assert cacher.load() == data
+
+    with pytest.raises(ValueError):
+        ub.Cacher('backend', dpath=dpath, compress='not-a-compressor')
+
+
+def test_cacher_numpy_backends():
+    np = pytest.importorskip('numpy')
+    dpath = ub.Path.appdir('ubelt/tests/test-cacher-backends').ensuredir()
+    arr = np.random.rand(7, 5).astype(np.float32)
+    data = {
+        'float': arr,
+        'fortran': np.asfortranarray(arr),
+        'empty': np.empty((0, 3)),
+        'scalar': np.array(3),
+    }
+
+    cacher = ub.Cacher('npy', dpath=dpath, backend='npy', verbose=0)
+    cacher.save(arr)
+    loaded = cacher.load()
+    assert isinstance(loaded, np.memmap)
+    assert np.all(loaded == arr)
+
+    cacher = ub.Cacher('npz', dpath=dpath, backend='npz', verbose=0)
+    cacher.save(data)
+    loaded = cacher.load()
+    assert set(loaded) == set(data)
+    for key, value in data.items():
+        assert loaded[key].shape == value.shape
+        assert loaded[key].dtype == value.dtype
+        assert np.all(loaded[key] == value)
+    assert loaded['fortran'].flags['F_CONTIGUOUS']
+
+    for compress in [None, 'gzip']:
+        cacher = ub.Cacher('pickle5', depends=[compress], dpath=dpath,
+                           backend='pickle5', compress=compress, verbose=0)
+        cacher.save(data)
+        loaded = cacher.load()
+        for key, value in data.items():
+            assert np.all(loaded[key] == value)
+        # Arrays loaded from out-of-band buffers are writable
+        loaded['float'][0, 0] = -1
+
+    with pytest.raises(ValueError):
+        ub.Cacher('npy', dpath=dpath, backend='npy', compress='gzip')
+
+
+def _slow_counted_compute(counter_fpath):
+    import time
+    with open(counter_fpath, 'a') as file:
+        file.write('x')
+    time.sleep(0.2)
+    return 'expensive result'
+
+
+def _locked_ensure_worker(dpath, counter_fpath):
+    cacher = ub.Cacher('single_flight', depends='a', dpath=dpath, lock=True,
+                       verbose=0)
+    return cacher.ensure(_slow_counted_compute, counter_fpath)
+
+
+def test_cacher_lock_single_flight():
+    """
+    Only one of several processes computes a missing cache entry
+    """
+    dpath = ub.Path.appdir('ubelt/tests/test-cacher-lock').delete().ensuredir()
+    counter_fpath = dpath / 'counter.txt'
+    counter_fpath.write_text('')
+    with ub.JobPool('process', max_workers=4) as pool:
+        for _ in range(4):
+            pool.submit(_locked_ensure_worker, dpath, counter_fpath)
+        results = [job.result() for job in pool.jobs]
+    assert results == ['expensive result'] * 4
+    assert counter_fpath.read_text() == 'x'
+    # No temporary files are left behind
+    assert not list(dpath.glob('*.tmp'))
+
+
+def test_cacher_atomic_save_failure():
+    """
+    A failed save does not clobber the existing cache or leave temp files
+    """
+    dpath = ub.Path.appdir('ubelt/tests/test-cacher-atomic').delete().ensuredir()
+    cacher = ub.Cacher('atomic', depends='a', dpath=dpath, verbose=0)
+    cacher.save('good data')
+    with pytest.raises(Exception):
+        cacher.save(lambda: 'lambdas cannot be pickled')
+    assert cacher.load() == 'good data'
+    assert not list(dpath.glob('*.tmp'))
+
+
+def test_cache_dir_policies():
+    import time
+    from ubelt.util_cache import CacheDir
+    dpath = ub.Path.appdir('ubelt/tests/test-cache-dir').delete().ensuredir()
+
+    # Files written without a CacheDir can be indexed
+    for idx in range(4):
+        ub.Cacher('item', depends=[idx], dpath=dpath, verbose=0).save(idx)
+    cache_dir = CacheDir(dpath, policy='lfu')
+    assert cache_dir.scan() == 4
+    assert cache_dir.usage()['num_entries'] == 4
+
+    cachers = [ub.Cacher('item', depends=[idx], cache_dir=cache_dir,
+                         verbose=0) for idx in range(4)]
+    # Make item 0 the most frequently used and item 3 the most recently used
+    for _ in range(3):
+        cachers[0].load()
+    cachers[1].load()
+    cachers[2].load()
+    cachers[3].load()
+
+    lfu_order = [e['fname'] for e in cache_dir.entries()]
+    assert lfu_order[-1] == ub.Path(cachers[0].get_fpath()).name
+
+    cache_dir.max_entries = 2
+    evicted = cache_dir.evict()
+    assert sorted(evicted) == sorted([cachers[1].get_fpath(),
+                                      cachers[2].get_fpath()])
+    assert [c.exists() for c in cachers] == [True, False, False, True]
+    assert not exists(cachers[1].get_fpath() + '.meta')
+
+    # LRU evicts the least recently used instead
+    cache_dir.policy = 'lru'
+    cache_dir.max_entries = 1
+    assert cache_dir.evict(dry=True) == [cachers[0].get_fpath()]
+    assert cachers[0].exists()
+
+    # Limit the total size
+    cache_dir.max_entries = None
+    cache_dir.max_bytes = 0
+    # The entry that was just saved is never evicted by its own save
+    cachers[1].save('new data')
+    assert [c.exists() for c in cachers] == [False, True, False, False]
+    assert len(cache_dir) == 1
+
+    # Limit the age
+    cache_dir.max_bytes = None
+    cache_dir.max_age = 0.05
+    time.sleep(0.1)
+    cachers[2].save('fresh')
+    assert [c.exists() for c in cachers] == [False, False, True, False]
+
+    # Clearing an entry removes it from the index
+    cachers[2].clear()
+    assert len(cache_dir) == 0
+
+
+def test_cache_dir_only_evicts_cacher_files():
+    """
+    Files that a Cacher did not write and lock files are never evicted
+    """
+    from ubelt.util_cache import CacheDir
+    dpath = ub.Path.appdir('ubelt/tests/test-cache-dir-shared').delete().ensuredir()
+    other_fpath = dpath / 'downloaded.zip'
+    other_fpath.write_text('someone else owns this file')
+    cachers = [ub.Cacher('item', depends=[idx], dpath=dpath, lock=True,
+                         verbose=0) for idx in range(3)]
+    for idx, cacher in enumerate(cachers):
+        cacher.ensure(lambda: idx)
+    lock_fpaths = [ub.Path(c.get_fpath() + '.lock') for c in cachers]
+    assert all(p.exists() for p in lock_fpaths)
+
+    cache_dir = CacheDir(dpath, max_bytes=0)
+    assert cache_dir.scan() == 3
+    evicted = cache_dir.evict()
+    assert len(evicted) == 3
+    assert not any(c.exists() for c in cachers)
+    assert other_fpath.exists()
+    assert all(p.exists() for p in lock_fpaths)
+    assert cache_dir.scan() == 0
+
+
+def test_cache_dir_evict_within_limits():
+    """
+    Eviction respects the limits exactly and is a no-op when within them
+    """
+    from ubelt.util_cache import CacheDir
+    dpath = ub.Path.appdir('ubelt/tests/test-cache-dir-limits').delete().ensuredir()
+    cache_dir = CacheDir(dpath, max_entries=10)
+    cachers = [ub.Cacher('item', depends=[idx], cache_dir=cache_dir,
+                         verbose=0) for idx in range(5)]
+    for idx, cacher in enumerate(cachers):
+        cacher.save(idx)
+    assert cache_dir.evict() == []
+    cache_dir.max_entries = 3
+    # The kept entry is skipped, and the next oldest are evicted instead
+    evicted = cache_dir.evict(keep=[cachers[0].get_fpath()])
+    assert evicted == [cachers[1].get_fpath(), cachers[2].get_fpath()]
+    assert len(cache_dir) == 3
+
+    nbytes = [e['nbytes'] for e in cache_dir.entries()]
+    cache_dir.max_entries = None
+    cache_dir.max_bytes = sum(nbytes) - 1
+    evicted = cache_dir.evict()
+    assert evicted == [cachers[0].get_fpath()]
+    assert len(cache_dir) == 2
+
+
+def test_cacher_async_decorator():
+    import asyncio
+    calls = []
+
+    @ub.Cacher('test_async_decorator', depends='a', verbose=0)
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'async result'
+
+    compute.cacher.clear()
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(compute()) == 'async result'
+        assert loop.run_until_complete(compute()) == 'async result'
+    finally:
+        loop.close()
+    assert len(calls) == 1
+    assert compute.cacher.load() == 'async result'
+    compute.cacher.clear()
+
+
 if __name__ == '__main__':
     r"""
     CommandLine:
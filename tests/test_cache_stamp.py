@@ -126,3 +126,77 @@ def test_cache_stamp_noproduct():
     assert not self.expired()
     ub.writeto(product, 'corrupted')
     assert not self.expired()
+
+
+def test_cache_stamp_hash_cache():
+    dpath = ub.Path.appdir('ubelt', 'test-cache-stamp-hash-cache')
+    dpath.delete().ensuredir()
+    products = [dpath / 'product{}.txt'.format(i) for i in range(3)]
+    hash_cache = ub.util_hash.FileHashCache(dpath / 'hash_cache.sqlite')
+    self = ub.CacheStamp('hash_cache', dpath=dpath, product=products,
+                         hasher='sha1', hash_cache=hash_cache)
+    assert self.expired()
+    for fpath in products:
+        fpath.write_text(fpath.name)
+    self.renew()
+    assert len(hash_cache) == 3
+    assert not self.expired()
+
+    # The cached hashes are the same as the real ones
+    self.hash_cache = False
+    assert not self.expired()
+    self.hash_cache = hash_cache
+
+    # Changing a product invalidates its cache entry
+    products[1].write_text('changed')
+    assert self.expired()
+
+
+def test_cache_stamp_verify_stat(monkeypatch):
+    import os
+    dpath = ub.Path.appdir('ubelt', 'test-cache-stamp-verify-stat')
+    dpath.delete().ensuredir()
+    products = [dpath / 'product{}.txt'.format(i) for i in range(4)]
+    for fpath in products:
+        fpath.write_text(fpath.name)
+    self = ub.CacheStamp('verify_stat', dpath=dpath, product=products,
+                         hasher='sha1', verify='stat', hash_workers=2)
+    self.renew()
+
+    num_hashed = []
+    orig_hash_file = ub.util_hash.hash_file
+
+    def counted_hash_file(*args, **kwargs):
+        num_hashed.append(1)
+        return orig_hash_file(*args, **kwargs)
+    monkeypatch.setattr(ub.util_hash, 'hash_file', counted_hash_file)
+
+    # Unchanged stats mean the products are not read
+    assert not self.expired()
+    assert len(num_hashed) == 0
+
+    # Sampled verification hashes the products anyway
+    self.verify_rate = 1.0
+    assert not self.expired()
+    assert len(num_hashed) == 4
+    self.verify_rate = 0.0
+
+    # Replacing a file with one that has the same size and mtime changes its
+    # inode, which forces a hash check that detects the change
+    fpath = products[0]
+    stat = fpath.stat()
+    tmp_fpath = dpath / 'replacement.txt'
+    tmp_fpath.write_text('Product0.txt')
+    os.utime(tmp_fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(tmp_fpath, fpath)
+    assert fpath.stat().st_ino != stat.st_ino
+    assert self.expired() == 'hash_diff'
+
+    # Renewing with parallel hashing agrees with the serial hash
+    cert = self.renew()
+    self.hash_workers = 0
+    assert self._product_file_hash() == cert['hash']
+
+    import pytest
+    with pytest.raises(KeyError):
+        ub.CacheStamp('verify_stat', dpath=dpath, verify='bad')
@@ -232,6 +232,307 @@ def test_env():
         assert info['out'].strip() == env['UBELT_TEST_ENV']
 
 
+def test_cmd_timeout_kills_process_group():
+    """
+    The timeout should kill children spawned by the command, otherwise they
+    keep the output pipes open and reading never finishes.
+    """
+    import subprocess
+    import time
+    if sys.platform.startswith('win32'):
+        pytest.skip('requires a posix shell')
+    for tee_backend in ['thread', 'select']:
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as ex:
+            ub.cmd('echo start; sleep 100 & wait', shell=True, tee=True,
+                   tee_backend=tee_backend, timeout=0.5)
+        assert time.monotonic() - start < 10
+        assert ex.value.output == 'start\n'
+
+
+def test_cmd_timeout_no_tee():
+    import subprocess
+    if sys.platform.startswith('win32'):
+        pytest.skip('requires a posix shell')
+    with pytest.raises(subprocess.TimeoutExpired):
+        ub.cmd('sleep 100 & wait', shell=True, timeout=0.5)
+
+
+def test_cmd_max_capture_stderr():
+    py_script = ub.codeblock(
+        r'''
+        import sys
+        for i in range(100):
+            print('O{}'.format(i))
+            print('E{}'.format(i), file=sys.stderr)
+        ''')
+    info = ub.cmd([sys.executable, '-c', py_script], max_capture=20,
+                  overflow='spill')
+    assert info['ret'] == 0
+    assert len(info['out']) <= 20
+    assert info['out'].endswith('O99\n')
+    assert info['err'].endswith('E99\n')
+    for key in ['out_fpath', 'err_fpath']:
+        fpath = ub.Path(info[key])
+        text = fpath.read_text()
+        fpath.delete()
+        assert len(text.splitlines()) == 100
+
+    # Nothing spills if the limit is not reached
+    info = ub.cmd([sys.executable, '-c', py_script], max_capture=10000,
+                  overflow='spill')
+    assert info['out_fpath'] is None
+    assert info['out'].count('\n') == 100
+
+    with pytest.raises(ValueError):
+        ub.cmd('echo hi', max_capture=10, overflow='bad')
+
+
+def test_cmd_iter_streams():
+    py_script = ub.codeblock(
+        r'''
+        import sys
+        print('O1', flush=True)
+        print('E1', file=sys.stderr, flush=True)
+        ''')
+    items = list(ub.cmd_iter([sys.executable, '-c', py_script]))
+    assert sorted(items) == [('err', 'E1\n'), ('out', 'O1\n')]
+
+
+def test_cmd_iter_timeout():
+    import subprocess
+    py_script = ub.codeblock(
+        r'''
+        import time
+        print('O1', flush=True)
+        time.sleep(100)
+        ''')
+    items = []
+    with pytest.raises(subprocess.TimeoutExpired):
+        for item in ub.cmd_iter([sys.executable, '-c', py_script],
+                                timeout=0.5):
+            items.append(item)
+    assert items == [('out', 'O1\n')]
+
+
+def test_cmd_many_concurrent():
+    import time
+    py_script = 'import time; time.sleep(0.5)'
+    commands = [[sys.executable, '-c', py_script]] * 4
+    start = time.monotonic()
+    infos = ub.cmd_many(commands, max_workers=4)
+    duration = time.monotonic() - start
+    assert all(info['ret'] == 0 for info in infos)
+    # Running serially would take at least 2 seconds
+    assert duration < 1.9
+
+
+def test_cmd_many_no_interleave(capsys):
+    py_script = ub.codeblock(
+        r'''
+        import sys, time
+        for i in range(3):
+            print(sys.argv[1], i, flush=True)
+            time.sleep(0.01)
+        ''')
+    commands = [[sys.executable, '-c', py_script, name] for name in 'abcd']
+    infos = ub.cmd_many(commands, max_workers=4, verbose=1)
+    assert [info['out'] for info in infos] == [
+        '{} 0\n{} 1\n{} 2\n'.format(name, name, name) for name in 'abcd']
+    lines = capsys.readouterr().out.splitlines()
+    # The lines of each command are contiguous
+    blocks = [lines[i:i + 3] for i in range(0, len(lines), 3)]
+    for block in blocks:
+        assert len({line.split(' ')[0] for line in block}) == 1
+
+
+def test_cmd_many_fail_fast():
+    import subprocess
+    if sys.platform.startswith('win32'):
+        pytest.skip('requires a posix shell')
+    commands = ['exit 2'] + ['echo {}'.format(i) for i in range(20)]
+    with pytest.raises(subprocess.CalledProcessError) as ex:
+        ub.cmd_many(commands, max_workers=0, shell=True, check=True,
+                    fail_fast=True)
+    assert ex.value.returncode == 2
+
+    # Exceptions raised by cmd are errors too
+    with pytest.raises(subprocess.TimeoutExpired):
+        ub.cmd_many(['sleep 10', 'echo hi'], max_workers=2, shell=True,
+                    timeout=0.5, fail_fast=True)
+
+
+def test_cmd_many_collect_all():
+    import subprocess
+    if sys.platform.startswith('win32'):
+        pytest.skip('requires a posix shell')
+    commands = ['exit 2', 'echo hi', 'sleep 10']
+    infos = ub.cmd_many(commands, max_workers=3, shell=True, check=True,
+                        timeout=0.5, desc='running', progkw={'verbose': 0})
+    assert isinstance(infos[0]['error'], subprocess.CalledProcessError)
+    assert infos[1]['error'] is None
+    assert infos[1]['out'].strip() == 'hi'
+    assert isinstance(infos[2]['error'], subprocess.TimeoutExpired)
+    assert infos[2]['ret'] is None
+
+    cmdq = ub.CmdQueue()
+    with pytest.raises(ValueError):
+        cmdq.submit('echo hi', tee=True)
+
+
+def _run_async(coro):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_acmd_tee_and_capture(capsys):
+    py_script = ub.codeblock(
+        r'''
+        import sys
+        for i in range(100):
+            print('O{}'.format(i))
+            print('E{}'.format(i), file=sys.stderr)
+        ''')
+    command = [sys.executable, '-c', py_script]
+    info = _run_async(ub.acmd(command, tee=True))
+    captured = capsys.readouterr()
+    assert info['ret'] == 0
+    assert info['out'] == ''.join('O{}\n'.format(i) for i in range(100))
+    assert info['err'] == ''.join('E{}\n'.format(i) for i in range(100))
+    assert captured.out == info['out']
+    assert captured.err == info['err']
+
+    info = _run_async(ub.acmd(command, max_capture=20))
+    assert len(info['out']) <= 20
+    assert info['out'].endswith('O99\n')
+
+
+def test_acmd_many_concurrent():
+    import asyncio
+    import time
+    py_script = 'import time; time.sleep(0.5); print("done")'
+    command = [sys.executable, '-c', py_script]
+
+    async def main():
+        return await asyncio.gather(*[ub.acmd(command) for _ in range(32)])
+    start = time.monotonic()
+    infos = _run_async(main())
+    assert time.monotonic() - start < 8
+    assert all(info['out'] == 'done\n' for info in infos)
+
+
+def test_acmd_check_and_shell():
+    import subprocess
+    info = _run_async(ub.acmd('echo hi && exit 3', shell=True))
+    assert info['ret'] == 3
+    assert info['out'].strip() == 'hi'
+    with pytest.raises(subprocess.CalledProcessError):
+        _run_async(ub.acmd('exit 3', shell=True, check=True))
+
+
+def test_acmd_timeout_kills_process_group():
+    import subprocess
+    import time
+    if sys.platform.startswith('win32'):
+        pytest.skip('requires a posix shell')
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as ex:
+        _run_async(ub.acmd('echo start; sleep 100 & wait', shell=True,
+                           timeout=0.5))
+    assert time.monotonic() - start < 10
+    assert ex.value.output == 'start\n'
+
+
+def test_cmd_bytes_mode(capfdbinary):
+    code = 'import sys; sys.stdout.buffer.write(bytes(range(256)) * 1000)'
+    command = [sys.executable, '-c', code]
+    expected = bytes(range(256)) * 1000
+    info = ub.cmd(command, text=False)
+    assert info['out'] == expected
+    assert info['err'] == b''
+
+    for tee_backend in ['thread', 'select']:
+        if tee_backend == 'select' and sys.platform.startswith('win32'):
+            continue
+        info = ub.cmd(command, text=False, tee=True, tee_backend=tee_backend)
+        assert info['out'] == expected
+        assert capfdbinary.readouterr().out == expected
+
+    info = ub.cmd(command, text=False, max_capture=300)
+    assert info['out'] == expected[-300:]
+
+
+def test_cmd_text_multibyte_chunks():
+    import os
+    # Multibyte characters and newlines split across chunk boundaries must
+    # be decoded like universal_newlines
+    code = ub.codeblock(
+        r'''
+        import sys
+        sys.stdout.buffer.write(('\u00e9\u4e2d\r\n' * 50000).encode('utf8'))
+        ''')
+    info = ub.cmd([sys.executable, '-c', code], env=dict(
+        os.environ, PYTHONIOENCODING='utf8'), max_capture=10 ** 7)
+    expected = ub.cmd([sys.executable, '-c', code])['out']
+    assert info['out'] == expected
+    assert info['out'] == '\u00e9\u4e2d\n' * 50000
+
+
+def test_cmd_redirect():
+    import os
+    import subprocess
+    dpath = ub.Path.appdir('ubelt/tests/cmd/redirect').delete().ensuredir()
+    code = ub.codeblock(
+        r'''
+        import sys
+        print('out')
+        print('err', file=sys.stderr)
+        ''')
+    command = [sys.executable, '-c', code]
+
+    fpath = dpath / 'out.txt'
+    info = ub.cmd(command, stdout=fpath, tee=True)
+    assert info['out'] is None
+    assert info['err'] == 'err\n'
+    assert fpath.read_text() == 'out\n'
+
+    with open(dpath / 'both.txt', 'w') as file:
+        info = ub.cmd(command, stdout=file, stderr=subprocess.STDOUT)
+    assert info['out'] is None and info['err'] is None
+    assert sorted((dpath / 'both.txt').read_text().split()) == ['err', 'out']
+
+    info = ub.cmd(command, stderr=subprocess.DEVNULL, max_capture=100)
+    assert info['out'] == 'out\n'
+    assert info['err'] is None
+
+    info = _run_async(ub.acmd(command, stdout=dpath / 'aout.txt',
+                              text=False))
+    assert info['out'] is None
+    assert info['err'] == b'err' + os.linesep.encode()
+    assert (dpath / 'aout.txt').read_text() == 'out\n'
+
+
+def test_cmd_max_capture_zero():
+    # A limit of zero captures nothing, but spilling still keeps everything
+    info = ub.cmd('echo hello', max_capture=0)
+    assert info['out'] == ''
+    assert info['ret'] == 0
+
+    info = ub.cmd('echo hello', max_capture=0, overflow='spill')
+    assert info['out'] == ''
+    fpath = ub.Path(info['out_fpath'])
+    assert fpath.read_text().strip() == 'hello'
+    fpath.delete()
+
+    info = _run_async(ub.acmd('echo hi', max_capture=0))
+    assert info['out'] == ''
+    assert info['ret'] == 0
+
+
 if __name__ == '__main__':
     """
         pytest ubelt/tests/test_cmd.py -s
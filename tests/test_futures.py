@@ -63,3 +63,187 @@ def test_executor_timeout():
                     print('job_result = {!r}'.format(job_result))
             print('timer.elapsed = {!r}'.format(timer.elapsed))
             print('ex_ = {!r}'.format(ex_))
+
+
+def test_job_pool_max_inflight():
+    import ubelt as ub
+    import threading
+    import time
+    lock = threading.Lock()
+    state = {'running': 0, 'max_running': 0}
+
+    def worker(data):
+        with lock:
+            state['running'] += 1
+            state['max_running'] = max(state['max_running'], state['running'])
+        time.sleep(0.002)
+        with lock:
+            state['running'] -= 1
+        return data
+
+    pool = ub.JobPool('thread', max_workers=8, max_inflight=3)
+    with pool:
+        for data in range(50):
+            pool.submit(worker, data)
+            assert sum(not job.done() for job in pool.jobs) <= 3
+        results = sorted(pool.join())
+    assert results == list(range(50))
+    assert state['max_running'] <= 3
+
+
+def test_job_pool_transient_releases_jobs():
+    import ubelt as ub
+    import gc
+    import weakref
+
+    class Result(object):
+        pass
+
+    for mode in ['serial', 'thread']:
+        pool = ub.JobPool(mode, max_workers=4, transient=True)
+        for _ in range(20):
+            pool.submit(Result)
+        refs = []
+        for job in pool.as_completed():
+            refs.append(weakref.ref(job.result()))
+        del job
+        assert len(pool) == 0
+        gc.collect()
+        assert all(ref() is None for ref in refs)
+        # New jobs can still be submitted and collected
+        pool.submit(Result)
+        assert len(list(pool.as_completed(desc='collect',
+                                          progkw={'verbose': 0}))) == 1
+        pool.shutdown()
+
+
+def test_job_pool_as_completed_timeout():
+    """
+    The timeout applies to the whole iteration, with or without transient
+    """
+    import ubelt as ub
+    import time
+    import pytest
+    import threading
+    from concurrent.futures import TimeoutError
+    for transient in [False, True]:
+        event = threading.Event()
+        pool = ub.JobPool('thread', max_workers=2, transient=transient)
+        pool.submit(time.sleep, 0)
+        pool.submit(event.wait)
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            for _ in pool.as_completed(timeout=0.2):
+                pass
+        assert time.monotonic() - start < 5
+        event.set()
+        pool.shutdown()
+
+
+def test_job_pool_imap_is_lazy():
+    import ubelt as ub
+    state = {'consumed': 0}
+
+    def inputs():
+        for idx in range(1000):
+            state['consumed'] += 1
+            yield idx
+
+    for mode in ['serial', 'thread', 'process']:
+        state['consumed'] = 0
+        pool = ub.JobPool(mode, max_workers=2, max_inflight=5)
+        results = pool.imap(abs, inputs())
+        assert next(results) == 0
+        assert state['consumed'] <= 6
+        assert list(results) == list(range(1, 1000))
+
+        unordered = pool.imap_unordered(abs, inputs())
+        assert sorted(unordered) == list(range(1000))
+        pool.shutdown()
+
+
+def _fail_on_three(x):
+    if x == 3:
+        raise ValueError('three')
+    return x * 2
+
+
+def test_job_pool_batching():
+    import pytest
+    import ubelt as ub
+    for mode in ['thread', 'process']:
+        for batchsize in [4, 'auto']:
+            pool = ub.JobPool(mode, max_workers=2, batchsize=batchsize)
+            with pool:
+                jobs = [pool.submit(_fail_on_three, x) for x in range(50)]
+                # Requesting a result sends the partial batch
+                assert jobs[-1].result() == 98
+                results = [job.result() for job in jobs if job is not jobs[3]]
+                with pytest.raises(ValueError):
+                    jobs[3].result()
+            assert results == [x * 2 for x in range(50) if x != 3]
+
+            pool = ub.JobPool(mode, max_workers=2, batchsize=batchsize,
+                              max_inflight=5, transient=True)
+            for x in range(20):
+                pool.submit(abs, -x)
+            results = sorted(job.result() for job in pool.as_completed())
+            assert results == list(range(20))
+            assert sorted(pool.imap_unordered(abs, range(100))) == list(range(100))
+            assert list(pool.imap(abs, range(100))) == list(range(100))
+            pool.shutdown()
+
+
+def test_job_pool_batching_cancel_buffered():
+    import ubelt as ub
+    pool = ub.JobPool('thread', max_workers=2, batchsize=100)
+    # Keep the partial batch buffered until it is collected
+    pool._batcher.linger = 60
+    jobs = [pool.submit(abs, -x) for x in range(10)]
+    assert jobs[5].cancel()
+    finished = list(pool.as_completed())
+    assert len(finished) == 10
+    assert jobs[5].cancelled()
+    assert jobs[6].result() == 6
+    pool.shutdown()
+
+
+def test_job_pool_batching_wait_partial_batch():
+    """
+    A partial batch is sent after it lingers, so waiting on its futures
+    without requesting their results does not hang.
+    """
+    import concurrent.futures
+    import time
+    import ubelt as ub
+    for mode in ['thread', 'process']:
+        with ub.JobPool(mode, max_workers=2, batchsize=100) as pool:
+            jobs = [pool.submit(abs, -x) for x in range(10)]
+            done, not_done = concurrent.futures.wait(jobs, timeout=30)
+            assert len(done) == 10 and not not_done
+            job = pool.submit(abs, -10)
+            deadline = time.monotonic() + 30
+            while not job.done():
+                assert time.monotonic() < deadline
+                time.sleep(0.001)
+            assert job.result() == 10
+        # Exiting the pool stops the thread that sends lingering batches
+        pool._batcher._flusher.join(timeout=5)
+        assert not pool._batcher._flusher.is_alive()
+
+
+def test_task_batcher_adapts():
+    import time
+    from ubelt.util_futures import _TaskBatcher, Executor
+    with Executor('thread', max_workers=2) as executor:
+        batcher = _TaskBatcher(executor, 'auto', target_time=0.02)
+        jobs = [batcher.submit(abs, x) for x in range(10000)]
+        [job.result() for job in jobs]
+        # Tiny tasks should be grouped into large batches
+        assert batcher.batchsize > 32
+
+        batcher = _TaskBatcher(executor, 'auto', target_time=0.02)
+        jobs = [batcher.submit(time.sleep, 0.01) for x in range(20)]
+        [job.result() for job in jobs]
+        # Slow tasks should run alone or in pairs
+        assert batcher.batchsize <= 2
@@ -235,6 +235,46 @@ def _sanity_check(data):
     assert traced_bytes2 == traced_bytes1
 
 
+def test_streaming_matches_conversion():
+    """
+    Nested data is streamed into the hasher, but it must produce the same
+    bytes as the non-streaming conversion.
+    """
+    from ubelt.util_hash import _convert_to_hashable, _HashTracer
+    from ubelt.util_hash import _update_hasher
+    from collections import OrderedDict
+    datas = [
+        {'a': {'b': [1, 2, {'c': (3, 4.5)}]}, 'd': {1, 2}},
+        OrderedDict([(1, {2: [3, slice(1, 2)]})]),
+        {'2', 3, 1},
+        slice(None, 3),
+    ]
+    if np is not None:
+        arr = np.arange(7 * 5 * 3, dtype=np.float32).reshape(7, 5, 3)
+        datas += [
+            arr, arr[:, ::2, 1:], arr.T, np.asfortranarray(arr),
+            np.array(3.0), np.zeros((0, 3)),
+            {'x': arr[::-1], 'rng': np.random.RandomState(0)},
+        ]
+    for data in datas:
+        for types in [True, False]:
+            prefix, hashable = _convert_to_hashable(data, types=types)
+            tracer = _HashTracer()
+            _update_hasher(tracer, data, types=types)
+            assert b''.join(tracer.sequence) == prefix + hashable
+
+
+def test_streaming_numpy_chunks(monkeypatch):
+    if np is None:
+        pytest.skip('requires numpy')
+    # Force non-contiguous arrays to be streamed in many small chunks
+    monkeypatch.setattr(ub.util_hash, '_NUMPY_STREAM_CHUNKSIZE', 16)
+    arr = np.arange(10 * 6 * 4, dtype=np.int64).reshape(10, 6, 4)[:, ::2, :]
+    assert not arr.flags['C_CONTIGUOUS']
+    want = ub.hash_data(np.ascontiguousarray(arr))
+    assert ub.hash_data(arr) == want
+
+
 def test_numpy_object_array():
     """
     _HASHABLE_EXTENSIONS = ub.util_hash._HASHABLE_EXTENSIONS
@@ -354,6 +394,89 @@ def test_hash_data_custom_base():
     assert hashid_2.startswith('110101111100100111001110101010010')
 
 
+def test_extension_dispatch_cache_invalidation():
+    """
+    The per-type dispatch cache must be invalidated when new types or
+    abstract base classes are registered.
+    """
+    import abc
+    from ubelt.util_hash import HashableExtensions
+    extensions = HashableExtensions()
+    extensions._register_builtin_class_extensions()
+
+    class Custom(object):
+        pass
+
+    class CustomBase(abc.ABC):
+        pass
+
+    data = Custom()
+    try:
+        extensions.lookup(data)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('should not have a hash function yet')
+
+    @extensions.register(CustomBase)
+    def _hash_custom_base(data):
+        return b'CUSTOM', b'base'
+
+    # Still not registered because Custom is not a subclass yet
+    try:
+        extensions.lookup(data)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('should not have a hash function yet')
+
+    CustomBase.register(Custom)
+    assert extensions.lookup(data) is _hash_custom_base
+
+    @extensions.register(Custom)
+    def _hash_custom(data):
+        return b'CUSTOM', b'exact'
+    assert extensions.lookup(data) is _hash_custom
+
+
+def test_hash_data_many():
+    import hashlib
+    from collections import OrderedDict
+    groups = [
+        ['a', 'bc', ''],
+        [b'a', b'bc'],
+        [1, -2, 2 ** 70],
+        [True, False],
+        [1.5, float('nan'), -0.0],
+        [None, None],
+        [(1, 'a'), [2, [3]], {'b': {4, 5}}, OrderedDict([(1, 2)]), 'x', 3],
+        [],
+    ]
+    if np is not None:
+        arr = np.arange(24, dtype=np.float32).reshape(4, 3, 2)
+        groups += [
+            arr, arr[:, ::2], np.arange(5), np.array(['a', 'bc']),
+            [np.uint8(3), np.float64(2.0)],
+        ]
+    for items in groups:
+        for types in [True, False]:
+            for base in ['hex', 'abc']:
+                want = [ub.hash_data(item, types=types, base=base,
+                                     hasher='sha1') for item in items]
+                got = ub.hash_data_many(items, types=types, base=base,
+                                        hasher='sha1')
+                assert got == want
+
+    # Generators are accepted
+    got = ub.hash_data_many(str(i) for i in range(3))
+    assert got == [ub.hash_data(str(i)) for i in range(3)]
+
+    # Hasher instances are copied for each item
+    got = ub.hash_data_many(['a', 'b'], hasher=hashlib.sha1())
+    assert got == [ub.hash_data('a', hasher='sha1'),
+                   ub.hash_data('b', hasher='sha1')]
+
+
 def test_hash_file():
     fpath = join(ub.ensure_app_cache_dir('ubelt'), 'tmp.txt')
     ub.writeto(fpath, 'foobar')
@@ -371,6 +494,114 @@ def test_hash_file():
     assert hashid3_c == hashid2_b
 
 
+def test_hash_file_backends():
+    import hashlib
+    dpath = ub.Path.appdir('ubelt/tests/test-hash').ensuredir()
+    fpath = dpath / 'tmp_backends.txt'
+    data = bytes(range(256)) * 7
+    fpath.write_bytes(data)
+    for blocksize in [1, 3, 64, 1000, 10000]:
+        for stride in [1, 2, 3]:
+            for maxbytes in [None, 0, 1, 100, 1791, 5000]:
+                # Compute the expected result by hand
+                parts = [data[i:i + blocksize]
+                         for i in range(0, len(data), blocksize * stride)]
+                want = b''.join(parts)
+                if maxbytes is not None:
+                    want = want[:maxbytes]
+                want = hashlib.sha1(want).hexdigest()
+                for backend in ['auto', 'readinto', 'mmap']:
+                    got = ub.hash_file(fpath, hasher='sha1', backend=backend,
+                                       blocksize=blocksize, stride=stride,
+                                       maxbytes=maxbytes)
+                    assert got == want, (blocksize, stride, maxbytes, backend)
+    with pytest.raises(KeyError):
+        ub.hash_file(fpath, backend='not-a-backend')
+
+
+def test_hash_file_tree():
+    import hashlib
+    dpath = ub.Path.appdir('ubelt/tests/test-hash-tree').ensuredir()
+    fpath = dpath / 'tree_data.bin'
+    data = bytes(range(256)) * 41
+    fpath.write_bytes(data)
+    chunksize = 1000
+
+    # Check the digest scheme against a direct implementation
+    chunks = [data[i:i + chunksize] for i in range(0, len(data), chunksize)]
+    level = [hashlib.sha256(b'\x00' + c).digest() for c in chunks]
+    while len(level) > 1:
+        nxt = [hashlib.sha256(b'\x01' + a + b).digest()
+               for a, b in zip(level[0::2], level[1::2])]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    want = level[0].hex()
+
+    for max_workers in [0, 3]:
+        got = ub.hash_file(fpath, hasher='sha256', tree=True,
+                           chunksize=chunksize, max_workers=max_workers,
+                           blocksize=64)
+        assert got == want
+    leaves = ub.hash_file_chunks(fpath, chunksize=chunksize, hasher='sha256',
+                                 mode='process', max_workers=2)
+    assert leaves == [hashlib.sha256(b'\x00' + c).hexdigest()
+                      for c in chunks]
+
+    # Empty files have a single empty leaf
+    empty_fpath = ub.touch(dpath / 'tree_empty.bin')
+    assert ub.hash_file(empty_fpath, hasher='sha256', tree=True) == (
+        hashlib.sha256(b'\x00').hexdigest())
+
+    # maxbytes is respected
+    got = ub.hash_file(fpath, hasher='sha256', tree=True, chunksize=chunksize,
+                       maxbytes=1500)
+    h0 = hashlib.sha256(b'\x00' + data[:1000]).digest()
+    h1 = hashlib.sha256(b'\x00' + data[1000:1500]).digest()
+    assert got == hashlib.sha256(b'\x01' + h0 + h1).hexdigest()
+
+    # The cache distinguishes tree and flat hashes
+    cache = ub.util_hash.FileHashCache(dpath / 'tree_cache.sqlite')
+    cache.clear()
+    flat = ub.hash_file(fpath, hasher='sha256', cache=cache)
+    tree = ub.hash_file(fpath, hasher='sha256', cache=cache, tree=True,
+                        chunksize=chunksize)
+    assert flat == hashlib.sha256(data).hexdigest()
+    assert tree == want
+    assert len(cache) == 2
+
+    with pytest.raises(ValueError):
+        ub.hash_file(fpath, tree=True, stride=2)
+    with pytest.raises(IndexError):
+        ub.hash_file_chunks(fpath, chunksize=chunksize, indices=[100])
+
+
+def test_hash_files():
+    dpath = ub.Path.appdir('ubelt/tests/test-hash-files').ensuredir()
+    fpaths = []
+    for idx in range(20):
+        fpath = dpath / 'file_{:03d}.txt'.format(idx)
+        fpath.write_text('foobar' * idx)
+        fpaths.append(fpath)
+    want = [ub.hash_file(fpath, hasher='sha1', blocksize=3) for fpath in fpaths]
+
+    for mode in ['serial', 'thread']:
+        results = list(ub.hash_files(fpaths, hasher='sha1', blocksize=3,
+                                     mode=mode, max_workers=4))
+        assert [p for p, _ in results] == fpaths
+        assert [h for _, h in results] == want
+
+    unordered = dict(ub.hash_files(fpaths, hasher='sha1', blocksize=3,
+                                   max_workers=4, ordered=False))
+    assert unordered == dict(zip(fpaths, want))
+
+    # A hasher instance is copied for each file
+    import hashlib
+    results = list(ub.hash_files(fpaths, hasher=hashlib.sha1(), max_workers=4))
+    assert [h for _, h in results] == [
+        ub.hash_file(fpath, hasher='sha1') for fpath in fpaths]
+
+
 def test_convert_base_hex():
     # Test that hex values are unchanged
     for i in it.chain(range(-10, 10), range(-1000, 1000, 7)):
@@ -0,0 +1,320 @@
+import ubelt as ub
+import pytest
+
+
+def test_memoize_single_flight():
+    import threading
+    import time
+    calls = []
+    barrier = threading.Barrier(8)
+
+    @ub.memoize(lock=True)
+    def slow(x):
+        calls.append(x)
+        time.sleep(0.05)
+        return x * 2
+
+    def worker(x):
+        barrier.wait()
+        return slow(x)
+
+    with ub.JobPool('thread', max_workers=8) as pool:
+        jobs = [pool.submit(worker, idx % 2) for idx in range(8)]
+        results = [job.result() for job in jobs]
+    assert results == [0, 2] * 4
+    assert sorted(calls) == [0, 1]
+    info = slow.cache_info()
+    assert info.misses == 2
+    assert info.hits == 6
+
+
+def test_memoize_single_flight_exception():
+    import threading
+    import time
+    barrier = threading.Barrier(4)
+    calls = []
+
+    @ub.memoize(lock=True)
+    def fails(x):
+        calls.append(x)
+        # Fail only once the other callers are waiting on this call, so all
+        # of them belong to the same wave.
+        deadline = time.monotonic() + 10
+        while fails.cache_info().hits < 3 * len(calls):
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        raise ValueError(x)
+
+    def worker():
+        barrier.wait()
+        return fails(1)
+
+    for wave in range(1, 3):
+        with ub.JobPool('thread', max_workers=4) as pool:
+            jobs = [pool.submit(worker) for _ in range(4)]
+            for job in jobs:
+                with pytest.raises(ValueError):
+                    job.result()
+        # The waiting callers share the failure of the single call, and the
+        # failure is not cached, so the next wave calls again.
+        assert len(calls) == wave
+        assert fails.cache_info().hits == 3 * wave
+
+
+def test_memoize_single_flight_recursion():
+    @ub.memoize(lock=True)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+    assert fib(30) == 832040
+
+
+def test_memoize_method_threads():
+    """
+    Accessing a memoized method on different instances in different threads
+    must not mix up the instances.
+    """
+    class Adder(object):
+        def __init__(self, n):
+            self.n = n
+
+        @ub.memoize_method
+        def add(self, x):
+            return self.n + x
+
+    objs = [Adder(n) for n in range(50)]
+
+    def worker(obj):
+        method = obj.add
+        return [method(x) for x in range(20)]
+
+    with ub.JobPool('thread', max_workers=8) as pool:
+        jobs = [pool.submit(worker, obj) for obj in objs]
+        results = [job.result() for job in jobs]
+    for obj, result in zip(objs, results):
+        assert result == [obj.n + x for x in range(20)]
+        assert obj.add.cache_info().currsize == 20
+
+
+def test_memoize_threads_without_lock():
+    """
+    Concurrent misses without a lock only cause redundant computation
+    """
+    import sys
+    import threading
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for kw in [{}, {'maxsize': 50}, {'ttl': 1e-4}]:
+            @ub.memoize(**kw)
+            def square(x):
+                return x * x
+
+            errors = []
+            barrier = threading.Barrier(8)
+
+            def worker(seed):
+                barrier.wait()
+                try:
+                    for idx in range(2000):
+                        x = (idx * (seed + 1)) % 97
+                        assert square(x) == x * x
+                except Exception as ex:
+                    errors.append(ex)
+
+            threads = [threading.Thread(target=worker, args=(seed,))
+                       for seed in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == []
+            info = square.cache_info()
+            if 'maxsize' in kw:
+                assert info.currsize <= 50
+    finally:
+        sys.setswitchinterval(old_interval)
+
+
+def test_memoize_ttl():
+    import time
+    calls = []
+
+    @ub.memoize(ttl=0.05)
+    def func(x):
+        calls.append(x)
+        return x
+
+    func(1)
+    func(1)
+    assert calls == [1]
+    time.sleep(0.1)
+    func(1)
+    assert calls == [1, 1]
+    assert func.cache_info().evictions == 1
+
+
+def test_memoize_fast_key():
+    calls = []
+
+    @ub.memoize(key='fast')
+    def func(items, opts=None):
+        calls.append(1)
+        return len(items)
+
+    assert func([1, 2], opts={'a': [1]}) == 2
+    assert func([1, 2], opts={'a': [1]}) == 2
+    assert len(calls) == 1
+    assert func([1, 3], opts={'a': [1]}) == 2
+    assert func([1, 2], opts={'a': [2]}) == 2
+    assert len(calls) == 3
+    big = [[idx] for idx in range(1000)]
+    func(big)
+    func([[idx] for idx in range(1000)])
+    assert len(calls) == 4
+
+
+def test_memoize_fast_key_arrays():
+    np = pytest.importorskip('numpy')
+
+    class Model(object):
+        @ub.memoize_method(key='fast')
+        def total(self, arr):
+            return arr.sum()
+
+    model = Model()
+    arr1 = np.ones(10)
+    arr2 = np.ones(10)
+    assert model.total(arr1) == 10
+    # Arrays are keyed by identity, so inplace changes are not seen
+    arr1[:] = 2
+    assert model.total(arr1) == 10
+    assert model.total(arr2) == 10
+    assert model.total.cache_info().misses == 2
+
+
+def test_memoize_custom_key():
+    @ub.memoize(key=lambda a, b=0: a)
+    def func(a, b=0):
+        return a + b
+
+    assert func(1, b=1) == 2
+    assert func(1, b=5) == 2
+    with pytest.raises(KeyError):
+        ub.memoize(func, key='unknown')
+
+
+def _run_async(coro):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_memoize_async_exception_and_cancel():
+    import asyncio
+    calls = []
+
+    @ub.memoize
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.02)
+        if x < 0:
+            raise ValueError(x)
+        return x
+
+    async def main():
+        # Failures are shared by concurrent callers, but not cached
+        results = await asyncio.gather(fetch(-1), fetch(-1),
+                                       return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        with pytest.raises(ValueError):
+            await fetch(-1)
+        # Cancelling one caller does not cancel the shared computation
+        first = asyncio.ensure_future(fetch(1))
+        second = asyncio.ensure_future(fetch(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 1
+        assert await fetch(1) == 1
+    _run_async(main())
+    assert calls == [-1, -1, 1]
+    assert asyncio.iscoroutinefunction(fetch)
+
+
+def test_memoize_method_async():
+    import asyncio
+
+    class Client(object):
+        def __init__(self):
+            self.calls = 0
+
+        @ub.memoize_method
+        async def get(self, key):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return key * 2
+
+    client = Client()
+
+    async def main():
+        results = await asyncio.gather(*[client.get(2) for _ in range(4)])
+        results.append(await client.get(2))
+        return results
+    assert _run_async(main()) == [4] * 5
+    assert client.calls == 1
+    assert client.get.cache_info().hits == 4
+
+
+def test_memoize_disk_layers():
+    import asyncio
+    dpath = ub.Path.appdir('ubelt/tests/test-memoize-disk').delete()
+    calls = []
+
+    def compute(data):
+        calls.append(1)
+        return {'total': sum(data['values'])}
+
+    memo = ub.memoize(compute, disk=True, dpath=dpath, maxsize=1,
+                      version='1')
+    assert memo({'values': [1, 2]}) == {'total': 3}
+    assert memo({'values': [1, 2]}) == {'total': 3}
+    assert memo({'values': [3]}) == {'total': 3}
+    # The first result was evicted from memory, but is still on disk
+    assert memo({'values': [1, 2]}) == {'total': 3}
+    assert len(calls) == 2
+    mem_info = memo.cache_info()
+    disk_info = memo.disk_info()
+    assert (mem_info.hits, mem_info.misses) == (1, 3)
+    assert (disk_info.hits, disk_info.misses) == (1, 2)
+    assert disk_info.currsize == 2 and disk_info.nbytes > 0
+
+    # Nested functions and coroutines can also use the disk
+    @ub.memoize(disk=True, dpath=dpath)
+    async def fetch(x):
+        calls.append(x)
+        return x + 1
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(fetch(1)) == 2
+        fetch.cache_clear()
+        assert loop.run_until_complete(fetch(1)) == 2
+    finally:
+        loop.close()
+    assert calls == [1, 1, 1]
+    assert fetch.disk_info().hits == 1
+    fetch.disk_clear()
+    memo.disk_clear()
+    assert memo.disk_info().currsize == 0
+    assert len(list(dpath.glob('*'))) == 0
+
+
+if __name__ == '__main__':
+    """
+    CommandLine:
+        pytest tests/test_memoize.py
+    """
+    import xdoctest
+    xdoctest.doctest_module(__file__)
@@ -176,6 +176,113 @@ def test_progiter_offset_0():
     assert got == want
 
 
+def test_progiter_early_break():
+    """
+    The index must be correct when the consumer stops within a batch
+    """
+    file = StringIO()
+    prog = ProgIter(range(100), total=100, verbose=3, file=file, freq=10,
+                    show_times=False)
+    for idx, _ in enumerate(prog, start=1):
+        if idx == 25:
+            break
+    prog.end()
+    file.seek(0)
+    got = [line.strip() for line in file.readlines()]
+    assert got == ['0/100...', '10/100...', '20/100...', '25/100...']
+
+
+def test_progiter_index_current_in_body():
+    """
+    The index is up to date for every item, not only when a message is due
+    """
+    prog = ProgIter(range(100), total=100, verbose=3, file=StringIO(),
+                    freq=10, initial=5)
+    seen = []
+    for _ in prog:
+        seen.append(prog._iter_idx)
+    assert seen == list(range(6, 106))
+    assert prog._iter_idx == 105
+
+
+def _shared_counter_worker(start, stop, counter):
+    for _ in range(start, stop):
+        counter.step()
+    counter.flush()
+    return stop - start
+
+
+def test_shared_counter_process_pool():
+    import ubelt as ub
+    from ubelt.progiter import SharedCounter
+    file = StringIO()
+    counter = SharedCounter()
+    try:
+        with ub.JobPool('process', max_workers=2) as pool:
+            for start in range(0, 10000, 1000):
+                pool.submit(_shared_counter_worker, start, start + 1000,
+                            counter)
+            prog = ProgIter(total=10000, desc='shared', file=file, verbose=3,
+                            show_times=False)
+            prog.follow(counter, interval=0.01)
+            results = [job.result() for job in pool.jobs]
+    finally:
+        counter.close()
+    assert sum(results) == 10000
+    assert prog._iter_idx == 10000
+    file.seek(0)
+    lines = [line.strip() for line in file.readlines()]
+    assert lines[0] == 'shared     0/10000...'
+    assert lines[-1] == 'shared 10000/10000...'
+
+
+def test_follow_requires_total_or_until():
+    import pytest
+    from ubelt.progiter import SharedCounter
+    counter = SharedCounter()
+    try:
+        prog = ProgIter(desc='unbounded', verbose=0)
+        with pytest.raises(ValueError):
+            prog.follow(counter)
+        assert not prog.started
+        # The total can be inferred from the iterable
+        counter.step(3)
+        counter.flush()
+        prog = ProgIter(range(3), file=StringIO(), verbose=1)
+        prog.follow(counter, interval=0.01)
+        assert prog._iter_idx == 3
+    finally:
+        counter.close()
+
+
+def test_progiter_sink_only(capsys):
+    """
+    A sink without a stream should not write any text
+    """
+    import json
+    file = StringIO()
+    prog = ProgIter(range(100), total=100, sink=file, freq=10, adjust=False)
+    for _ in prog:
+        prog.set_extra('working')
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    records = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert [r['idx'] for r in records] == list(range(0, 101, 10))
+    assert all(r['total'] == 100 for r in records)
+    assert records[-1]['extra'] == 'working'
+    assert records[-1]['elapsed'] >= records[0]['elapsed']
+
+
+def test_progiter_sink_and_stream():
+    records = []
+    stream = StringIO()
+    list(ProgIter(range(4), sink=records.append, stream=stream, freq=2,
+                  adjust=False, verbose=3, show_times=False))
+    lines = [line.strip() for line in stream.getvalue().splitlines()]
+    assert lines == ['0/4...', '2/4...', '4/4...']
+    assert [r['idx'] for r in records] == [0, 2, 4]
+
+
 def time_progiter_overhead():
     # Time the overhead of this function
     import timeit
@@ -90,7 +90,7 @@ from ubelt.util_arg import (argflag, argval,)
 from ubelt.util_cache import (CacheStamp, Cacher,)
 from ubelt.util_colors import (NO_COLOR, color_text, highlight_code,)
 from ubelt.util_const import (NoParam,)
-from ubelt.util_cmd import (cmd,)
+from ubelt.util_cmd import (CmdQueue, acmd, cmd, cmd_iter, cmd_many,)
 from ubelt.util_dict import (AutoDict, AutoOrderedDict, ddict, dict_diff,
                              dict_hist, dict_isect, dict_subset, dict_union,
                              dzip, find_duplicates, group_items, invert_dict,
@@ -107,7 +107,8 @@ from ubelt.util_links import (symlink,)
 from ubelt.util_list import (allsame, argmax, argmin, argsort, argunique,
                              boolmask, chunks, compress, flatten, iter_window,
                              iterable, peek, take, unique, unique_flags,)
-from ubelt.util_hash import (hash_data, hash_file,)
+from ubelt.util_hash import (hash_data, hash_data_many, hash_file,
+                             hash_file_chunks, hash_files,)
 from ubelt.util_import import (import_module_from_name,
                                import_module_from_path, modname_to_modpath,
                                modpath_to_modname, split_modpath,)
@@ -131,20 +132,22 @@ from ubelt.orderedset import (OrderedSet, oset,)
 from ubelt.progiter import (ProgIter,)
 
 __all__ = ['AutoDict', 'AutoOrderedDict', 'CacheStamp', 'Cacher',
-           'CaptureStdout', 'CaptureStream', 'DARWIN', 'DownloadManager',
-           'Executor', 'FormatterExtensions', 'IndexableWalker', 'JobPool',
-           'LINUX', 'NO_COLOR', 'NiceRepr', 'NoParam', 'OrderedSet', 'POSIX',
-           'Path', 'ProgIter', 'TeeStringIO', 'TempDir', 'Timer', 'WIN32',
-           'allsame', 'argflag', 'argmax', 'argmin', 'argsort', 'argunique',
-           'argval', 'augpath', 'boolmask', 'chunks', 'cmd', 'codeblock',
-           'color_text', 'compatible', 'compress', 'ddict', 'delete',
-           'dict_diff', 'dict_hist', 'dict_isect', 'dict_subset', 'dict_union',
-           'download', 'dzip', 'ensure_app_cache_dir', 'ensure_app_config_dir',
+           'CaptureStdout', 'CaptureStream', 'CmdQueue', 'DARWIN',
+           'DownloadManager', 'Executor', 'FormatterExtensions',
+           'IndexableWalker', 'JobPool', 'LINUX', 'NO_COLOR', 'NiceRepr',
+           'NoParam', 'OrderedSet', 'POSIX', 'Path', 'ProgIter', 'TeeStringIO',
+           'TempDir', 'Timer', 'WIN32', 'acmd', 'allsame', 'argflag', 'argmax',
+           'argmin', 'argsort', 'argunique', 'argval', 'augpath', 'boolmask',
+           'chunks', 'cmd', 'cmd_iter', 'cmd_many', 'codeblock', 'color_text',
+           'compatible', 'compress', 'ddict', 'delete', 'dict_diff',
+           'dict_hist', 'dict_isect', 'dict_subset', 'dict_union', 'download',
+           'dzip', 'ensure_app_cache_dir', 'ensure_app_config_dir',
            'ensure_app_data_dir', 'ensure_unicode', 'ensuredir', 'expandpath',
            'find_duplicates', 'find_exe', 'find_path', 'flatten',
            'get_app_cache_dir', 'get_app_config_dir', 'get_app_data_dir',
-           'grabdata', 'group_items', 'hash_data', 'hash_file',
-           'highlight_code', 'hzcat', 'identity', 'import_module_from_name',
+           'grabdata', 'group_items', 'hash_data', 'hash_data_many',
+           'hash_file', 'hash_file_chunks', 'hash_files', 'highlight_code',
+           'hzcat', 'identity', 'import_module_from_name',
            'import_module_from_path', 'indent', 'indexable_allclose',
            'inject_method', 'invert_dict', 'iter_window', 'iterable',
            'map_keys', 'map_vals', 'memoize', 'memoize_method',
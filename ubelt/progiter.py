@@ -95,6 +95,7 @@ TODO:
 import sys
 import time
 import collections
+from itertools import islice
 
 
 __all__ = [
@@ -109,6 +110,120 @@ AT_END = '\n'
 CLEAR_AFTER = ''
 
 
+class SharedCounter(object):
+    """
+    A progress counter that can be stepped from other processes and displayed
+    by a single :func:`ProgIter.follow` in the parent process.
+
+    The counter can be passed as an argument to jobs submitted to a process
+    pool. Steps are accumulated locally in each process (and thread) and only
+    sent to the parent when ``flush_interval`` seconds have passed since the last send (or
+    when :func:`SharedCounter.flush` is called), so stepping is cheap even
+    for millions of items. Workers should call :func:`SharedCounter.flush`
+    when they are done.
+
+    The communication channel is a queue owned by a
+    :class:`multiprocessing.managers.SyncManager` that is started on creation
+    and stopped by :func:`SharedCounter.close`.
+
+    Args:
+        flush_interval (float): minimum number of seconds between sends from
+            each process. Defaults to 0.1.
+
+        manager (multiprocessing.managers.SyncManager | None): an existing
+            started manager to use. If unspecified, a new one is started.
+
+    Example:
+        >>> from ubelt.progiter import SharedCounter
+        >>> counter = SharedCounter(flush_interval=10)
+        >>> counter.step(3)
+        >>> counter.step()
+        >>> assert counter.value == 0
+        >>> counter.flush()
+        >>> assert counter.value == 4
+        >>> counter.close()
+    """
+
+    def __init__(self, flush_interval=0.1, manager=None):
+        if manager is None:
+            import multiprocessing
+            manager = multiprocessing.Manager()
+            self._manager = manager
+        else:
+            self._manager = None
+        self._queue = manager.Queue()
+        self.flush_interval = flush_interval
+        self._init_local()
+
+    def _init_local(self):
+        import threading
+        # Counts that were not sent yet are local to each thread
+        self._local = threading.local()
+        self._value = 0
+
+    def __getstate__(self):
+        # Only the channel is shared, the counts are local to each process
+        return {'_queue': self._queue, 'flush_interval': self.flush_interval}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._manager = None
+        self._init_local()
+
+    def step(self, inc=1):
+        """
+        Counts ``inc`` more items as done
+
+        Args:
+            inc (int): number of items
+        """
+        local = self._local
+        try:
+            local.pending += inc
+        except AttributeError:
+            local.pending = inc
+            local.last_flush = time.monotonic()
+        if time.monotonic() - local.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Sends the count accumulated by the calling thread to the parent
+        process
+        """
+        local = self._local
+        pending = getattr(local, 'pending', 0)
+        if pending:
+            self._queue.put(pending)
+        local.pending = 0
+        local.last_flush = time.monotonic()
+
+    @property
+    def value(self):
+        """
+        The total count received so far. This should only be read by a
+        single process.
+
+        Returns:
+            int
+        """
+        import queue
+        while True:
+            try:
+                self._value += self._queue.get_nowait()
+            except queue.Empty:
+                break
+        return self._value
+
+    def close(self):
+        """
+        Stops the manager if it was created by this counter
+        """
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+
 def _infer_length(iterable):
     """
     Try and infer the length using the PEP 424 length hint if available.
@@ -307,6 +422,17 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
             Maximum factor update frequency can be adjusted by in a single
             step.
 
+        sink (Callable[[Dict], Any] | IO | None):
+            If specified, a machine readable record of the progress is
+            emitted whenever a message would be displayed. If this is a file
+            (i.e. it has a ``write`` method) each record is written as a line
+            of JSON, otherwise it is called with the record. A record is a
+            dictionary with the keys: desc, idx, total, rate, eta, elapsed,
+            extra, and time. The eta and elapsed values are in seconds and
+            time is the unix timestamp. When a sink is given, the text
+            message is only written if ``stream`` is also specified, and
+            otherwise no time is spent formatting it.
+
         verbose (int):
             verbosity mode, which controls clearline, adjust, and enabled. The
             following maps the value of `verbose` to its effect.
@@ -345,7 +471,7 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
                  initial=0, eta_window=64, clearline=True, adjust=True,
                  time_thresh=2.0, show_times=True, show_wall=False,
                  enabled=True, verbose=None, stream=None, chunksize=None,
-                 rel_adjust_limit=4.0, **kwargs):
+                 rel_adjust_limit=4.0, sink=None, **kwargs):
         """
         Note:
             See attributes for arg information
@@ -388,6 +514,8 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
             raise ValueError('ProgIter given unknown kwargs {}'.format(kwargs))
         # ----------------------------
 
+        # Text is not shown if only the structured sink was requested
+        self._show_text = sink is None or stream is not None
         if stream is None:
             stream = sys.stdout
 
@@ -406,6 +534,7 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
         self.clearline = clearline
         self.chunksize = chunksize
         self.rel_adjust_limit = rel_adjust_limit
+        self.sink = sink
         self.extra = ''
         self.started = False
         self.finished = False
@@ -464,16 +593,25 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
         """ iterates with progress """
         if not self.started:
             self.begin()
-        # Wrap input sequence in a generator
-        for self._iter_idx, item in enumerate(self.iterable, start=self.initial + 1):
-            yield item
-            # Call the body of step to reduce overyead
-            # self.step(0)  # inc is 0 because we already updated
-            if (self._iter_idx) % self.freq == 0:
-                # update progress information every so often
-                self._update_measurements()
-                self._update_estimates()
-                self.display_message()
+        # Consume the input in batches that end where the next message is
+        # due, so nothing but the iteration itself happens for most items.
+        # The index is still stored on every item so it is current inside
+        # the body of the loop.
+        iterator = enumerate(self.iterable, start=self.initial + 1)
+        while True:
+            freq = self.freq
+            prev_idx = self._iter_idx
+            for self._iter_idx, item in islice(
+                    iterator, freq - (prev_idx % freq)):
+                yield item
+            idx = self._iter_idx
+            if idx % freq != 0 or idx == prev_idx:
+                # The input was exhausted before the end of the batch
+                break
+            # update progress information every so often
+            self._update_measurements()
+            self._update_estimates()
+            self.display_message()
         self.end()
 
     def step(self, inc=1, force=False):
@@ -509,6 +647,70 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
             self._update_estimates()
             self.display_message()
 
+    def follow(self, counter, until=None, interval=0.1):
+        """
+        Displays the progress reported by other processes to a
+        :class:`SharedCounter` until it reaches the total or ``until`` returns
+        True.
+
+        This polls the counter every ``interval`` seconds, so workers never
+        communicate with this process directly.
+
+        Args:
+            counter (SharedCounter): the counter that workers step
+
+            until (Callable[[], bool] | None):
+                if specified, stop following when this returns True, e.g.
+                when all jobs are done. Otherwise stop when the counter
+                reaches ``total``, which must then be known.
+
+            interval (float): seconds to wait between polls
+
+        Returns:
+            ProgIter: a chainable self-reference
+
+        Raises:
+            ValueError: if neither ``until`` nor ``total`` is specified
+
+        Example:
+            >>> import ubelt as ub
+            >>> from ubelt.progiter import ProgIter, SharedCounter
+            >>> def work(start, stop, counter):
+            >>>     for _ in range(start, stop):
+            >>>         counter.step()
+            >>>     counter.flush()
+            >>>     return stop - start
+            >>> counter = SharedCounter()
+            >>> # In practice the mode would be 'process', but functions
+            >>> # defined in a doctest cannot be sent to other processes.
+            >>> with ub.JobPool('thread', max_workers=2) as pool:
+            >>>     for start in range(0, 1000, 250):
+            >>>         pool.submit(work, start, start + 250, counter)
+            >>>     prog = ProgIter(total=1000, desc='work', verbose=3)
+            >>>     prog.follow(counter, until=lambda: all(
+            >>>         job.done() for job in pool.jobs))
+            >>> counter.close()
+            >>> assert prog._iter_idx == 1000
+        """
+        if until is None and self.total is None:
+            if self.iterable is None or _infer_length(self.iterable) is None:
+                raise ValueError(
+                    'follow requires total to be known when until is None')
+        if not self.started:
+            self.begin()
+        while True:
+            done = until() if until is not None else False
+            value = counter.value + self.initial
+            if value != self._iter_idx:
+                self.step(value - self._iter_idx)
+            if done:
+                break
+            if until is None and self.total is not None and value >= self.total:
+                break
+            time.sleep(interval)
+        self.end()
+        return self
+
     def _reset_internals(self):
         """
         Initialize all variables used in the internal state
@@ -821,15 +1023,79 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
 
     def display_message(self):
         """
-        Writes current progress to the output stream
+        Writes current progress to the output stream and the sink
         """
-        msg = self.format_message()
-        self._write(msg)
-        self._tryflush()
-        self._cursor_at_newline = not self.clearline
+        if self.sink is not None:
+            self._emit_record()
+        if self._show_text:
+            msg = self.format_message()
+            self._write(msg)
+            self._tryflush()
+            self._cursor_at_newline = not self.clearline
+
+    def format_record(self):
+        """
+        Builds a machine readable record of the current progress
+
+        Returns:
+            Dict: with the keys desc, idx, total, rate, eta, elapsed, extra,
+                and time.
+
+        Example:
+            >>> import io
+            >>> import json
+            >>> file = io.StringIO()
+            >>> prog = ProgIter(range(3), desc='demo', sink=file,
+            >>>                 adjust=False)
+            >>> _ = list(prog)
+            >>> records = [json.loads(line) for line in
+            >>>            file.getvalue().splitlines()]
+            >>> assert [r['idx'] for r in records] == [0, 1, 2, 3]
+            >>> assert records[-1]['eta'] == 0
+            >>> print(sorted(records[-1].keys()))
+            ['desc', 'elapsed', 'eta', 'extra', 'idx', 'rate', 'time', 'total']
+
+        Example:
+            >>> # A callback can also receive the records
+            >>> records = []
+            >>> for _ in ProgIter(range(10), sink=records.append, freq=5,
+            >>>                   adjust=False):
+            >>>     pass
+            >>> assert [r['idx'] for r in records] == [0, 5, 10]
+        """
+        rate = self._iters_per_second
+        if self.chunksize:
+            rate = rate * self.chunksize
+        record = {
+            'desc': self.desc,
+            'idx': self._now_idx,
+            'total': self.total,
+            'rate': rate,
+            'eta': self._est_seconds_left,
+            'elapsed': self._total_seconds,
+            'extra': self.extra,
+            'time': time.time(),
+        }
+        return record
+
+    def _emit_record(self):
+        """ send a record to the sink """
+        record = self.format_record()
+        sink = self.sink
+        if hasattr(sink, 'write'):
+            import json
+            sink.write(json.dumps(record, default=str) + '\n')
+            try:
+                sink.flush()
+            except (AttributeError, IOError):  # nocover
+                pass
+        else:
+            sink(record)
 
     def _tryflush(self):
         """ flush to the internal stream """
+        if not self._show_text:
+            return
         try:
             # flush sometimes causes issues in IPython notebooks
             self.stream.flush()
@@ -838,4 +1104,5 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
 
     def _write(self, msg):
         """ write to the internal stream """
-        self.stream.write(msg)
+        if self._show_text:
+            self.stream.write(msg)
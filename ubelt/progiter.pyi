@@ -1,3 +1,8 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from multiprocessing.managers import SyncManager
 from _typeshed import Incomplete
 
 default_timer: Incomplete
@@ -6,6 +11,28 @@ AT_END: str
 CLEAR_AFTER: str
 
 
+class SharedCounter:
+    flush_interval: float
+
+    def __init__(self,
+                 flush_interval: float = 0.1,
+                 manager: SyncManager | None = None) -> None:
+        ...
+
+    def step(self, inc: int = 1) -> None:
+        ...
+
+    def flush(self) -> None:
+        ...
+
+    @property
+    def value(self) -> int:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
 class _TQDMCompat:
 
     @classmethod
@@ -95,6 +122,7 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
     clearline: Incomplete
     chunksize: Incomplete
     rel_adjust_limit: Incomplete
+    sink: Callable[[Dict], Any] | IO | None
     extra: str
     started: bool
     finished: bool
@@ -116,6 +144,7 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
                  stream: Incomplete | None = ...,
                  chunksize: Incomplete | None = ...,
                  rel_adjust_limit: float = ...,
+                 sink: Callable[[Dict], Any] | IO | None = None,
                  **kwargs) -> None:
         ...
 
@@ -137,6 +166,12 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
     def step(self, inc: int = 1, force: bool = False) -> None:
         ...
 
+    def follow(self,
+               counter: SharedCounter,
+               until: Callable[[], bool] | None = None,
+               interval: float = 0.1) -> ProgIter:
+        ...
+
     def start(self):
         ...
 
@@ -149,6 +184,9 @@ class ProgIter(_TQDMCompat, _BackwardsCompat):
     def format_message(self):
         ...
 
+    def format_record(self) -> Dict:
+        ...
+
     def ensure_newline(self) -> None:
         ...
 
@@ -116,6 +116,391 @@ from os.path import join, normpath, basename, exists
 # import warnings
 
 
+class _CacherBackends(object):
+    """
+    Registry of the serialization formats that :class:`Cacher` can use.
+
+    Each backend is a pair of ``dump`` and ``load`` functions. If the backend
+    is a "stream" backend, the functions are given an open (and possibly
+    compressed) file object, otherwise they are given the path to the file.
+
+    The signatures are ``dump(file, data, cacher)`` and
+    ``load(file, cacher)``, where ``cacher`` is the :class:`Cacher` instance,
+    which can be used to access options like ``protocol``.
+    """
+    def __init__(self):
+        self.registry = {}  # type: Dict[str, dict]  # NOQA
+
+    def register(self, name, dump, load, stream=True, binary=True):
+        """
+        Args:
+            name (str): the name used to select this backend
+            dump (Callable): writes data
+            load (Callable): reads data
+            stream (bool): if False, the functions are given file paths
+                instead of file objects and compression is not supported.
+            binary (bool): if False, files are opened in text mode.
+        """
+        self.registry[name] = {
+            'dump': dump,
+            'load': load,
+            'stream': stream,
+            'binary': binary,
+        }
+
+    def __contains__(self, name):
+        return name in self.registry
+
+    def lookup(self, name):
+        try:
+            return self.registry[name]
+        except KeyError:
+            raise NotImplementedError('backend = {}'.format(name))
+
+
+def _open_compressed(fpath, mode, compress=None):
+    """
+    Opens a file and transparently (de)compresses it.
+
+    Args:
+        fpath (str | PathLike): the file to open
+        mode (str): the mode to open the file in (e.g. 'rb', 'wt')
+        compress (str | None): can be None, 'gzip', 'zstd', or 'lz4'. The
+            latter two require the :mod:`zstandard` and :mod:`lz4` packages.
+
+    Returns:
+        IO
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_cache import _open_compressed
+        >>> dpath = ub.Path.appdir('ubelt/tests/cache-compress').ensuredir()
+        >>> fpath = dpath / 'data.gz'
+        >>> with _open_compressed(fpath, 'wt', 'gzip') as file:
+        >>>     file.write('hello ' * 100)
+        >>> assert fpath.stat().st_size < 100
+        >>> with _open_compressed(fpath, 'rt', 'gzip') as file:
+        >>>     assert file.read() == 'hello ' * 100
+    """
+    if compress is None:
+        return open(fpath, mode)
+    elif compress == 'gzip':
+        import gzip
+        return gzip.open(fpath, mode)
+    elif compress == 'zstd':
+        import zstandard  # type: ignore
+        return zstandard.open(fpath, mode)
+    elif compress == 'lz4':
+        import lz4.frame  # type: ignore
+        return lz4.frame.open(fpath, mode)
+    else:
+        raise KeyError('unknown compress={!r}'.format(compress))
+
+
+_COMPRESSORS = {'gzip', 'zstd', 'lz4'}
+
+
+def _pickle_dump(file, data, cacher):
+    import pickle
+    pickle.dump(data, file, protocol=cacher.protocol)
+
+
+def _pickle_load(file, cacher):
+    import pickle
+    return pickle.load(file)
+
+
+def _json_dump(file, data, cacher):
+    import json
+    json.dump(data, file)
+
+
+def _json_load(file, cacher):
+    import json
+    return json.load(file)
+
+
+# Identifies files written by the "pickle5" backend
+_PICKLE5_MAGIC = b'UBPKL5\x00\x00'
+
+
+def _import_pickle5():
+    import pickle
+    if pickle.HIGHEST_PROTOCOL < 5:  # nocover
+        import pickle5 as pickle  # type: ignore
+    return pickle
+
+
+def _pickle5_dump(file, data, cacher):
+    """
+    Writes a protocol 5 pickle, but stores large buffers (e.g. the memory
+    backing numpy arrays) out-of-band after the pickle stream, so they are
+    written without making intermediate copies.
+    """
+    import struct
+    pickle = _import_pickle5()
+    buffers = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buf.raw() for buf in buffers]
+    sizes = [len(payload)] + [raw.nbytes for raw in raw_buffers]
+    file.write(_PICKLE5_MAGIC)
+    file.write(struct.pack('<Q', len(sizes)))
+    file.write(struct.pack('<{}Q'.format(len(sizes)), *sizes))
+    file.write(payload)
+    for raw in raw_buffers:
+        file.write(raw)
+        raw.release()
+
+
+def _pickle5_load(file, cacher):
+    """
+    Reads a file written by :func:`_pickle5_dump`. Each out-of-band buffer is
+    read directly into its own writable bytearray, which is then used as the
+    memory of the unpickled object.
+    """
+    import struct
+    pickle = _import_pickle5()
+    magic = file.read(len(_PICKLE5_MAGIC))
+    if magic != _PICKLE5_MAGIC:
+        raise IOError('Not a pickle5 cache file')
+    num, = struct.unpack('<Q', file.read(8))
+    sizes = struct.unpack('<{}Q'.format(num), file.read(8 * num))
+    buffers = []
+    for size in sizes:
+        buf = bytearray(size)
+        view = memoryview(buf)
+        nread = 0
+        while nread < size:
+            n = file.readinto(view[nread:])
+            if not n:
+                raise EOFError('Truncated pickle5 cache file')
+            nread += n
+        view.release()
+        buffers.append(buf)
+    return pickle.loads(buffers[0], buffers=buffers[1:])
+
+
+def _npy_dump(fpath, data, cacher):
+    import numpy as np
+    with open(fpath, 'wb') as file:
+        np.save(file, data, allow_pickle=False)
+
+
+def _npy_load(fpath, cacher):
+    import numpy as np
+    try:
+        return np.load(fpath, mmap_mode='r', allow_pickle=False)
+    except ValueError:
+        # Empty arrays cannot be memory mapped
+        return np.load(fpath, allow_pickle=False)
+
+
+def _npz_dump(fpath, data, cacher):
+    import numpy as np
+    with open(fpath, 'wb') as file:
+        np.savez(file, **data)
+
+
+def _npz_load(fpath, cacher):
+    """
+    Loads a dictionary of arrays written with :func:`numpy.savez`.
+
+    Because :func:`numpy.savez` does not compress its members, each array is
+    a contiguous range of the zip file and can be memory mapped directly.
+    """
+    import numpy as np
+    import struct
+    import zipfile
+    from numpy.lib import format as npy_format
+    data = {}
+    with zipfile.ZipFile(fpath) as zfile, open(fpath, 'rb') as file:
+        for info in zfile.infolist():
+            key = info.filename
+            if key.endswith('.npy'):
+                key = key[:-4]
+            arr = None
+            if info.compress_type == zipfile.ZIP_STORED:
+                # Skip the local file header to find the start of the member
+                file.seek(info.header_offset)
+                header = file.read(30)
+                name_len, extra_len = struct.unpack('<HH', header[26:30])
+                file.seek(info.header_offset + 30 + name_len + extra_len)
+                version = npy_format.read_magic(file)
+                if version == (1, 0):
+                    read_header = npy_format.read_array_header_1_0
+                elif version == (2, 0):
+                    read_header = npy_format.read_array_header_2_0
+                else:  # nocover
+                    read_header = None
+                if read_header is not None:
+                    shape, fortran_order, dtype = read_header(file)
+                if read_header is not None and not dtype.hasobject:
+                    size = int(np.prod(shape)) * dtype.itemsize
+                    if size > 0:
+                        arr = np.memmap(fpath, dtype=dtype, mode='r',
+                                        offset=file.tell(), shape=shape,
+                                        order='F' if fortran_order else 'C')
+            if arr is None:
+                with zfile.open(info) as member:
+                    arr = npy_format.read_array(member, allow_pickle=False)
+            data[key] = arr
+    return data
+
+
+_CACHER_BACKENDS = _CacherBackends()
+_CACHER_BACKENDS.register('pickle', _pickle_dump, _pickle_load)
+_CACHER_BACKENDS.register('json', _json_dump, _json_load, binary=False)
+_CACHER_BACKENDS.register('pickle5', _pickle5_dump, _pickle5_load)
+_CACHER_BACKENDS.register('npy', _npy_dump, _npy_load, stream=False)
+_CACHER_BACKENDS.register('npz', _npz_dump, _npz_load, stream=False)
+
+
+class _FileLock(object):
+    """
+    An exclusive lock that is shared between processes via a lock file.
+
+    POSIX record locks (:func:`fcntl.lockf`) are used on Unix because they
+    also work on NFS. These locks are held per-process, so a per-path thread
+    lock is also taken to make the lock exclusive between threads.
+
+    Args:
+        fpath (str | PathLike): path to the lock file, which is created if it
+            does not exist and is never removed.
+
+        timeout (float | None): maximum number of seconds to wait for the lock.
+            If None, wait forever.
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_cache import _FileLock
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-file-lock').ensuredir()
+        >>> lock = _FileLock(dpath / 'demo.lock')
+        >>> with lock:
+        >>>     other = _FileLock(dpath / 'demo.lock', timeout=0.01)
+        >>>     assert not other.acquire()
+        >>> assert other.acquire()
+        >>> other.release()
+    """
+    _thread_locks = {}  # type: Dict[str, threading.Lock]  # NOQA
+    _thread_locks_lock = None
+
+    def __init__(self, fpath, timeout=None):
+        self.fpath = os.fspath(fpath)
+        self.timeout = timeout
+        self._fd = None
+        self._thread_lock = self._get_thread_lock(self.fpath)
+
+    @classmethod
+    def _get_thread_lock(cls, fpath):
+        import threading
+        if cls._thread_locks_lock is None:
+            cls._thread_locks_lock = threading.Lock()
+        key = os.path.abspath(fpath)
+        with cls._thread_locks_lock:
+            lock = cls._thread_locks.get(key, None)
+            if lock is None:
+                lock = cls._thread_locks[key] = threading.Lock()
+        return lock
+
+    def acquire(self):
+        """
+        Returns:
+            bool: True if the lock was acquired before the timeout
+        """
+        import time
+        start = time.monotonic()
+        if self.timeout is None:
+            self._thread_lock.acquire()
+        elif not self._thread_lock.acquire(timeout=self.timeout):
+            return False
+        try:
+            fd = os.open(self.fpath, os.O_RDWR | os.O_CREAT, 0o666)
+            delay = 0.001
+            while not _try_lock_fd(fd):
+                elapsed = time.monotonic() - start
+                if self.timeout is not None and elapsed >= self.timeout:
+                    os.close(fd)
+                    self._thread_lock.release()
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+        except Exception:
+            self._thread_lock.release()
+            raise
+        self._fd = fd
+        return True
+
+    async def acquire_async(self):
+        """
+        Like :func:`_FileLock.acquire`, but waits with :func:`asyncio.sleep`
+        instead of blocking the calling thread, so it can be used from an
+        event loop.
+
+        Returns:
+            bool: True if the lock was acquired before the timeout
+        """
+        import asyncio
+        import time
+        start = time.monotonic()
+        timeout = self.timeout
+        delay = 0.001
+        self.timeout = 0
+        try:
+            while not self.acquire():
+                elapsed = time.monotonic() - start
+                if timeout is not None and elapsed >= timeout:
+                    return False
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.1)
+        finally:
+            self.timeout = timeout
+        return True
+
+    def release(self):
+        fd = self._fd
+        self._fd = None
+        try:
+            _unlock_fd(fd)
+        finally:
+            os.close(fd)
+            self._thread_lock.release()
+
+    def __enter__(self):
+        if not self.acquire():
+            raise TimeoutError('Unable to lock {}'.format(self.fpath))
+        return self
+
+    def __exit__(self, ex_type, ex_value, ex_traceback):
+        self.release()
+
+
+if os.name == 'nt':  # nocover
+    def _try_lock_fd(fd):
+        import msvcrt
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_fd(fd):
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    def _try_lock_fd(fd):
+        import fcntl
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_fd(fd):
+        import fcntl
+        fcntl.lockf(fd, fcntl.LOCK_UN)
+
+
 class Cacher(object):
     """
     Saves data to disk and reloads it based on specified dependencies.
@@ -125,6 +510,10 @@ class Cacher(object):
     recomputed if the dependencies change. If the location of the cache is not
     specified, it will default to the system user's cache directory.
 
+    The :func:`Cacher.aload`, :func:`Cacher.asave`, :func:`Cacher.atryload`,
+    and :func:`Cacher.aensure` methods are awaitable variants that run file
+    I/O in the default executor of the event loop.
+
     Args:
         fname (str):
             A file name. This is the prefix that will be used by the cache. It
@@ -170,8 +559,38 @@ class Cacher(object):
             Defaults to the -1 which is the latest protocol.
 
         backend (str):
-            Set to either ``'pickle'`` or ``'json'`` to force backend. Defaults
-            to auto which chooses one based on the extension.
+            The serialization format. Builtin options are:
+            ``'pickle'``, ``'json'``,
+            ``'pickle5'`` - a protocol 5 pickle that stores large buffers
+            (e.g. numpy arrays) out-of-band to avoid copies,
+            ``'npy'`` - a single numpy array that is memory mapped on load,
+            ``'npz'`` - a dictionary of numpy arrays that are memory mapped
+            on load.
+            Other backends can be added with :func:`Cacher.register_backend`.
+            Defaults to auto which chooses ``'json'`` if the extension is
+            ``'.json'`` and ``'pickle'`` otherwise.
+
+        compress (str | None):
+            If specified, the cache file is compressed. Can be ``'gzip'``,
+            ``'zstd'``, or ``'lz4'``. The latter two require the optional
+            :mod:`zstandard` and :mod:`lz4` packages. Not supported by the
+            memory mapped ``'npy'`` and ``'npz'`` backends. Defaults to None.
+
+        cache_dir (CacheDir | None):
+            If specified, saves and loads are recorded in the index of this
+            :class:`CacheDir`, which evicts old entries after each save to
+            keep the directory within its limits. If ``dpath`` is not
+            specified, it defaults to the directory of the ``CacheDir``.
+            Defaults to None.
+
+        lock (bool | float):
+            If truthy, :func:`Cacher.save` and :func:`Cacher.ensure` hold an
+            inter-process lock on a ``.lock`` file next to the cache file.
+            This makes :func:`Cacher.ensure` "single-flight": if several
+            processes need the same missing entry, only one computes it and
+            the others wait and load the result. If a number is given, it is
+            the maximum number of seconds to wait for the lock before raising
+            a :class:`TimeoutError`. Defaults to False.
 
         cfgstr (str | None):
             Deprecated in favor of ``depends``.
@@ -215,7 +634,8 @@ class Cacher(object):
 
     def __init__(self, fname, depends=None, dpath=None, appname='ubelt',
                  ext='.pkl', meta=None, verbose=None, enabled=True, log=None,
-                 hasher='sha1', protocol=-1, cfgstr=None, backend='auto'):
+                 hasher='sha1', protocol=-1, cfgstr=None, backend='auto',
+                 compress=None, lock=False, cache_dir=None):
 
         if depends is None:
             depends = cfgstr
@@ -232,6 +652,8 @@ class Cacher(object):
 
         if verbose is None:
             verbose = self.VERBOSE
+        if dpath is None and cache_dir is not None:
+            dpath = cache_dir.dpath
         if dpath is None:  # pragma: no branch
             from ubelt import util_platform
             dpath = util_platform.get_app_cache_dir(appname)
@@ -244,9 +666,16 @@ class Cacher(object):
             else:
                 backend = 'pickle'
         else:
-            if backend not in {'json', 'pickel'}:
+            if backend not in _CACHER_BACKENDS:
                 raise ValueError(backend)
 
+        if compress is not None:
+            if compress not in _COMPRESSORS:
+                raise ValueError(compress)
+            if not _CACHER_BACKENDS.lookup(backend)['stream']:
+                raise ValueError(
+                    'backend={} does not support compression'.format(backend))
+
         self.dpath = dpath
         self.fname = fname
         self.depends = depends
@@ -259,6 +688,9 @@ class Cacher(object):
         self.hasher = hasher
         self.log = print if log is None else log
         self.backend = backend
+        self.compress = compress
+        self.lock = lock
+        self.cache_dir = cache_dir
         if len(self.ext) > 0 and self.ext[0] != '.':
             raise ValueError('Please be explicit and use a dot in ext')
 
@@ -419,6 +851,8 @@ class Cacher(object):
             meta_fpath = data_fpath + '.meta'
             if exists(meta_fpath):
                 os.remove(meta_fpath)
+            if self.cache_dir is not None:
+                self.cache_dir.discard(data_fpath)
         else:
             if self.verbose > 0:
                 self.log('[cacher] ... nothing to clear')
@@ -533,6 +967,8 @@ class Cacher(object):
                 self.log('[cacher] ... {} cache hit'.format(self.fname))
             elif verbose > 1:
                 self.log('[cacher] ... cache hit')
+            if self.cache_dir is not None:
+                self.cache_dir.touch(data_fpath)
         return data
 
     def save(self, data, cfgstr=None):
@@ -542,6 +978,10 @@ class Cacher(object):
         Metadata containing information about the cache will also be appended
         to an adjacent file with the `.meta` suffix.
 
+        The data is first written to a temporary file in the same directory
+        and then moved into place, so readers never see a partially written
+        cache file.
+
         Args:
             data (object): arbitrary pickleable object to be cached
             cfgstr (str | None): overrides the instance-level cfgstr
@@ -559,10 +999,21 @@ class Cacher(object):
             >>> cacher2.save('data')
             >>> assert not exists(cacher2.get_fpath()), 'should be disabled'
         """
-        from ubelt import util_path
-        from ubelt import util_time
         if not self.enabled:
             return
+        if self.lock:
+            with self._file_lock(cfgstr):
+                self._save(data, cfgstr)
+        else:
+            self._save(data, cfgstr)
+
+    def _save(self, data, cfgstr=None):
+        """
+        The implementation of :func:`Cacher.save` without locking.
+        """
+        from ubelt import util_path
+        from ubelt import util_time
+        import uuid
         if self.verbose > 0:
             self.log('[cacher] ... {} cache save'.format(self.fname))
 
@@ -584,7 +1035,20 @@ class Cacher(object):
             file_.write(cfgstr_ + '\n')
             file_.write(str(self.meta) + '\n')
 
-        self._backend_dump(data_fpath, data)
+        # Write to a unique temporary file and atomically move it into place
+        tmp_fpath = '{}.{}.{}.tmp'.format(data_fpath, os.getpid(),
+                                          uuid.uuid4().hex[0:8])
+        try:
+            self._backend_dump(tmp_fpath, data)
+            os.replace(tmp_fpath, data_fpath)
+        except BaseException:
+            if exists(tmp_fpath):
+                os.remove(tmp_fpath)
+            raise
+
+        if self.cache_dir is not None:
+            self.cache_dir.add(data_fpath)
+            self.cache_dir.evict(keep=[data_fpath])
 
         if self.verbose > 3:
             sizestr = _byte_str(os.stat(data_fpath).st_size)
@@ -608,32 +1072,86 @@ class Cacher(object):
             >>>     ub.Cacher('test_other_backend2', depends=['a'], ext='.yaml', backend='does-not-exist')
             >>> cacher = ub.Cacher('test_other_backend2', depends=['a'], ext='.really-a-pickle', backend='auto')
             >>> assert cacher.backend == 'pickle', 'should be default'
+
+            >>> import ubelt as ub
+            >>> cacher = ub.Cacher('test_compressed_backend', depends=['a'], compress='gzip')
+            >>> cacher.save({'data': [1, 2, 3] * 100})
+            >>> assert cacher.load() == {'data': [1, 2, 3] * 100}
+
+        Example:
+            >>> # xdoctest: +REQUIRES(module:numpy)
+            >>> import ubelt as ub
+            >>> import numpy as np
+            >>> data = {'a': np.arange(10), 'b': np.eye(3)}
+            >>> cacher = ub.Cacher('test_npz_backend', depends=['a'], ext='.npz', backend='npz')
+            >>> cacher.save(data)
+            >>> loaded = cacher.load()
+            >>> assert isinstance(loaded['a'], np.memmap)
+            >>> assert np.all(loaded['b'] == data['b'])
+            >>> cacher = ub.Cacher('test_pickle5_backend', depends=['a'], backend='pickle5')
+            >>> cacher.save(data)
+            >>> loaded = cacher.load()
+            >>> assert np.all(loaded['b'] == data['b'])
         """
-        if self.backend == 'pickle':
-            import pickle
-            with open(data_fpath, 'rb') as file_:
-                data = pickle.load(file_)
-        elif self.backend == 'json':
-            import json
-            with open(data_fpath, 'r') as file_:
-                data = json.load(file_)
+        backend = _CACHER_BACKENDS.lookup(self.backend)
+        if backend['stream']:
+            mode = 'rb' if backend['binary'] else 'rt'
+            with _open_compressed(data_fpath, mode, self.compress) as file_:
+                data = backend['load'](file_, self)
         else:
-            raise NotImplementedError('self.backend = {}'.format(self.backend))
+            data = backend['load'](data_fpath, self)
         return data
 
     def _backend_dump(self, data_fpath, data):
-        if self.backend == 'pickle':
-            import pickle
-            with open(data_fpath, 'wb') as file_:
-                pickle.dump(data, file_, protocol=self.protocol)
-        elif self.backend == 'json':
-            import json
-            with open(data_fpath, 'w') as file_:
-                json.dump(data, file_)
+        backend = _CACHER_BACKENDS.lookup(self.backend)
+        if backend['stream']:
+            mode = 'wb' if backend['binary'] else 'wt'
+            with _open_compressed(data_fpath, mode, self.compress) as file_:
+                backend['dump'](file_, data, self)
         else:
-            raise NotImplementedError('self.backend = {}'.format(self.backend))
+            backend['dump'](data_fpath, data, self)
         return data
 
+    @staticmethod
+    def register_backend(name, dump, load, stream=True, binary=True):
+        """
+        Register a new serialization format that can be selected with the
+        ``backend`` argument.
+
+        Args:
+            name (str): the name used to select this backend
+
+            dump (Callable[[IO | str, object, Cacher], None]):
+                writes the data. Called as ``dump(file, data, cacher)``.
+
+            load (Callable[[IO | str, Cacher], object]):
+                reads the data. Called as ``load(file, cacher)``.
+
+            stream (bool):
+                If True, ``dump`` and ``load`` are given an open (and possibly
+                compressed) file object, otherwise they are given the path to
+                the cache file and compression is not supported.
+                Defaults to True.
+
+            binary (bool):
+                If False, stream backends are given files opened in text mode.
+                Defaults to True.
+
+        Example:
+            >>> import ubelt as ub
+            >>> def dump(file, data, cacher):
+            >>>     file.write(ub.repr2(data))
+            >>> def load(file, cacher):
+            >>>     import ast
+            >>>     return ast.literal_eval(file.read())
+            >>> ub.Cacher.register_backend('repr', dump, load, binary=False)
+            >>> cacher = ub.Cacher('test_custom_backend', depends=['a'], backend='repr')
+            >>> cacher.save({'a': [1, 2]})
+            >>> assert cacher.load() == {'a': [1, 2]}
+        """
+        _CACHER_BACKENDS.register(name, dump, load, stream=stream,
+                                  binary=binary)
+
     def ensure(self, func, *args, **kwargs):
         """
         Wraps around a function. A cfgstr must be stored in the base cacher.
@@ -656,13 +1174,186 @@ class Cacher(object):
             >>> assert data1 == 'expensive result'
             >>> assert data1 == data2
             >>> cacher.clear()
+
+        Example:
+            >>> # With a lock, concurrent workers compute the data only once
+            >>> from ubelt.util_cache import *  # NOQA
+            >>> import ubelt as ub
+            >>> calls = []
+            >>> def func():
+            >>>     calls.append(1)
+            >>>     return 'expensive result'
+            >>> cacher = Cacher('test_cacher_ensure_lock', depends='a',
+            >>>                 lock=True, verbose=0)
+            >>> cacher.clear()
+            >>> with ub.JobPool('thread', max_workers=8) as pool:
+            >>>     for _ in range(8):
+            >>>         pool.submit(cacher.ensure, func)
+            >>>     results = [job.result() for job in pool.jobs]
+            >>> assert len(calls) == 1
+            >>> assert set(results) == {'expensive result'}
+            >>> cacher.clear()
         """
         data = self.tryload()
         if data is None:
-            data = func(*args, **kwargs)
-            self.save(data)
+            if self.lock and self.enabled:
+                with self._file_lock():
+                    # Another process may have computed the data while we
+                    # were waiting for the lock.
+                    data = self.tryload()
+                    if data is None:
+                        data = func(*args, **kwargs)
+                        self._save(data)
+            else:
+                data = func(*args, **kwargs)
+                self.save(data)
         return data
 
+    async def atryload(self, cfgstr=None, on_error='raise'):
+        """
+        Like :func:`Cacher.tryload`, but runs in the default executor of the
+        event loop so the loop is not blocked by file I/O and unpickling.
+
+        Args:
+            cfgstr (str | None): overrides the instance-level cfgstr
+            on_error (str): see :func:`Cacher.tryload`
+
+        Returns:
+            None | object:
+                the cached data if it exists, otherwise returns None
+        """
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, self.tryload, cfgstr, on_error)
+
+    async def aload(self, cfgstr=None):
+        """
+        Like :func:`Cacher.load`, but runs in the default executor of the
+        event loop.
+
+        Args:
+            cfgstr (str | None): overrides the instance-level cfgstr
+
+        Returns:
+            object: the cached data
+
+        Example:
+            >>> from ubelt.util_cache import *  # NOQA
+            >>> import asyncio
+            >>> cacher = Cacher('test_async_load', depends='a', verbose=0)
+            >>> async def main():
+            >>>     await cacher.asave({'data': [1, 2, 3]})
+            >>>     return await cacher.aload()
+            >>> loop = asyncio.new_event_loop()
+            >>> assert loop.run_until_complete(main()) == {'data': [1, 2, 3]}
+            >>> loop.close()
+            >>> cacher.clear()
+        """
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.load, cfgstr)
+
+    async def asave(self, data, cfgstr=None):
+        """
+        Like :func:`Cacher.save`, but runs in the default executor of the
+        event loop.
+
+        Args:
+            data (object): arbitrary pickleable object to be cached
+            cfgstr (str | None): overrides the instance-level cfgstr
+        """
+        import asyncio
+        if not self.enabled:
+            return
+        loop = asyncio.get_event_loop()
+        if self.lock:
+            lock = self._file_lock(cfgstr)
+            await self._acquire_async(lock)
+            try:
+                await loop.run_in_executor(None, self._save, data, cfgstr)
+            finally:
+                lock.release()
+        else:
+            await loop.run_in_executor(None, self._save, data, cfgstr)
+
+    async def aensure(self, func, *args, **kwargs):
+        """
+        Like :func:`Cacher.ensure`, but loads and saves in the default
+        executor of the event loop and awaits the result of ``func`` if it
+        is awaitable.
+
+        If ``lock`` is set, waiting for the inter-process lock does not block
+        the event loop or an executor thread.
+
+        Args:
+            func (Callable): function or coroutine function that will
+                compute data on cache miss
+            *args: passed to func
+            **kwargs: passed to func
+
+        Example:
+            >>> from ubelt.util_cache import *  # NOQA
+            >>> import asyncio
+            >>> calls = []
+            >>> async def compute(x):
+            >>>     calls.append(x)
+            >>>     await asyncio.sleep(0.01)
+            >>>     return x * 2
+            >>> cacher = Cacher('test_async_ensure', depends='a', lock=True,
+            >>>                 verbose=0)
+            >>> cacher.clear()
+            >>> async def main():
+            >>>     return await asyncio.gather(*[
+            >>>         cacher.aensure(compute, 3) for _ in range(4)])
+            >>> loop = asyncio.new_event_loop()
+            >>> assert loop.run_until_complete(main()) == [6] * 4
+            >>> loop.close()
+            >>> assert calls == [3]
+            >>> cacher.clear()
+        """
+        import asyncio
+        import inspect
+        loop = asyncio.get_event_loop()
+        data = await self.atryload()
+        if data is None:
+            if self.lock and self.enabled:
+                lock = self._file_lock()
+                await self._acquire_async(lock)
+                try:
+                    # Another task or process may have computed the data
+                    # while we were waiting for the lock.
+                    data = await self.atryload()
+                    if data is None:
+                        data = func(*args, **kwargs)
+                        if inspect.isawaitable(data):
+                            data = await data
+                        await loop.run_in_executor(None, self._save, data)
+                finally:
+                    lock.release()
+            else:
+                data = func(*args, **kwargs)
+                if inspect.isawaitable(data):
+                    data = await data
+                await self.asave(data)
+        return data
+
+    @staticmethod
+    async def _acquire_async(lock):
+        if not await lock.acquire_async():
+            raise TimeoutError('Unable to lock {}'.format(lock.fpath))
+
+    def _file_lock(self, cfgstr=None):
+        """
+        Returns:
+            _FileLock: the inter-process lock for this cache entry
+        """
+        from ubelt import util_path
+        util_path.ensuredir(self.dpath)
+        lock_fpath = self.get_fpath(cfgstr) + '.lock'
+        timeout = None if self.lock is True else self.lock
+        return _FileLock(lock_fpath, timeout=timeout)
+
     def __call__(self, func):
         """
         Allows Cacher to be used as a decorator for functions with no
@@ -683,10 +1374,16 @@ class Cacher(object):
             >>> assert func.cacher.exists()
             >>> func.cacher.clear()
         """
+        import inspect
         # Can't return arguments because cfgstr won't take them into account
-        def _wrapper():
-            data = self.ensure(func)
-            return data
+        if inspect.iscoroutinefunction(func):
+            async def _wrapper():
+                data = await self.aensure(func)
+                return data
+        else:
+            def _wrapper():
+                data = self.ensure(func)
+                return data
         _wrapper.cacher = self
         return _wrapper
 
@@ -770,6 +1467,33 @@ class CacheStamp(object):
             File extension for the cache format. Can be ``'.pkl'`` or
             ``'.json'``.
 
+        hash_cache (bool | FileHashCache):
+            If truthy, product hashes are looked up in (and stored to) a
+            persistent :class:`ubelt.util_hash.FileHashCache`, so unchanged
+            products do not need to be re-read. Note this means a product is
+            assumed to be unchanged if its inode, size, and mtime are the
+            same. If True the default cache is used. Defaults to False.
+
+        cache_dir (CacheDir | None):
+            Passed to internal :class:`ubelt.Cacher` object, which records the
+            stamp in the index of the :class:`CacheDir` and limits its size.
+
+        verify (str):
+            How product hashes are verified when the stamp is checked. If
+            'hash', the products are always re-hashed. If 'stat', the
+            products are only re-hashed if their inode, size, or mtime (in
+            nanoseconds) differ from the certificate, which makes checking
+            the stamp as cheap as a stat call. Defaults to 'hash'.
+
+        verify_rate (float):
+            When ``verify='stat'``, the probability that a check re-hashes the
+            products anyway. This catches silent corruption that does not
+            change file stats. Defaults to 0.
+
+        hash_workers (int):
+            If greater than 0, the products are hashed in parallel with this
+            many threads. Defaults to 0.
+
         cfgstr (str | None):
             DEPRECATED in favor or depends.
 
@@ -797,14 +1521,22 @@ class CacheStamp(object):
     """
     def __init__(self, fname, dpath, cfgstr=None, product=None, hasher='sha1',
                  verbose=None, enabled=True, depends=None, meta=None,
-                 hash_prefix=None, expires=None, ext='.pkl'):
+                 hash_prefix=None, expires=None, ext='.pkl', hash_cache=False,
+                 cache_dir=None, verify='hash', verify_rate=0.0,
+                 hash_workers=0):
         self.cacher = Cacher(fname, cfgstr=cfgstr, dpath=dpath,
                              verbose=verbose, enabled=enabled, depends=depends,
-                             meta=meta, ext=ext)
+                             meta=meta, ext=ext, cache_dir=cache_dir)
         self.product = product
         self.hasher = hasher
+        self.hash_cache = hash_cache
         self.expires = expires
         self.hash_prefix = hash_prefix
+        if verify not in {'hash', 'stat'}:
+            raise KeyError('unknown verify={!r}'.format(verify))
+        self.verify = verify
+        self.verify_rate = verify_rate
+        self.hash_workers = hash_workers
 
         # The user can modify these if they want to disable size or mtime
         # checks for expiration. Not sure if I want to expose it at the
@@ -858,7 +1590,7 @@ class CacheStamp(object):
         """
         products = self._rectify_products(product)
         product_info = {}
-        product_info.update(self._product_file_stats())
+        product_info.update(self._product_file_stats(products))
         if self.hasher is None:
             hasher_name = None
         else:
@@ -881,20 +1613,72 @@ class CacheStamp(object):
         product_stats = [p.stat() for p in products]
         product_file_stats = {
             'mtime': [stat.st_mtime for stat in product_stats],
-            'size': [stat.st_size for stat in product_stats]
+            'size': [stat.st_size for stat in product_stats],
+            # Used by the "stat" verification policy
+            'inode': [stat.st_ino for stat in product_stats],
+            'mtime_ns': [stat.st_mtime_ns for stat in product_stats],
         }
         return product_file_stats
 
+    def _needs_rehash(self, certificate, product_file_stats):
+        """
+        Determine if the products must be hashed to check the stamp
+
+        Example:
+            >>> import ubelt as ub
+            >>> dpath = ub.Path.appdir('ubelt/tests/cache-stamp-rehash').ensuredir()
+            >>> product = dpath / 'product1.txt'
+            >>> product.write_text('hi')
+            >>> self = ub.CacheStamp('myname', depends='myconfig', dpath=dpath,
+            >>>                      product=product, verify='stat')
+            >>> cert = self.renew()
+            >>> stats = self._product_file_stats()
+            >>> assert not self._needs_rehash(cert, stats)
+            >>> self.verify_rate = 1.0
+            >>> assert self._needs_rehash(cert, stats)
+            >>> self.verify_rate = 0.0
+            >>> stats['inode'] = [-1]
+            >>> assert self._needs_rehash(cert, stats)
+        """
+        if self.verify == 'hash':
+            return True
+        if self.verify_rate > 0:
+            import random
+            if random.random() < self.verify_rate:
+                return True
+        for key in ['inode', 'size', 'mtime_ns']:
+            # Certificates from older versions do not store all stats
+            if certificate.get(key, None) != product_file_stats[key]:
+                return True
+        return False
+
     def _product_file_hash(self, product=None):
         if self.hasher is None:
             product_file_hash = None
         else:
             from ubelt import util_hash
             products = self._rectify_products(product)
-            product_file_hash = [
-                util_hash.hash_file(p, hasher=self.hasher, base='hex')
-                for p in products
-            ]
+            if self.hash_cache is False or self.hash_cache is None:
+                cache = False
+                product_file_hash = [None] * len(products)
+            else:
+                cache = util_hash._rectify_file_hash_cache(self.hash_cache)
+                # Lookup all products at once and only hash the misses
+                product_file_hash = cache.lookup_many(products,
+                                                      hasher=self.hasher)
+            missing = [idx for idx, h in enumerate(product_file_hash)
+                       if h is None]
+            if self.hash_workers > 0 and len(missing) > 1:
+                hash_iter = util_hash.hash_files(
+                    [products[idx] for idx in missing], hasher=self.hasher,
+                    base='hex', max_workers=self.hash_workers, cache=cache)
+                for idx, (_, hashed) in zip(missing, hash_iter):
+                    product_file_hash[idx] = hashed
+            else:
+                for idx in missing:
+                    product_file_hash[idx] = util_hash.hash_file(
+                        products[idx], hasher=self.hasher, base='hex',
+                        cache=cache)
         return product_file_hash
 
     def expired(self, cfgstr=None, product=None):
@@ -1057,7 +1841,10 @@ class CacheStamp(object):
 
             # We are expired if the hash of the existing product data
             # does not match the expected hash in the certificate
-            if self._expire_checks['hash']:
+            needs_rehash = (self._expire_checks['hash'] and
+                            self._needs_rehash(certificate,
+                                               product_file_stats))
+            if needs_rehash:
                 certificate_hash = certificate.get('hash', None)
                 product_file_hash = self._product_file_hash(products)
                 if product_file_hash != certificate_hash:
@@ -1210,6 +1997,437 @@ def _localnow():
     return now
 
 
+class CacheDir(object):
+    """
+    Tracks the size and usage of cache files in a directory and evicts old
+    entries to keep the directory within specified limits.
+
+    Entries are the data files written by :class:`Cacher` (and therefore
+    :class:`CacheStamp`). The size of an entry includes its ``.meta`` file.
+    Sizes, creation times, last access times, and access counts are kept in
+    a sqlite index inside the directory, so multiple processes can safely
+    share it.
+
+    Pass a ``CacheDir`` as the ``cache_dir`` argument of a :class:`Cacher`
+    to record accesses on load and to incrementally evict entries on each
+    save. Files that were written by a :class:`Cacher` without a
+    ``CacheDir`` can be indexed with :func:`CacheDir.scan`. Other files in
+    the directory are never indexed or evicted, so it is safe to share the
+    directory with other data.
+
+    The ``.lock`` files used by ``Cacher(lock=True)`` are never removed by
+    eviction, because another process may be holding or waiting on them.
+
+    The usage of an existing directory can be reported by calling
+    :func:`CacheDir.scan` followed by :func:`CacheDir.usage`, and
+    :func:`CacheDir.evict` with ``dry=True`` shows what would be removed.
+
+    Args:
+        dpath (str | PathLike):
+            The cache directory.
+
+        max_bytes (int | None):
+            If specified, evict entries until the total size is at most this
+            many bytes.
+
+        max_entries (int | None):
+            If specified, evict entries until there are at most this many.
+
+        max_age (float | datetime.timedelta | None):
+            If specified, evict entries that have not been accessed in this
+            many seconds.
+
+        policy (str):
+            Which entries are evicted first when there are too many or they
+            are too large. Can be 'lru' (least recently used) or 'lfu' (least
+            frequently used, ties are broken by recency). Defaults to 'lru'.
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_cache import CacheDir
+        >>> dpath = ub.Path.appdir('ubelt/tests/cache-dir').delete().ensuredir()
+        >>> cache_dir = CacheDir(dpath, max_entries=2)
+        >>> for idx in range(3):
+        >>>     cacher = ub.Cacher('data', depends=[idx], cache_dir=cache_dir)
+        >>>     cacher.save('data {}'.format(idx))
+        >>> # Only the two most recently used entries are kept
+        >>> usage = cache_dir.usage()
+        >>> print(ub.repr2(usage, nl=1, sort=1))
+        >>> assert usage['num_entries'] == 2
+        >>> assert not ub.Cacher('data', depends=[0], cache_dir=cache_dir).exists()
+        >>> assert ub.Cacher('data', depends=[2], cache_dir=cache_dir).exists()
+    """
+    INDEX_FNAME = '.ubelt_cache_index.sqlite'
+
+    # Files that are managed with their data file, but are not entries. Lock
+    # files are not included because removing a lock file that another
+    # process holds would allow a second process to acquire it.
+    _SIDECAR_SUFFIXES = ('.meta',)
+    _IGNORE_SUFFIXES = ('.meta', '.lock', '.tmp')
+
+    def __init__(self, dpath, max_bytes=None, max_entries=None, max_age=None,
+                 policy='lru'):
+        import threading
+        import datetime
+        if policy not in {'lru', 'lfu'}:
+            raise KeyError('unknown policy={!r}'.format(policy))
+        if isinstance(max_age, datetime.timedelta):
+            max_age = max_age.total_seconds()
+        self.dpath = os.fspath(dpath)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.policy = policy
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Connections and locks cannot be sent to other processes
+        return {'dpath': self.dpath, 'max_bytes': self.max_bytes,
+                'max_entries': self.max_entries, 'max_age': self.max_age,
+                'policy': self.policy}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _connect(self):
+        """
+        Returns a connection for the current process, creating it if needed.
+        """
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            import sqlite3
+            from ubelt import util_path
+            util_path.ensuredir(self.dpath)
+            index_fpath = join(self.dpath, self.INDEX_FNAME)
+            conn = sqlite3.connect(index_fpath, timeout=60,
+                                   isolation_level=None,
+                                   check_same_thread=False)
+            try:
+                # WAL mode lets readers proceed while another process writes
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+            except sqlite3.OperationalError:  # nocover
+                pass
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'fname TEXT PRIMARY KEY, nbytes INTEGER, created REAL, '
+                'last_access REAL, hits INTEGER)')
+            # Let eviction find its victims without sorting the whole table
+            conn.execute('CREATE INDEX IF NOT EXISTS entries_lru '
+                         'ON entries (last_access)')
+            conn.execute('CREATE INDEX IF NOT EXISTS entries_lfu '
+                         'ON entries (hits, last_access)')
+            self._conn = conn
+            self._pid = pid
+        return self._conn
+
+    def _key(self, fpath):
+        dpath, fname = os.path.split(os.path.abspath(fpath))
+        if normpath(dpath) != normpath(os.path.abspath(self.dpath)):
+            raise ValueError('{} is not in {}'.format(fpath, self.dpath))
+        return fname
+
+    def _entry_nbytes(self, fname):
+        nbytes = 0
+        for suffix in ('',) + self._SIDECAR_SUFFIXES:
+            try:
+                nbytes += os.stat(join(self.dpath, fname + suffix)).st_size
+            except FileNotFoundError:
+                pass
+        return nbytes
+
+    def add(self, fpath):
+        """
+        Record that an entry was written or rewritten.
+
+        Args:
+            fpath (str | PathLike): path to the data file in this directory
+        """
+        import time
+        fname = self._key(fpath)
+        nbytes = self._entry_nbytes(fname)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute(
+                    'INSERT OR IGNORE INTO entries (fname, nbytes, created, '
+                    'last_access, hits) VALUES (?, ?, ?, ?, 0)',
+                    (fname, nbytes, now, now))
+                conn.execute(
+                    'UPDATE entries SET nbytes=?, last_access=? '
+                    'WHERE fname=?', (nbytes, now, fname))
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+
+    def touch(self, fpath):
+        """
+        Record that an entry was accessed.
+
+        Args:
+            fpath (str | PathLike): path to the data file in this directory
+        """
+        import time
+        fname = self._key(fpath)
+        with self._lock:
+            conn = self._connect()
+            cur = conn.execute(
+                'UPDATE entries SET last_access=?, hits=hits + 1 '
+                'WHERE fname=?', (time.time(), fname))
+        if cur.rowcount == 0:
+            # The entry was written without a CacheDir
+            self.add(fpath)
+
+    def discard(self, fpath):
+        """
+        Forget about an entry (the files are not removed).
+
+        Args:
+            fpath (str | PathLike): path to the data file in this directory
+        """
+        fname = self._key(fpath)
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM entries WHERE fname=?', (fname,))
+
+    def scan(self):
+        """
+        Synchronizes the index with the files on disk. Untracked data files
+        written by a :class:`Cacher` (i.e. those with a ``.meta`` file) are
+        added using their modification time as their last access time, and
+        entries whose files were removed are forgotten. Any other file in the
+        directory is ignored.
+
+        Returns:
+            int: the number of entries in the index
+        """
+        fnames = set(os.listdir(self.dpath))
+        with self._lock:
+            conn = self._connect()
+            known = {row[0] for row in conn.execute(
+                'SELECT fname FROM entries')}
+        on_disk = {}
+        for fname in fnames:
+            if fname.startswith(self.INDEX_FNAME):
+                continue
+            if fname.endswith(self._IGNORE_SUFFIXES):
+                continue
+            if fname not in known and fname + '.meta' not in fnames:
+                # Only index files that a Cacher wrote
+                continue
+            fpath = join(self.dpath, fname)
+            try:
+                stat = os.stat(fpath)
+            except FileNotFoundError:  # nocover
+                continue
+            if os.path.isdir(fpath):
+                continue
+            on_disk[fname] = stat.st_mtime
+        with self._lock:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                known = {row[0] for row in conn.execute(
+                    'SELECT fname FROM entries')}
+                conn.executemany('DELETE FROM entries WHERE fname=?',
+                                 [(f,) for f in known - set(on_disk)])
+                conn.executemany(
+                    'INSERT INTO entries (fname, nbytes, created, '
+                    'last_access, hits) VALUES (?, ?, ?, ?, 0)',
+                    [(f, self._entry_nbytes(f), on_disk[f], on_disk[f])
+                     for f in set(on_disk) - known])
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            num = conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        return num
+
+    def entries(self):
+        """
+        Returns:
+            List[Dict]: information about each indexed entry, starting with
+            the first candidate for eviction.
+        """
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                'SELECT fname, nbytes, created, last_access, hits FROM '
+                'entries ORDER BY ' + self._order_by()).fetchall()
+        keys = ['fname', 'nbytes', 'created', 'last_access', 'hits']
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _order_by(self):
+        if self.policy == 'lfu':
+            return 'hits ASC, last_access ASC'
+        else:
+            return 'last_access ASC'
+
+    def evict(self, keep=None, dry=False):
+        """
+        Removes entries that violate the limits of this cache directory.
+
+        Args:
+            keep (Iterable[str | PathLike] | None):
+                data files that should not be evicted (e.g. the entry that was
+                just written).
+
+            dry (bool):
+                if True, only report which entries would be removed.
+
+        Returns:
+            List[str]: the paths of the evicted data files
+        """
+        import time
+        if self.max_bytes is None and self.max_entries is None and \
+                self.max_age is None:
+            return []
+        keep = set() if keep is None else {self._key(p) for p in keep}
+        order_by = self._order_by()
+        victims = {}
+        with self._lock:
+            conn = self._connect()
+            # Check the totals first, so saves into a cache that is within
+            # its limits do not need to look at every entry.
+            num_entries, total_bytes, oldest = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(nbytes), 0), '
+                'MIN(last_access) FROM entries').fetchone()
+            num_excess = 0
+            if self.max_entries is not None:
+                num_excess = num_entries - self.max_entries
+            bytes_excess = 0
+            if self.max_bytes is not None:
+                bytes_excess = total_bytes - self.max_bytes
+
+            if self.max_age is not None and oldest is not None:
+                min_access = time.time() - self.max_age
+                if oldest < min_access:
+                    rows = conn.execute(
+                        'SELECT fname, nbytes FROM entries '
+                        'WHERE last_access < ? ORDER BY ' + order_by,
+                        (min_access,))
+                    for fname, nbytes in rows:
+                        if fname not in keep:
+                            victims[fname] = nbytes
+                            num_excess -= 1
+                            bytes_excess -= nbytes
+
+            if num_excess > 0 or bytes_excess > 0:
+                query = 'SELECT fname, nbytes FROM entries ORDER BY ' + order_by
+                params = ()
+                if bytes_excess <= 0:
+                    # Exactly this many rows are needed, skipping the kept
+                    # entries and the ones that are already victims.
+                    query += ' LIMIT ?'
+                    params = (num_excess + len(keep) + len(victims),)
+                # Rows are read lazily, so this stops after the last victim
+                for fname, nbytes in conn.execute(query, params):
+                    if num_excess <= 0 and bytes_excess <= 0:
+                        break
+                    if fname in keep or fname in victims:
+                        continue
+                    victims[fname] = nbytes
+                    num_excess -= 1
+                    bytes_excess -= nbytes
+
+        evicted = [join(self.dpath, fname) for fname in victims]
+        if not dry and victims:
+            for fname in victims:
+                for suffix in ('',) + self._SIDECAR_SUFFIXES:
+                    try:
+                        os.remove(join(self.dpath, fname + suffix))
+                    except FileNotFoundError:
+                        pass
+            with self._lock:
+                conn = self._connect()
+                conn.executemany('DELETE FROM entries WHERE fname=?',
+                                 [(f,) for f in victims])
+        return evicted
+
+    def usage(self):
+        """
+        Summarizes the contents of the cache directory.
+
+        Returns:
+            Dict[str, object]
+        """
+        import time
+        with self._lock:
+            conn = self._connect()
+            num, nbytes, oldest = conn.execute(
+                'SELECT COUNT(*), SUM(nbytes), MIN(last_access) '
+                'FROM entries').fetchone()
+        usage = {
+            'dpath': self.dpath,
+            'num_entries': num,
+            'total_bytes': nbytes or 0,
+            'total_size': _byte_str(nbytes or 0),
+            'oldest_access_age': (
+                None if oldest is None else time.time() - oldest),
+            'max_bytes': self.max_bytes,
+            'max_entries': self.max_entries,
+            'max_age': self.max_age,
+            'policy': self.policy,
+        }
+        return usage
+
+    def __len__(self):
+        with self._lock:
+            conn = self._connect()
+            return conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+
+def _main(argv=None):
+    """
+    Reports (and optionally limits) the usage of a cache directory. Only
+    files written by :class:`Cacher` are considered.
+
+    Args:
+        argv (List[str] | None):
+            command line arguments, e.g. ``[dpath, '--max_bytes=1000',
+            '--evict']``. Defaults to ``sys.argv[1:]``.
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_cache import _main
+        >>> dpath = ub.Path.appdir('ubelt/tests/cache-dir-cli').delete().ensuredir()
+        >>> for idx in range(3):
+        >>>     ub.Cacher('data', depends=[idx], dpath=dpath).save(idx)
+        >>> (dpath / 'download.zip').write_text('not a cache entry')
+        >>> _main([str(dpath), '--max_entries=1', '--evict'])
+        >>> assert len(list(dpath.glob('*.pkl'))) == 1
+        >>> assert (dpath / 'download.zip').exists()
+    """
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='python -m ubelt.util_cache',
+        description='Report and limit the usage of a ubelt cache directory')
+    parser.add_argument('dpath', help='the cache directory')
+    parser.add_argument('--max_bytes', type=int, default=None)
+    parser.add_argument('--max_entries', type=int, default=None)
+    parser.add_argument('--max_age', type=float, default=None,
+                        help='in seconds')
+    parser.add_argument('--policy', default='lru', choices=['lru', 'lfu'])
+    parser.add_argument('--evict', action='store_true',
+                        help='remove entries that exceed the limits')
+    args = parser.parse_args(argv)
+    from ubelt.util_format import repr2
+    cache_dir = CacheDir(args.dpath, max_bytes=args.max_bytes,
+                         max_entries=args.max_entries, max_age=args.max_age,
+                         policy=args.policy)
+    cache_dir.scan()
+    evicted = cache_dir.evict(dry=not args.evict)
+    print(repr2(cache_dir.usage(), nl=1, sort=0))
+    if evicted:
+        action = 'evicted' if args.evict else 'would evict'
+        print('{} {} entries'.format(action, len(evicted)))
+
+
 def _byte_str(num, unit='auto', precision=2):
     """
     Automatically chooses relevant unit (KB, MB, or GB) for displaying some
@@ -2,8 +2,13 @@ from typing import Union
 from os import PathLike
 from typing import Callable
 from typing import Sequence
+from typing import Iterable
+from typing import List
+from typing import Dict
+import datetime
 from _typeshed import Incomplete
 from collections.abc import Generator
+from ubelt.util_hash import FileHashCache
 
 
 class Cacher:
@@ -21,6 +26,9 @@ class Cacher:
     hasher: Incomplete
     log: Incomplete
     backend: Incomplete
+    compress: Incomplete
+    lock: Incomplete
+    cache_dir: Incomplete
 
     def __init__(self,
                  fname,
@@ -35,7 +43,10 @@ class Cacher:
                  hasher: str = ...,
                  protocol: int = ...,
                  cfgstr: Incomplete | None = ...,
-                 backend: str = ...) -> None:
+                 backend: str = ...,
+                 compress: Union[str, None] = None,
+                 lock: Union[bool, float] = False,
+                 cache_dir: Union[CacheDir, None] = None) -> None:
         ...
 
     @property
@@ -65,9 +76,33 @@ class Cacher:
     def save(self, data: object, cfgstr: Union[str, None] = None) -> None:
         ...
 
+    @staticmethod
+    def register_backend(name: str,
+                         dump: Callable,
+                         load: Callable,
+                         stream: bool = True,
+                         binary: bool = True) -> None:
+        ...
+
     def ensure(self, func: Callable, *args, **kwargs):
         ...
 
+    async def atryload(self,
+                       cfgstr: Union[str, None] = None,
+                       on_error: str = 'raise') -> None | object:
+        ...
+
+    async def aload(self, cfgstr: Union[str, None] = None) -> object:
+        ...
+
+    async def asave(self,
+                    data: object,
+                    cfgstr: Union[str, None] = None) -> None:
+        ...
+
+    async def aensure(self, func: Callable, *args, **kwargs):
+        ...
+
     def __call__(self, func: Callable):
         ...
 
@@ -77,7 +112,11 @@ class CacheStamp:
     product: Incomplete
     hasher: Incomplete
     expires: Incomplete
+    verify: str
+    verify_rate: float
+    hash_workers: int
     hash_prefix: Incomplete
+    hash_cache: Incomplete
 
     def __init__(self,
                  fname,
@@ -91,7 +130,12 @@ class CacheStamp:
                  meta: Incomplete | None = ...,
                  hash_prefix: Incomplete | None = ...,
                  expires: Incomplete | None = ...,
-                 ext: str = ...) -> None:
+                 ext: str = ...,
+                 hash_cache: Union[bool, FileHashCache] = ...,
+                 cache_dir: Union[CacheDir, None] = ...,
+                 verify: str = 'hash',
+                 verify_rate: float = 0.0,
+                 hash_workers: int = 0) -> None:
         ...
 
     @property
@@ -113,3 +157,46 @@ class CacheStamp:
               cfgstr: Incomplete | None = ...,
               product: Incomplete | None = ...) -> dict:
         ...
+
+
+class CacheDir:
+    INDEX_FNAME: str
+    dpath: str
+    max_bytes: Union[int, None]
+    max_entries: Union[int, None]
+    max_age: Union[float, None]
+    policy: str
+
+    def __init__(self,
+                 dpath: Union[str, PathLike],
+                 max_bytes: Union[int, None] = None,
+                 max_entries: Union[int, None] = None,
+                 max_age: Union[float, datetime.timedelta, None] = None,
+                 policy: str = 'lru') -> None:
+        ...
+
+    def add(self, fpath: Union[str, PathLike]) -> None:
+        ...
+
+    def touch(self, fpath: Union[str, PathLike]) -> None:
+        ...
+
+    def discard(self, fpath: Union[str, PathLike]) -> None:
+        ...
+
+    def scan(self) -> int:
+        ...
+
+    def entries(self) -> List[Dict]:
+        ...
+
+    def evict(self,
+              keep: Union[Iterable[Union[str, PathLike]], None] = None,
+              dry: bool = False) -> List[str]:
+        ...
+
+    def usage(self) -> Dict[str, object]:
+        ...
+
+    def __len__(self) -> int:
+        ...
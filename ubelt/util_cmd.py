@@ -31,10 +31,13 @@ Example:
         'ret': 0,
     }
 """
+import collections
 import sys
 import os
+import time
+from functools import partial
 
-__all__ = ['cmd']
+__all__ = ['cmd', 'cmd_iter', 'cmd_many', 'CmdQueue', 'acmd']
 
 POSIX = 'posix' in sys.builtin_module_names
 
@@ -46,44 +49,96 @@ else:  # nocover
 
 def _textio_iterlines(stream):
     """
-    Iterates over lines in a TextIO stream until an EOF is encountered.
-    This is the iterator version of stream.readlines()
+    Iterates over lines in a TextIO (or BinaryIO) stream until an EOF is
+    encountered. This is the iterator version of stream.readlines()
     """
     line = stream.readline()
-    while line != '':
+    while line:
         yield line
         line = stream.readline()
 
 
-def _proc_async_iter_stream(proc, stream, buffersize=1):
+def _binary_stream(stream):
+    """
+    Returns the binary buffer underlying a text stream (or the stream itself
+    if it is already binary)
+    """
+    return getattr(stream, 'buffer', stream)
+
+
+def _proc_async_iter_stream(proc, stream, buffersize=1, stop=None,
+                            stream_queue=None, key=None, read=None):
     """
     Reads output from a process in a separate thread
+
+    Args:
+        stop (threading.Event | None):
+            if set, the thread stops reading once its current read finishes,
+            even if nobody is consuming the queue.
+
+        stream_queue (queue.Queue | None):
+            an existing queue to put lines into, which lets multiple streams
+            share one queue. If unspecified a new queue is created.
+
+        key (Any | None):
+            if specified, items are put in the queue as ``(key, line)``
+            tuples, so lines from a shared queue can be told apart.
+
+        read (Callable[[], str | bytes] | None):
+            reads the next item from the stream. Defaults to
+            ``stream.readline``. An empty result indicates the end of the
+            stream.
     """
     import queue
     from threading import Thread
-    def enqueue_output(proc, stream, stream_queue):
-        while proc.poll() is None:
-            line = stream.readline()
-            # print('ENQUEUE LIVE {!r} {!r}'.format(stream, line))
-            stream_queue.put(line)
+    if read is None:
+        read = stream.readline
 
-        for line in _textio_iterlines(stream):
-            # print('ENQUEUE FINAL {!r} {!r}'.format(stream, line))
-            stream_queue.put(line)
+    def enqueue_output(proc, stream, stream_queue):
+        def _put(line):
+            item = line if key is None else (key, line)
+            while stop is None or not stop.is_set():
+                try:
+                    stream_queue.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        try:
+            while proc.poll() is None:
+                line = read()
+                # print('ENQUEUE LIVE {!r} {!r}'.format(stream, line))
+                if not _put(line):
+                    return
+
+            line = read()
+            while line:
+                # print('ENQUEUE FINAL {!r} {!r}'.format(stream, line))
+                if not _put(line):
+                    return
+                line = read()
+        except (ValueError, OSError):
+            # The stream was closed by the consumer
+            if stop is None or not stop.is_set():  # nocover
+                raise
+            return
 
         # print("STREAM IS DONE {!r}".format(stream))
-        stream_queue.put(None)  # signal that the stream is finished
+        _put(None)  # signal that the stream is finished
         # stream.close()
-    stream_queue = queue.Queue(maxsize=buffersize)
+    if stream_queue is None:
+        stream_queue = queue.Queue(maxsize=buffersize)
     _thread = Thread(target=enqueue_output, args=(proc, stream, stream_queue))
     _thread.daemon = True  # thread dies with the program
     _thread.start()
     return stream_queue
 
 
-def _proc_iteroutput_thread(proc):
+def _proc_iteroutput_thread(proc, timeout=None, buffersize=64,
+                            chunksize=None):
     """
-    Iterates over output from a process line by line
+    Iterates over output from a process line by line (or chunk by chunk)
 
     Note:
         WARNING. Current implementation might have bugs with other threads.
@@ -91,79 +146,123 @@ def _proc_iteroutput_thread(proc):
         sure if this was our bug or tqdm's. Newer versions of tqdm fix this,
         but I cannot guarantee that there isn't an issue on our end.
 
+    Args:
+        proc (subprocess.Popen): process with piped stdout and / or stderr
+
+        timeout (float | None): if the output is not exhausted within this
+            many seconds, raises :class:`subprocess.TimeoutExpired`.
+
+        buffersize (int): maximum number of items read ahead of the consumer
+
+        chunksize (int | None): if specified, instead of lines, yields the
+            raw bytes available in the underlying binary streams, up to this
+            many bytes at a time.
+
     Yields:
-        Tuple[str, str]: oline, eline: stdout and stderr line
+        Tuple[str | bytes | None, str | bytes | None]:
+            oline, eline: stdout and stderr line
 
     References:
         .. [SO_375427] https://stackoverflow.com/questions/375427/non-blocking-read-subproc
     """
     import queue
-
-    # Create threads that read stdout / stderr and queue up the output
-    stdout_queue = _proc_async_iter_stream(proc, proc.stdout)
-    stderr_queue = _proc_async_iter_stream(proc, proc.stderr)
-
-    stdout_live = True
-    stderr_live = True
-
-    # read from the output asynchronously until
-    while stdout_live or stderr_live:
-        if stdout_live:  # pragma: nobranch
-            try:
-                oline = stdout_queue.get_nowait()
-                stdout_live = oline is not None
-            except queue.Empty:
-                oline = None
-        if stderr_live:
-            try:
-                eline = stderr_queue.get_nowait()
-                stderr_live = eline is not None
-            except queue.Empty:
-                eline = None
-        if oline is not None or eline is not None:
-            yield oline, eline
-
-
-def _proc_iteroutput_select(proc):
+    import threading
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    # Create threads that read stdout / stderr and queue up the output.
+    # Both threads share one queue, so we can block on it instead of polling,
+    # which would starve the reader threads of the GIL.
+    stop = threading.Event()
+    output_queue = queue.Queue(maxsize=buffersize)
+    num_live = 0
+    for key, stream in enumerate([proc.stdout, proc.stderr]):
+        if stream is None:
+            # This stream was not piped
+            continue
+        read = None
+        if chunksize is not None:
+            read = partial(_binary_stream(stream).read1, chunksize)
+        _proc_async_iter_stream(proc, stream, stop=stop,
+                                stream_queue=output_queue, key=key,
+                                read=read)
+        num_live += 1
+
+    try:
+        # read from the output asynchronously until both streams finish
+        while num_live:
+            if deadline is None:
+                key, line = output_queue.get()
+            else:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining <= 0:
+                        raise queue.Empty
+                    key, line = output_queue.get(timeout=remaining)
+                except queue.Empty:
+                    import subprocess
+                    raise subprocess.TimeoutExpired(proc.args, timeout) from None
+            if line is None:
+                num_live -= 1
+            elif key == 0:
+                yield line, None
+            else:
+                yield None, line
+    finally:
+        # Let the reader threads exit if we stopped early
+        stop.set()
+
+
+def _proc_iteroutput_select(proc, timeout=None):
     """
     Iterates over output from a process line by line
 
     UNIX only. Use :func:`_proc_iteroutput_thread` instead for a cross platform
     solution based on threads.
 
+    Args:
+        proc (subprocess.Popen): process with piped stdout and / or stderr
+
+        timeout (float | None): if the process does not finish within this
+            many seconds, raises :class:`subprocess.TimeoutExpired`.
+
     Yields:
-        Tuple[str, str]: oline, eline: stdout and stderr line
+        Tuple[str | bytes | None, str | bytes | None]:
+            oline, eline: stdout and stderr line
     """
     from itertools import zip_longest
+    deadline = None if timeout is None else time.monotonic() + timeout
+    streams = [stream for stream in [proc.stdout, proc.stderr]
+               if stream is not None]
     # Read output while the external program is running
     while proc.poll() is None:
-        reads = [proc.stdout.fileno(), proc.stderr.fileno()]
-        ret = select.select(reads, [], [])
+        reads = [stream.fileno() for stream in streams]
+        if deadline is None:
+            ret = select.select(reads, [], [])
+        else:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                import subprocess
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            ret = select.select(reads, [], [], remaining)
         oline = eline = None
         for fd in ret[0]:
-            if fd == proc.stdout.fileno():
+            if proc.stdout is not None and fd == proc.stdout.fileno():
                 oline = proc.stdout.readline()
-            if fd == proc.stderr.fileno():
+            if proc.stderr is not None and fd == proc.stderr.fileno():
                 eline = proc.stderr.readline()
         yield oline, eline
 
     # Grab any remaining data in stdout and stderr after the process finishes
-    oline_iter = _textio_iterlines(proc.stdout)
-    eline_iter = _textio_iterlines(proc.stderr)
+    oline_iter = [] if proc.stdout is None else _textio_iterlines(proc.stdout)
+    eline_iter = [] if proc.stderr is None else _textio_iterlines(proc.stderr)
     for oline, eline in zip_longest(oline_iter, eline_iter):
         yield oline, eline
 
 
-def _tee_output(proc, stdout=None, stderr=None, backend='thread',
-                timeout=None):
+def _rectify_tee_backend(backend):
     """
-    Simultaneously reports and captures stdout and stderr from a process
-
-    subprocess must be created using (stdout=subprocess.PIPE,
-    stderr=subprocess.PIPE)
+    Returns the line iterator function for a tee backend
     """
-    logged_out = []
-    logged_err = []
     if backend == 'auto':
         # backend = 'select' if POSIX else 'thread'
         backend = 'thread'
@@ -180,25 +279,367 @@ def _tee_output(proc, stdout=None, stderr=None, backend='thread',
         # The value of "backend" should be checked before we create the
         # processes, otherwise we will have a dangling process
         raise AssertionError('Validate "backend" before creating the proc')
+    return _proc_iteroutput
+
+
+class _CaptureBuffer(object):
+    """
+    Accumulates the text (or bytes) written to a stream while holding at most
+    ``max_size`` characters (or bytes) in memory.
+
+    When ``max_size`` is exceeded the oldest text is dropped, so
+    :func:`getvalue` returns the tail of the stream. If ``overflow`` is
+    "spill", everything is also written to a temporary file, which
+    preserves the full output on disk.
+
+    Args:
+        max_size (int | None): maximum number of characters to keep in
+            memory. If None, everything is kept.
+
+        overflow (str): either "tail" or "spill"
+
+        name (str): used to name the spill file
+
+        text (bool): if False, the stream is bytes instead of text
+
+    Example:
+        >>> from ubelt.util_cmd import _CaptureBuffer
+        >>> buf = _CaptureBuffer(max_size=8)
+        >>> for idx in range(5):
+        ...     buf.append('line{}\\n'.format(idx))
+        >>> buf.getvalue()
+        '3\\nline4\\n'
+        >>> buf.truncated
+        True
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_cmd import _CaptureBuffer
+        >>> buf = _CaptureBuffer(max_size=8, overflow='spill')
+        >>> for idx in range(5):
+        ...     buf.append('line{}\\n'.format(idx))
+        >>> buf.close()
+        >>> ub.Path(buf.fpath).read_text().splitlines()
+        ['line0', 'line1', 'line2', 'line3', 'line4']
+        >>> ub.Path(buf.fpath).delete()
+    """
+
+    def __init__(self, max_size=None, overflow='tail', name='out',
+                 text=True):
+        self.max_size = max_size
+        self.overflow = overflow
+        self.name = name
+        self.text = text
+        self.parts = collections.deque()
+        self.size = 0
+        self.truncated = False
+        self.fpath = None
+        self._file = None
+
+    def append(self, text):
+        """
+        Args:
+            text (str | bytes): new text from the stream
+        """
+        self.parts.append(text)
+        self.size += len(text)
+        if self._file is not None:
+            self._file.write(text)
+        if self.max_size is not None and self.size > self.max_size:
+            if self.overflow == 'spill' and self._file is None:
+                self._start_spill()
+            # Drop whole parts that are no longer needed to cover the tail
+            parts = self.parts
+            while parts and self.size - len(parts[0]) >= self.max_size:
+                self.size -= len(parts.popleft())
+            self.truncated = True
+
+    def _start_spill(self):
+        import tempfile
+        if self.text:
+            kw = {'mode': 'w', 'encoding': 'utf8', 'suffix': '.txt'}
+        else:
+            kw = {'mode': 'wb', 'suffix': '.bin'}
+        self._file = tempfile.NamedTemporaryFile(
+            prefix='ubelt_cmd_{}_'.format(self.name), delete=False, **kw)
+        self.fpath = self._file.name
+        self._file.writelines(self.parts)
+
+    def getvalue(self):
+        """
+        Returns:
+            str | bytes:
+                the captured text (or its tail if the limit was exceeded)
+        """
+        text = ('' if self.text else b'').join(self.parts)
+        if self.max_size is not None and len(text) > self.max_size:
+            text = text[len(text) - self.max_size:]
+        return text
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _kill_proc_tree(proc, group=False):
+    """
+    Forcefully stops a process.
+
+    Args:
+        proc (subprocess.Popen | asyncio.subprocess.Process):
+            the process to kill
+
+        group (bool): if True, the process was started with
+            ``start_new_session=True`` and its entire process group is killed,
+            which includes any children it spawned. Only used on POSIX.
+    """
+    if group and POSIX:
+        import signal
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):  # nocover
+            pass
+        return
+    if hasattr(proc, 'poll'):
+        running = proc.poll() is None
+    else:
+        # asyncio processes update their returncode in the event loop
+        running = proc.returncode is None
+    if running:
+        if sys.platform.startswith('win32'):  # nocover
+            # taskkill is the only builtin way to kill the tree on windows
+            import subprocess
+            subprocess.call(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+        else:
+            proc.kill()
+
+
+def _newline_decoder(stream):
+    """
+    Returns an incremental decoder for the bytes underlying a text stream,
+    which decodes them the same way the text stream would.
+
+    Args:
+        stream (io.TextIOWrapper): a text stream
+
+    Returns:
+        io.IncrementalNewlineDecoder
+    """
+    import codecs
+    import io
+    decoder = codecs.getincrementaldecoder(stream.encoding)(stream.errors)
+    return io.IncrementalNewlineDecoder(decoder, translate=True)
+
+
+def _tee_writer(stream, text=True):
+    """
+    Returns a function that writes output to a stream and flushes it
+
+    Args:
+        stream (TextIO | None): the stream to write to
+
+        text (bool): if False, the output is bytes, which is written to the
+            binary buffer of the stream if it has one.
+
+    Returns:
+        Callable[[str | bytes], None] | None
+    """
+    if stream is None:
+        return None
+    if text:
+        def write(data):
+            stream.write(data)
+            stream.flush()
+    else:
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is None:
+            # The stream has been replaced by a pure text stream (e.g. when
+            # using CaptureStdout), so show it what we can.
+            def write(data):
+                stream.write(data.decode('utf8', errors='replace'))
+                stream.flush()
+        else:
+            def write(data):
+                stream.flush()
+                buffer.write(data)
+                buffer.flush()
+    return write
+
+
+def _tee_output(proc, stdout=None, stderr=None, backend='thread',
+                timeout=None, logged_out=None, logged_err=None,
+                chunksize=65536):
+    """
+    Simultaneously reports and captures stdout and stderr from a process
+
+    subprocess must be created using (stdout=subprocess.PIPE,
+    stderr=subprocess.PIPE). Either stream may instead be redirected
+    elsewhere, in which case it is ignored.
+
+    Args:
+        proc (subprocess.Popen): the running process
+
+        stdout (TextIO | None): stream to report stdout to
+
+        stderr (TextIO | None): stream to report stderr to
+
+        backend (str): "auto", "select", or "thread"
+
+        timeout (float | None): raises :class:`subprocess.TimeoutExpired` if
+            the output is not finished within this many seconds.
 
-    # TODO: handle timeout
-
-    for oline, eline in _proc_iteroutput(proc):
-        if oline:
-            if stdout:  # pragma: nobranch
-                stdout.write(oline)
-                stdout.flush()
-            logged_out.append(oline)
-        if eline:
-            if stderr:  # pragma: nobranch
-                stderr.write(eline)
-                stderr.flush()
-            logged_err.append(eline)
+        logged_out (_CaptureBuffer | None): captures stdout
+
+        logged_err (_CaptureBuffer | None): captures stderr
+
+        chunksize (int): The thread backend reads up to this many bytes at a
+            time as they become available instead of splitting the output
+            into lines.
+
+    Returns:
+        Tuple[subprocess.Popen, _CaptureBuffer, _CaptureBuffer]
+    """
+    import io
+    pipes = [proc.stdout, proc.stderr]
+    text = any(isinstance(pipe, io.TextIOBase) for pipe in pipes)
+    if logged_out is None:
+        logged_out = _CaptureBuffer(name='out', text=text)
+    if logged_err is None:
+        logged_err = _CaptureBuffer(name='err', text=text)
+    loggers = [logged_out, logged_err]
+    writers = [_tee_writer(stdout, text), _tee_writer(stderr, text)]
+
+    if backend == 'auto':
+        backend = 'thread'
+    if backend == 'thread':
+        # Read raw chunks and decode them ourselves, which avoids the overhead
+        # of handling each line in python.
+        output_iter = _proc_iteroutput_thread(proc, timeout=timeout,
+                                              chunksize=chunksize)
+        decoders = [_newline_decoder(pipe) if text and pipe is not None
+                    else None for pipe in pipes]
+    else:
+        _proc_iteroutput = _rectify_tee_backend(backend)
+        output_iter = _proc_iteroutput(proc, timeout=timeout)
+        decoders = [None, None]
+
+    handlers = list(zip(decoders, writers, loggers))
+
+    def _handle(data, decoder, write, logged, final=False):
+        if decoder is not None:
+            data = decoder.decode(data, final=final)
+        if data:
+            if write is not None:
+                write(data)
+            logged.append(data)
+
+    for items in output_iter:
+        for data, handler in zip(items, handlers):
+            if data:
+                _handle(data, *handler)
+
+    for handler in handlers:
+        if handler[0] is not None:
+            # flush any incomplete characters
+            _handle(b'', *handler, final=True)
     return proc, logged_out, logged_err
 
 
+def _rectify_redirect(dst):
+    """
+    Converts a user specified output destination to a value for
+    :class:`subprocess.Popen`.
+
+    Args:
+        dst (str | PathLike | int | IO | None): a path, a file descriptor,
+            a file object, or None to capture the output with a pipe.
+
+    Returns:
+        Tuple[int | IO, IO | None]:
+            The value to pass to Popen and the file object we opened (if any),
+            which should be closed after the process is started.
+    """
+    import subprocess
+    if dst is None:
+        return subprocess.PIPE, None
+    if isinstance(dst, int) or hasattr(dst, 'fileno'):
+        return dst, None
+    fh = open(dst, 'wb')
+    return fh, fh
+
+
+def _resolve_command(command, shell=False):
+    """
+    Converts a command to the text used for display and the args given to
+    :class:`subprocess.Popen`.
+
+    Args:
+        command (str | List[str]): command text or tuple of args
+
+        shell (bool): if the command will be run in a shell
+
+    Returns:
+        Tuple[str, str | List[str]]: command_text, args
+    """
+    # Determine if command is specified as text or a tuple
+    if isinstance(command, str):
+        command_text = command
+        command_tup = None
+    else:
+        import pipes
+        command_tup = command
+        command_text = ' '.join(list(map(pipes.quote, command_tup)))
+
+    if shell or sys.platform.startswith('win32'):
+        # When shell=True, args is sent to the shell (e.g. bin/sh) as text
+        args = command_text
+    else:
+        # When shell=False, args is a list of executable and arguments
+        if command_tup is None:
+            # parse this out of the string
+            # NOTE: perhaps use the solution from [3] here?
+            import shlex
+            command_tup = shlex.split(command_text)
+            # command_tup = shlex.split(command_text, posix=not WIN32)
+        args = command_tup
+    return command_text, args
+
+
+def _print_cmd_start(command_text, cwd=None, verbose=2):
+    """
+    Prints the command as if it was typed into a terminal
+    """
+    import platform
+    import getpass
+    from ubelt import shrinkuser
+    if verbose > 2:
+        try:
+            print('┌─── START CMD ───')
+        except Exception:  # nocover
+            print('+=== START CMD ===')
+    cwd_ = os.getcwd() if cwd is None else cwd
+    compname = platform.node()
+    username = getpass.getuser()
+    cwd_ = shrinkuser(cwd_)
+    ps1 = '[ubelt.cmd] {}@{}:{}$ '.format(username, compname, cwd_)
+    print(ps1 + command_text)
+
+
+def _print_cmd_end():
+    # https://en.wikipedia.org/wiki/Box-drawing_character
+    try:
+        print('└─── END CMD ───')
+    except Exception:  # nocover
+        print('L___ END CMD ___')
+
+
 def cmd(command, shell=False, detach=False, verbose=0, tee=None, cwd=None,
-        env=None, tee_backend='auto', check=False, system=False, timeout=None):
+        env=None, tee_backend='auto', check=False, system=False, timeout=None,
+        max_capture=None, overflow='tail', text=True, stdout=None,
+        stderr=None):
     """
     Executes a command in a subprocess.
 
@@ -248,6 +689,39 @@ def cmd(command, shell=False, detach=False, verbose=0, tee=None, cwd=None,
         timeout (float):
             If the process does not complete in `timeout` seconds, raises a
             :class:`subprocess.TimeoutExpired`. (new in version 1.1.0)
+            The timeout is also enforced while the output is tee-ed. On POSIX
+            the command runs in its own process group, which is killed along
+            with any children when the timeout expires.
+
+        max_capture (int | None):
+            If specified, at most this many characters of stdout and stderr
+            are held in memory. Output is streamed instead of buffered by
+            :func:`subprocess.Popen.communicate`, and only the tail of each
+            stream is returned in the info dict.
+
+        overflow (str, default='tail'):
+            What to do with output beyond ``max_capture``. Either "tail",
+            which discards it, or "spill", which writes the full output of
+            each stream to a temporary file whose path is returned as
+            ``info['out_fpath']`` and ``info['err_fpath']`` (None if the
+            stream never exceeded ``max_capture``). The caller is responsible
+            for deleting these files.
+
+        text (bool, default=True):
+            if False, the output is captured as bytes instead of being decoded
+            as text. When tee-ed, the bytes are written to the binary buffer of
+            :data:`sys.stdout`.
+
+        stdout (str | PathLike | int | IO | None):
+            If specified, the standard output is written directly to this
+            file path, file descriptor, or file object instead of being
+            captured, and ``info['out']`` is None. This lets a command
+            produce more output than would fit in memory without python
+            handling any of it.
+
+        stderr (str | PathLike | int | IO | None):
+            Like ``stdout``, but for standard error. This can also be
+            :data:`subprocess.STDOUT` to merge it into standard output.
 
     Returns:
         dict:
@@ -348,30 +822,46 @@ def cmd(command, shell=False, detach=False, verbose=0, tee=None, cwd=None,
         >>> info = ub.cmd('echo hi', check=True, system=True)
         >>> with pytest.raises(subprocess.CalledProcessError):
         >>>     ub.cmd('exit 1', check=True, shell=True)
+
+    Example:
+        >>> # Bound the memory used to capture chatty commands
+        >>> import sys
+        >>> import ubelt as ub
+        >>> command = [sys.executable, '-c', 'for i in range(1000): print(i)']
+        >>> info = ub.cmd(command, max_capture=8)
+        >>> assert info['out'].splitlines() == ['998', '999']
+        >>> info = ub.cmd(command, max_capture=8, overflow='spill')
+        >>> fpath = ub.Path(info['out_fpath'])
+        >>> assert len(fpath.read_text().splitlines()) == 1000
+        >>> fpath.delete()
+
+    Example:
+        >>> # Timeouts kill the process and report partial output
+        >>> import sys
+        >>> import pytest
+        >>> import subprocess
+        >>> import ubelt as ub
+        >>> command = [sys.executable, '-c', 'import time; print("a", flush=True); time.sleep(100)']
+        >>> with pytest.raises(subprocess.TimeoutExpired) as ex:
+        >>>     ub.cmd(command, timeout=1, tee=True)
+        a
+        >>> assert ex.value.output == 'a' + chr(10)
+
+    Example:
+        >>> # Binary output and writing output directly to a file
+        >>> import sys
+        >>> import ubelt as ub
+        >>> code = 'import sys; sys.stdout.buffer.write(bytes(range(256)))'
+        >>> info = ub.cmd([sys.executable, '-c', code], text=False)
+        >>> assert info['out'] == bytes(range(256))
+        >>> dpath = ub.Path.appdir('ubelt/tests/cmd').ensuredir()
+        >>> fpath = dpath / 'out.bin'
+        >>> info = ub.cmd([sys.executable, '-c', code], stdout=fpath)
+        >>> assert info['out'] is None
+        >>> assert fpath.read_bytes() == bytes(range(256))
     """
     import subprocess
-    # TODO: stdout, stderr - experimental - custom file to pipe stdout/stderr to
-    # Determine if command is specified as text or a tuple
-    if isinstance(command, str):
-        command_text = command
-        command_tup = None
-    else:
-        import pipes
-        command_tup = command
-        command_text = ' '.join(list(map(pipes.quote, command_tup)))
-
-    if shell or sys.platform.startswith('win32'):
-        # When shell=True, args is sent to the shell (e.g. bin/sh) as text
-        args = command_text
-    else:
-        # When shell=False, args is a list of executable and arguments
-        if command_tup is None:
-            # parse this out of the string
-            # NOTE: perhaps use the solution from [3] here?
-            import shlex
-            command_tup = shlex.split(command_text)
-            # command_tup = shlex.split(command_text, posix=not WIN32)
-        args = command_tup
+    command_text, args = _resolve_command(command, shell)
 
     if tee is None:
         tee = verbose > 0
@@ -379,28 +869,31 @@ def cmd(command, shell=False, detach=False, verbose=0, tee=None, cwd=None,
     if tee and tee_backend not in {'auto', 'thread', 'select'}:
         raise ValueError('tee_backend must be select, thread, or auto')
 
+    if overflow not in {'tail', 'spill'}:
+        raise ValueError('overflow must be tail or spill')
+
     if verbose > 1:
-        import platform
-        import getpass
-        from ubelt import shrinkuser
-        if verbose > 2:
-            try:
-                print('┌─── START CMD ───')
-            except Exception:  # nocover
-                print('+=== START CMD ===')
-        cwd_ = os.getcwd() if cwd is None else cwd
-        compname = platform.node()
-        username = getpass.getuser()
-        cwd_ = shrinkuser(cwd_)
-        ps1 = '[ubelt.cmd] {}@{}:{}$ '.format(username, compname, cwd_)
-        print(ps1 + command_text)
+        _print_cmd_start(command_text, cwd, verbose)
+
+    # A process that can time out gets its own process group, so it can be
+    # killed along with any children it spawned.
+    new_session = POSIX and timeout is not None and not detach
 
     # Create a new process to execute the command
     def make_proc():
         # delay the creation of the process until we validate all args
-        proc = subprocess.Popen(args, stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE, shell=shell,
-                                universal_newlines=True, cwd=cwd, env=env)
+        stdout_, stdout_fh = _rectify_redirect(stdout)
+        stderr_, stderr_fh = _rectify_redirect(stderr)
+        try:
+            proc = subprocess.Popen(args, stdout=stdout_, stderr=stderr_,
+                                    shell=shell, universal_newlines=text,
+                                    cwd=cwd, env=env,
+                                    start_new_session=new_session)
+        finally:
+            # The process has its own handle to any file we opened
+            for fh in [stdout_fh, stderr_fh]:
+                if fh is not None:
+                    fh.close()
         return proc
 
     if system:
@@ -416,27 +909,51 @@ def cmd(command, shell=False, detach=False, verbose=0, tee=None, cwd=None,
         if verbose > 0:  # nocover
             print('...detaching')
     else:
-        if tee:
+        stream = tee or max_capture is not None
+        if stream:
             # We logging stdout and stderr, while simulaniously piping it to
-            # another stream.
-            stdout = sys.stdout
-            stderr = sys.stderr
-            proc = make_proc()
-            proc, logged_out, logged_err = _tee_output(proc, stdout, stderr,
-                                                       backend=tee_backend,
-                                                       timeout=timeout)
-            try:
-                out = ''.join(logged_out)
-            except UnicodeDecodeError:  # nocover
-                out = '\n'.join(_.decode('utf-8') for _ in logged_out)
-            try:
-                err = ''.join(logged_err)
-            except UnicodeDecodeError:  # nocover
-                err = '\n'.join(_.decode('utf-8') for _ in logged_err)
-            (out_, err_) = proc.communicate(timeout=timeout)
-        else:
-            proc = make_proc()
-            (out, err) = proc.communicate(timeout=timeout)
+            # another stream (if tee is True).
+            tee_out = sys.stdout if tee else None
+            tee_err = sys.stderr if tee else None
+            logged_out = _CaptureBuffer(max_capture, overflow, name='out',
+                                        text=text)
+            logged_err = _CaptureBuffer(max_capture, overflow, name='err',
+                                        text=text)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        proc = make_proc()
+        try:
+            if stream:
+                _tee_output(proc, tee_out, tee_err, backend=tee_backend,
+                            timeout=timeout, logged_out=logged_out,
+                            logged_err=logged_err)
+                out = None if proc.stdout is None else logged_out.getvalue()
+                err = None if proc.stderr is None else logged_err.getvalue()
+                remaining = (None if deadline is None else
+                             max(deadline - time.monotonic(), 0))
+                (out_, err_) = proc.communicate(timeout=remaining)
+            else:
+                (out, err) = proc.communicate(timeout=timeout)
+        except BaseException as ex:
+            # Dont leave the process (or its children) running
+            _kill_proc_tree(proc, group=new_session)
+            if stream:
+                proc.wait()
+                if new_session:
+                    # The entire group is dead, so the reader threads will
+                    # reach the end of the pipes and we can close them.
+                    for pipe in [proc.stdout, proc.stderr]:
+                        if pipe is not None:
+                            pipe.close()
+            else:
+                proc.communicate()
+            if stream and isinstance(ex, subprocess.TimeoutExpired):
+                ex.output = logged_out.getvalue()
+                ex.stderr = logged_err.getvalue()
+            raise
+        finally:
+            if stream:
+                logged_out.close()
+                logged_err.close()
         # calling wait means that the process will terminate and it is safe to
         # return a reference to the process object.
         ret = proc.wait()
@@ -448,17 +965,567 @@ def cmd(command, shell=False, detach=False, verbose=0, tee=None, cwd=None,
             'cwd': cwd,
             'command': command_text
         }
+        if stream and overflow == 'spill':
+            info['out_fpath'] = logged_out.fpath
+            info['err_fpath'] = logged_err.fpath
 
     if not detach:
         if verbose > 2:
-            # https://en.wikipedia.org/wiki/Box-drawing_character
-            try:
-                print('└─── END CMD ───')
-            except Exception:  # nocover
-                print('L___ END CMD ___')
+            _print_cmd_end()
 
         if check:
             if info['ret'] != 0:
                 raise subprocess.CalledProcessError(
                     info['ret'], info['command'], info['out'], info['err'])
     return info
+
+
+def cmd_iter(command, shell=False, cwd=None, env=None, timeout=None,
+             check=False, tee_backend='auto'):
+    """
+    Executes a command in a subprocess and yields its output as it arrives.
+
+    Unlike :func:`cmd`, the output is not accumulated, so this is suitable for
+    commands that produce more output than fits in memory.
+
+    Args:
+        command (str | List[str]): bash-like command string or tuple of
+            executable and args
+
+        shell (bool, default=False): if True, process is run in shell.
+
+        cwd (str | PathLike | None):
+            Path to run command. Defaults to current working directory if
+            unspecified.
+
+        env (Dict[str, str] | None): environment passed to Popen
+
+        timeout (float | None):
+            If the process does not complete in `timeout` seconds, it is killed
+            and :class:`subprocess.TimeoutExpired` is raised.
+
+        check (bool, default=False): if True, raise a
+            :class:`subprocess.CalledProcessError` after the output is
+            exhausted if the return code was not zero.
+
+        tee_backend (str, default='auto'): backend used to read the output.
+            Valid choices are: "auto", "select" (POSIX only), and "thread".
+
+    Yields:
+        Tuple[str, str]: the stream the line was written to (either "out" or
+            "err") and the line itself, including its newline.
+
+    Note:
+        If the generator is closed before the output is exhausted (e.g. by
+        breaking out of a for loop), the process is killed. On POSIX the
+        command runs in its own process group, so any children it spawned are
+        killed as well.
+
+    Example:
+        >>> import ubelt as ub
+        >>> for name, line in ub.cmd_iter('echo hello'):
+        ...     print('{}: {}'.format(name, line.strip()))
+        out: hello
+
+    Example:
+        >>> # Stopping early kills the process
+        >>> import sys
+        >>> import ubelt as ub
+        >>> command = [sys.executable, '-c', ub.codeblock(
+        ...     '''
+        ...     import itertools
+        ...     for i in itertools.count():
+        ...         print(i, flush=True)
+        ...     ''')]
+        >>> lines = []
+        >>> for name, line in ub.cmd_iter(command):
+        ...     lines.append(int(line))
+        ...     if len(lines) == 3:
+        ...         break
+        >>> print(lines)
+        [0, 1, 2]
+
+    Example:
+        >>> import pytest
+        >>> import subprocess
+        >>> import ubelt as ub
+        >>> with pytest.raises(subprocess.CalledProcessError):
+        >>>     list(ub.cmd_iter('exit 1', check=True, shell=True))
+    """
+    import subprocess
+    if tee_backend not in {'auto', 'thread', 'select'}:
+        raise ValueError('tee_backend must be select, thread, or auto')
+    _proc_iteroutput = _rectify_tee_backend(tee_backend)
+    command_text, args = _resolve_command(command, shell)
+    # The caller can stop at any time, so always run the command in its own
+    # process group, which lets us clean up any children it spawned.
+    new_session = POSIX
+    deadline = None if timeout is None else time.monotonic() + timeout
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, shell=shell,
+                            universal_newlines=True, cwd=cwd, env=env,
+                            start_new_session=new_session)
+    try:
+        for oline, eline in _proc_iteroutput(proc, timeout=timeout):
+            if oline:
+                yield 'out', oline
+            if eline:
+                yield 'err', eline
+        remaining = (None if deadline is None else
+                     max(deadline - time.monotonic(), 0))
+        ret = proc.wait(timeout=remaining)
+    except BaseException:
+        # This includes GeneratorExit when the caller stops iterating
+        _kill_proc_tree(proc, group=new_session)
+        proc.wait()
+        raise
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+    if check and ret != 0:
+        raise subprocess.CalledProcessError(ret, command_text)
+
+
+async def _aread_stream(stream, logged, tee_stream=None, text=True,
+                        chunksize=65536):
+    """
+    Reads an asyncio stream in chunks and decodes it like
+    ``universal_newlines=True`` would.
+
+    Args:
+        stream (asyncio.StreamReader): the stream to read
+
+        logged (_CaptureBuffer): captures the decoded text
+
+        tee_stream (TextIO | None): if specified the text is also written here
+
+        text (bool): if False, the bytes are not decoded
+
+        chunksize (int): maximum number of bytes to read at a time
+    """
+    import codecs
+    import io
+    import locale
+    decoder = None
+    if text:
+        encoding = locale.getpreferredencoding(False)
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True)
+    write = _tee_writer(tee_stream, text)
+    final = False
+    while not final:
+        data = await stream.read(chunksize)
+        final = not data
+        if decoder is not None:
+            data = decoder.decode(data, final=final)
+        if data:
+            if write is not None:
+                write(data)
+            logged.append(data)
+
+
+async def acmd(command, shell=False, verbose=0, tee=None, cwd=None, env=None,
+               check=False, timeout=None, max_capture=None, overflow='tail',
+               text=True, stdout=None, stderr=None):
+    """
+    Executes a command in a subprocess managed by asyncio.
+
+    This is the coroutine version of :func:`cmd`. The output is read by the
+    event loop instead of helper threads, so many commands can be supervised
+    at the same time. Cancelling the task running this coroutine kills the
+    process.
+
+    Args:
+        command (str | List[str]): bash-like command string or tuple of
+            executable and args
+
+        shell (bool, default=False): if True, process is run in shell.
+
+        verbose (int, default=0): verbosity mode. Can be 0, 1, 2, or 3.
+
+        tee (bool | None): if True, simultaneously writes to stdout while
+            capturing output from the command. If not specified, defaults to
+            True if verbose > 0.
+
+        cwd (str | PathLike | None):
+            Path to run command. Defaults to current working directory if
+            unspecified.
+
+        env (Dict[str, str] | None): environment passed to the process
+
+        check (bool, default=False): if True, check that the return code was
+            zero before returning, otherwise raise a CalledProcessError.
+
+        timeout (float | None):
+            If the process does not complete in `timeout` seconds, it is killed
+            and :class:`subprocess.TimeoutExpired` is raised. On POSIX the
+            command runs in its own process group, which is killed along with
+            any children.
+
+        max_capture (int | None):
+            If specified, at most this many characters of stdout and stderr
+            are held in memory. See :func:`cmd`.
+
+        overflow (str, default='tail'):
+            What to do with output beyond ``max_capture``. See :func:`cmd`.
+
+        text (bool, default=True):
+            if False, the output is captured as bytes. See :func:`cmd`.
+
+        stdout (str | PathLike | int | IO | None):
+            if specified, standard output is written here instead of being
+            captured. See :func:`cmd`.
+
+        stderr (str | PathLike | int | IO | None):
+            if specified, standard error is written here instead of being
+            captured. See :func:`cmd`.
+
+    Returns:
+        dict: info - the same information returned by :func:`cmd`, except
+            ``info['proc']`` is an :class:`asyncio.subprocess.Process`.
+
+    Note:
+        On POSIX, versions of Python before 3.12 may use a thread to wait for
+        each child process to exit, depending on the asyncio child watcher.
+
+    Example:
+        >>> import asyncio
+        >>> import ubelt as ub
+        >>> async def main():
+        ...     jobs = [ub.acmd(('echo', str(idx))) for idx in range(10)]
+        ...     return await asyncio.gather(*jobs)
+        >>> loop = asyncio.new_event_loop()
+        >>> infos = loop.run_until_complete(main())
+        >>> loop.close()
+        >>> print([info['out'].strip() for info in infos])
+        ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+
+    Example:
+        >>> # Timeouts and cancellation kill the process
+        >>> import asyncio
+        >>> import sys
+        >>> import subprocess
+        >>> import ubelt as ub
+        >>> command = [sys.executable, '-c', 'import time; print("a", flush=True); time.sleep(100)']
+        >>> async def main():
+        ...     try:
+        ...         await ub.acmd(command, timeout=1)
+        ...     except subprocess.TimeoutExpired as ex:
+        ...         print('timeout output = {!r}'.format(ex.output))
+        ...     task = asyncio.ensure_future(ub.acmd(command))
+        ...     await asyncio.sleep(0.5)
+        ...     task.cancel()
+        ...     try:
+        ...         await task
+        ...     except asyncio.CancelledError:
+        ...         print('cancelled')
+        >>> loop = asyncio.new_event_loop()
+        >>> loop.run_until_complete(main())
+        >>> loop.close()
+        timeout output = 'a\\n'
+        cancelled
+    """
+    import asyncio
+    import subprocess
+    command_text, args = _resolve_command(command, shell)
+
+    if tee is None:
+        tee = verbose > 0
+
+    if overflow not in {'tail', 'spill'}:
+        raise ValueError('overflow must be tail or spill')
+
+    if verbose > 1:
+        _print_cmd_start(command_text, cwd, verbose)
+
+    # A process that can time out gets its own process group, so it can be
+    # killed along with any children it spawned.
+    new_session = POSIX and timeout is not None
+    stdout_, stdout_fh = _rectify_redirect(stdout)
+    stderr_, stderr_fh = _rectify_redirect(stderr)
+    kwargs = dict(stdout=stdout_, stderr=stderr_, cwd=cwd, env=env,
+                  start_new_session=new_session)
+    try:
+        if shell:
+            proc = await asyncio.create_subprocess_shell(
+                command_text, **kwargs)
+        else:
+            if isinstance(args, str):  # nocover
+                # On windows commands are kept as text
+                import shlex
+                args = shlex.split(args, posix=False)
+            proc = await asyncio.create_subprocess_exec(*args, **kwargs)
+    finally:
+        # The process has its own handle to any file we opened
+        for fh in [stdout_fh, stderr_fh]:
+            if fh is not None:
+                fh.close()
+
+    logged_out = _CaptureBuffer(max_capture, overflow, name='out', text=text)
+    logged_err = _CaptureBuffer(max_capture, overflow, name='err', text=text)
+
+    async def _communicate():
+        readers = []
+        if proc.stdout is not None:
+            readers.append(_aread_stream(
+                proc.stdout, logged_out, sys.stdout if tee else None, text))
+        if proc.stderr is not None:
+            readers.append(_aread_stream(
+                proc.stderr, logged_err, sys.stderr if tee else None, text))
+        await asyncio.gather(*readers)
+        return await proc.wait()
+
+    try:
+        ret = await asyncio.wait_for(_communicate(), timeout)
+    except BaseException as ex:
+        # This includes cancellation of the task awaiting us.
+        _kill_proc_tree(proc, group=new_session)
+        await proc.wait()
+        if isinstance(ex, asyncio.TimeoutError):
+            raise subprocess.TimeoutExpired(
+                command_text, timeout, output=logged_out.getvalue(),
+                stderr=logged_err.getvalue()) from None
+        raise
+    finally:
+        logged_out.close()
+        logged_err.close()
+
+    info = {
+        'out': None if proc.stdout is None else logged_out.getvalue(),
+        'err': None if proc.stderr is None else logged_err.getvalue(),
+        'ret': ret,
+        'proc': proc,
+        'cwd': cwd,
+        'command': command_text
+    }
+    if overflow == 'spill':
+        info['out_fpath'] = logged_out.fpath
+        info['err_fpath'] = logged_err.fpath
+
+    if verbose > 2:
+        _print_cmd_end()
+
+    if check:
+        if info['ret'] != 0:
+            raise subprocess.CalledProcessError(
+                info['ret'], info['command'], info['out'], info['err'])
+    return info
+
+
+def _cmd_many_worker(command, kwargs, check):
+    """
+    Runs one command for :class:`CmdQueue` and records any error in the info
+    dict instead of raising it.
+    """
+    import subprocess
+    try:
+        info = cmd(command, **kwargs)
+    except Exception as ex:
+        command_text, _ = _resolve_command(command, kwargs.get('shell', False))
+        info = {
+            'out': getattr(ex, 'output', None),
+            'err': getattr(ex, 'stderr', None),
+            'ret': None,
+            'proc': None,
+            'cwd': kwargs.get('cwd', None),
+            'command': command_text,
+            'error': ex,
+        }
+    else:
+        if check and info['ret'] != 0:
+            info['error'] = subprocess.CalledProcessError(
+                info['ret'], info['command'], info['out'], info['err'])
+        else:
+            info['error'] = None
+    return info
+
+
+class CmdQueue(object):
+    """
+    Runs many commands concurrently with :func:`cmd`.
+
+    The output of each command is captured and, if ``verbose`` is set, written
+    as a single block once the command finishes, so the output of different
+    commands is never interleaved.
+
+    Args:
+        max_workers (int | None):
+            maximum number of commands to run at the same time. Defaults to
+            the number of CPUs. If 0, the commands run serially.
+
+        verbose (int, default=0):
+            if 1, writes the output of each finished command. If 2, also
+            writes the command itself.
+
+        check (bool, default=False):
+            if True, a nonzero return code is treated as an error.
+
+        fail_fast (bool, default=False):
+            The error policy. An error is an exception raised by :func:`cmd`
+            (e.g. a timeout) or a nonzero return code if ``check`` is True.
+            If True, the first error cancels commands that have not started
+            and is raised after the running commands finish. Otherwise every
+            command runs and errors are stored in the ``'error'`` key of the
+            info dicts.
+
+    Example:
+        >>> import ubelt as ub
+        >>> cmdq = ub.CmdQueue(max_workers=4)
+        >>> for idx in range(8):
+        ...     cmdq.submit('echo hello {}'.format(idx))
+        >>> infos = cmdq.run()
+        >>> print([info['out'].strip() for info in infos])
+        ['hello 0', 'hello 1', 'hello 2', 'hello 3', 'hello 4', 'hello 5', 'hello 6', 'hello 7']
+
+    Example:
+        >>> # Collect errors or stop at the first one
+        >>> import pytest
+        >>> import subprocess
+        >>> import ubelt as ub
+        >>> cmdq = ub.CmdQueue(max_workers=2, check=True)
+        >>> cmdq.submit('echo ok', shell=True)
+        >>> cmdq.submit('exit 3', shell=True)
+        >>> infos = cmdq.run()
+        >>> assert infos[0]['error'] is None
+        >>> assert infos[1]['error'].returncode == 3
+        >>> cmdq.fail_fast = True
+        >>> with pytest.raises(subprocess.CalledProcessError):
+        ...     cmdq.run()
+    """
+
+    def __init__(self, max_workers=None, verbose=0, check=False,
+                 fail_fast=False):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.check = check
+        self.fail_fast = fail_fast
+        self.commands = []
+
+    def __len__(self):
+        return len(self.commands)
+
+    def submit(self, command, **kwargs):
+        """
+        Adds a command to the queue
+
+        Args:
+            command (str | List[str]): the command to run
+
+            **kwargs: passed to :func:`cmd` (e.g. shell, cwd, env, timeout).
+                The output is always captured, so ``tee``, ``verbose``,
+                ``detach``, ``system``, and ``check`` are not allowed.
+        """
+        invalid = {'tee', 'verbose', 'detach', 'system', 'check'} & set(kwargs)
+        if invalid:
+            raise ValueError(
+                'Cannot pass {} to CmdQueue.submit'.format(sorted(invalid)))
+        self.commands.append((command, kwargs))
+
+    def _report(self, info):
+        """
+        Writes the output of a finished command as one block
+        """
+        if self.verbose > 1:
+            print('[ubelt.cmd] $ ' + info['command'])
+        if info['out']:
+            sys.stdout.write(info['out'])
+            sys.stdout.flush()
+        if info['err']:
+            sys.stderr.write(info['err'])
+            sys.stderr.flush()
+
+    def run(self, desc=None, progkw=None):
+        """
+        Runs all of the commands in the queue
+
+        Args:
+            desc (str | None):
+                if specified, reports progress with a
+                :class:`ubelt.progiter.ProgIter` object.
+
+            progkw (dict | None):
+                extra keyword arguments to :class:`ubelt.progiter.ProgIter`.
+
+        Returns:
+            List[dict]:
+                the info dict returned by :func:`cmd` for each command in the
+                order they were submitted, with an additional ``'error'`` key.
+
+        Raises:
+            Exception: the first error if ``fail_fast`` is True
+        """
+        from ubelt.util_futures import JobPool
+        infos = [None] * len(self.commands)
+        job_to_index = {}
+        pool = JobPool('thread', max_workers=self.max_workers)
+        with pool:
+            for index, (command, kwargs) in enumerate(self.commands):
+                kwargs = dict(kwargs, tee=False, verbose=0)
+                job = pool.submit(_cmd_many_worker, command, kwargs,
+                                  self.check)
+                job_to_index[job] = index
+            for job in pool.as_completed(desc=desc, progkw=progkw):
+                info = job.result()
+                infos[job_to_index[job]] = info
+                if self.verbose:
+                    self._report(info)
+                if self.fail_fast and info['error'] is not None:
+                    for other in pool.jobs:
+                        other.cancel()
+                    raise info['error']
+        return infos
+
+
+def cmd_many(commands, max_workers=None, verbose=0, check=False,
+             fail_fast=False, desc=None, progkw=None, **kwargs):
+    """
+    Executes multiple commands concurrently.
+
+    This is a shortcut for submitting each command to a :class:`CmdQueue`
+    and running it.
+
+    Args:
+        commands (Iterable[str | List[str]]): the commands to run
+
+        max_workers (int | None):
+            maximum number of commands to run at the same time. Defaults to
+            the number of CPUs. If 0, the commands run serially.
+
+        verbose (int, default=0):
+            if 1, writes the output of each finished command without
+            interleaving it with the output of other commands.
+
+        check (bool, default=False):
+            if True, a nonzero return code is treated as an error.
+
+        fail_fast (bool, default=False):
+            if True, the first error is raised and pending commands are
+            cancelled, otherwise errors are stored in the info dicts.
+            See :class:`CmdQueue` for details.
+
+        desc (str | None):
+            if specified, reports progress with a
+            :class:`ubelt.progiter.ProgIter` object.
+
+        progkw (dict | None):
+            extra keyword arguments to :class:`ubelt.progiter.ProgIter`.
+
+        **kwargs: passed to :func:`cmd` for every command
+
+    Returns:
+        List[dict]: an info dict for each command in the given order
+
+    Example:
+        >>> import ubelt as ub
+        >>> commands = ['echo {}'.format(idx) for idx in range(20)]
+        >>> infos = ub.cmd_many(commands, max_workers=4)
+        >>> assert [int(info['out']) for info in infos] == list(range(20))
+        >>> assert all(info['ret'] == 0 for info in infos)
+    """
+    cmdq = CmdQueue(max_workers=max_workers, verbose=verbose, check=check,
+                    fail_fast=fail_fast)
+    for command in commands:
+        cmdq.submit(command, **kwargs)
+    return cmdq.run(desc=desc, progkw=progkw)
@@ -2,6 +2,11 @@ from typing import Union
 from typing import List
 from os import PathLike
 from typing import Dict
+from typing import Generator
+from typing import Tuple
+from typing import Iterable
+from typing import Any
+from typing import IO
 from _typeshed import Incomplete
 
 POSIX: Incomplete
@@ -17,5 +22,75 @@ def cmd(command: Union[str, List[str]],
         tee_backend: str = 'auto',
         check: bool = False,
         system: bool = False,
-        timeout: float = None) -> dict:
+        timeout: float = None,
+        max_capture: Union[int, None] = None,
+        overflow: str = 'tail',
+        text: bool = True,
+        stdout: Union[str, PathLike, int, IO, None] = None,
+        stderr: Union[str, PathLike, int, IO, None] = None) -> dict:
     ...
+
+
+def cmd_iter(
+    command: Union[str, List[str]],
+    shell: bool = False,
+    cwd: Union[str, PathLike, None] = None,
+    env: Union[Dict[str, str], None] = None,
+    timeout: Union[float, None] = None,
+    check: bool = False,
+    tee_backend: str = 'auto'
+) -> Generator[Tuple[str, str], None, None]:
+    ...
+
+
+async def acmd(command: Union[str, List[str]],
+               shell: bool = False,
+               verbose: int = 0,
+               tee: Union[bool, None] = None,
+               cwd: Union[str, PathLike, None] = None,
+               env: Union[Dict[str, str], None] = None,
+               check: bool = False,
+               timeout: Union[float, None] = None,
+               max_capture: Union[int, None] = None,
+               overflow: str = 'tail',
+               text: bool = True,
+               stdout: Union[str, PathLike, int, IO, None] = None,
+               stderr: Union[str, PathLike, int, IO, None] = None) -> dict:
+    ...
+
+
+def cmd_many(commands: Iterable[Union[str, List[str]]],
+             max_workers: Union[int, None] = None,
+             verbose: int = 0,
+             check: bool = False,
+             fail_fast: bool = False,
+             desc: Union[str, None] = None,
+             progkw: Union[dict, None] = None,
+             **kwargs) -> List[dict]:
+    ...
+
+
+class CmdQueue:
+    max_workers: int
+    verbose: int
+    check: bool
+    fail_fast: bool
+    commands: List[Tuple[Union[str, List[str]], Dict[str, Any]]]
+
+    def __init__(self,
+                 max_workers: Union[int, None] = None,
+                 verbose: int = 0,
+                 check: bool = False,
+                 fail_fast: bool = False) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def submit(self, command: Union[str, List[str]], **kwargs) -> None:
+        ...
+
+    def run(self,
+            desc: Union[str, None] = None,
+            progkw: Union[dict, None] = None) -> List[dict]:
+        ...
@@ -42,6 +42,7 @@ Example:
 """
 import concurrent.futures
 from concurrent.futures import as_completed
+from functools import partial
 
 __all__ = ['Executor', 'JobPool']
 
@@ -317,6 +318,235 @@ class Executor(object):
                                 chunksize=chunksize)
 
 
+def _run_batch(tasks):
+    """
+    Runs a batch of tasks in a worker
+
+    Args:
+        tasks (List[Tuple[Callable, tuple, dict]]): functions and arguments
+
+    Returns:
+        Tuple[List[Tuple[bool, Any]], float]:
+            A flag indicating success and the result (or exception) of each
+            task, and the number of seconds the batch took.
+    """
+    import time
+    start = time.perf_counter()
+    outputs = []
+    for func, args, kwargs in tasks:
+        try:
+            outputs.append((True, func(*args, **kwargs)))
+        except Exception as ex:
+            outputs.append((False, ex))
+    return outputs, time.perf_counter() - start
+
+
+class _BatchedFuture(concurrent.futures.Future):
+    """
+    A future for a task that may still be buffered by a :class:`_TaskBatcher`.
+    Waiting on the result sends the buffered tasks to the workers first.
+    Otherwise they are sent when the batch is full or its linger time passes.
+    """
+    def __init__(self, batcher):
+        super(_BatchedFuture, self).__init__()
+        # Unset once the task leaves the buffer
+        self._batcher = batcher
+
+    def _ensure_sent(self):
+        batcher = self._batcher
+        if batcher is not None:
+            batcher.flush()
+
+    def result(self, timeout=None):
+        self._ensure_sent()
+        return super(_BatchedFuture, self).result(timeout)
+
+    def exception(self, timeout=None):
+        self._ensure_sent()
+        return super(_BatchedFuture, self).exception(timeout)
+
+
+class _TaskBatcher(object):
+    """
+    Groups calls submitted to an executor so several run in a single round
+    trip to a worker. This amortizes the cost of pickling and inter-process
+    communication when there are many small tasks.
+
+    Args:
+        executor (Executor): the executor to submit batches to
+
+        batchsize (int | str): a fixed number of tasks per batch, or "auto"
+            to adapt it to the measured time per task.
+
+        target_time (float): with "auto", batches are sized to take roughly
+            this many seconds.
+
+        max_batchsize (int): with "auto", the largest allowed batch size
+
+        linger (float): a partial batch is sent this many seconds after its
+            first task was buffered, so futures that are only polled with
+            ``done()`` or passed to :func:`concurrent.futures.wait` finish.
+
+    Example:
+        >>> from ubelt.util_futures import _TaskBatcher, Executor
+        >>> executor = Executor('thread', max_workers=2)
+        >>> batcher = _TaskBatcher(executor, batchsize=4)
+        >>> jobs = [batcher.submit(pow, idx, 2) for idx in range(10)]
+        >>> # the last two jobs are sent when their results are requested
+        >>> print([job.result() for job in jobs])
+        [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+        >>> # or after the linger time, without requesting the result
+        >>> job = batcher.submit(pow, 10, 2)
+        >>> done, _ = concurrent.futures.wait([job], timeout=10)
+        >>> assert job in done
+        >>> batcher.close()
+        >>> executor.shutdown()
+    """
+
+    def __init__(self, executor, batchsize='auto', target_time=0.02,
+                 max_batchsize=1024, linger=0.01):
+        import threading
+        self.executor = executor
+        self.adaptive = batchsize == 'auto'
+        self.batchsize = 1 if self.adaptive else int(batchsize)
+        self.target_time = target_time
+        self.max_batchsize = max_batchsize
+        self.linger = linger
+        self.task_time = None
+        self._buffer = []
+        self._lock = threading.Lock()
+        # Wakes the thread that sends partial batches after they linger
+        self._cond = threading.Condition(self._lock)
+        self._deadline = None
+        self._closed = False
+        self._flusher = None
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Buffers a call and sends the buffer if it is full
+
+        Returns:
+            concurrent.futures.Future
+        """
+        future = _BatchedFuture(self)
+        with self._lock:
+            self._buffer.append((future, (func, args, kwargs)))
+            is_full = len(self._buffer) >= self.batchsize
+            if not is_full and self._deadline is None:
+                self._schedule_flush()
+        if is_full:
+            self.flush()
+        return future
+
+    def _schedule_flush(self):
+        """
+        Arranges for the buffer to be sent after the linger time. The caller
+        must hold the lock.
+        """
+        import time
+        self._deadline = time.monotonic() + self.linger
+        if self._flusher is None:
+            import threading
+            self._flusher = threading.Thread(target=self._flush_loop,
+                                             daemon=True)
+            self._flusher.start()
+        self._cond.notify()
+
+    def _flush_loop(self):
+        """
+        Sends partial batches whose linger time has passed until closed
+        """
+        import time
+        with self._cond:
+            while not self._closed:
+                if self._deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                self._cond.release()
+                try:
+                    self.flush()
+                finally:
+                    self._cond.acquire()
+
+    def close(self):
+        """
+        Sends any buffered calls and stops the linger thread
+        """
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._cond.notify()
+
+    def flush(self):
+        """
+        Sends all buffered calls to a worker as one batch
+        """
+        with self._lock:
+            self._deadline = None
+            buffer = self._buffer
+            if not buffer:
+                return
+            self._buffer = []
+            if self.adaptive and self.task_time is None:
+                # Until we have measured a batch, grow exponentially so a
+                # quick burst of submissions does not send one task at a time
+                self.batchsize = min(self.batchsize * 2, self.max_batchsize)
+        futures = []
+        tasks = []
+        for future, task in buffer:
+            future._batcher = None
+            # Skip tasks that were cancelled while buffered
+            if future.set_running_or_notify_cancel():
+                futures.append(future)
+                tasks.append(task)
+        if not futures:
+            return
+        try:
+            batch_job = self.executor.submit(_run_batch, tasks)
+        except Exception as ex:
+            for future in futures:
+                future.set_exception(ex)
+            raise
+        batch_job.add_done_callback(partial(self._distribute, futures))
+
+    def _distribute(self, futures, batch_job):
+        """
+        Sets the result of each future from the result of its batch
+        """
+        try:
+            outputs, elapsed = batch_job.result()
+        except BaseException as ex:
+            # e.g. the worker died or the batch was cancelled
+            for future in futures:
+                future.set_exception(ex)
+            return
+        self._observe(len(futures), elapsed)
+        for future, (success, value) in zip(futures, outputs):
+            if success:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _observe(self, num, elapsed):
+        """
+        Updates the estimated time per task and the adaptive batch size
+        """
+        task_time = elapsed / num
+        with self._lock:
+            if self.task_time is None:
+                self.task_time = task_time
+            else:
+                # exponential moving average
+                self.task_time = 0.8 * self.task_time + 0.2 * task_time
+            if self.adaptive:
+                ideal = self.target_time / max(self.task_time, 1e-9)
+                self.batchsize = int(min(max(ideal, 1), self.max_batchsize))
+
+
 class JobPool(object):
     """
     Abstracts away boilerplate of submitting and collecting jobs
@@ -324,6 +554,30 @@ class JobPool(object):
     This is a basic wrapper around :class:`ubelt.util_futures.Executor` that
     simplifies the most basic case.
 
+    Args:
+        mode (str, default='thread'): either thread, serial, or process
+
+        max_workers (int, default=0): number of workers. If 0, serial is
+            forced.
+
+        max_inflight (int | None): if specified, :func:`JobPool.submit`
+            blocks while this many jobs are pending. This is also the number
+            of jobs :func:`JobPool.imap` keeps in flight. In serial mode jobs
+            run lazily, so submit never blocks.
+
+        transient (bool, default=False): if True, jobs are removed from the
+            pool as soon as they are yielded by :func:`JobPool.as_completed`,
+            so the pool does not keep completed jobs and their results alive.
+
+        batchsize (int | str | None): if specified, submitted calls are
+            grouped into batches that each run in a single round trip to a
+            worker, which reduces the overhead of many small tasks in process
+            mode. Can be a fixed number of calls per batch or "auto", which
+            adapts the size to the measured time per call. A partial batch is
+            sent when a result is requested, when the jobs are collected, or
+            after a short linger time, so :func:`concurrent.futures.wait`
+            and polling ``done()`` also work. Ignored in serial mode.
+
     Example:
         >>> import ubelt as ub
         >>> def worker(data):
@@ -337,9 +591,25 @@ class JobPool(object):
         >>>     final.append(info)
         >>> print('final = {!r}'.format(final))
     """
-    def __init__(self, mode='thread', max_workers=0):
+    def __init__(self, mode='thread', max_workers=0, max_inflight=None,
+                 transient=False, batchsize=None):
         self.executor = Executor(mode=mode, max_workers=max_workers)
+        self.max_workers = max_workers
+        self.max_inflight = max_inflight
+        self.transient = transient
         self.jobs = []
+        self._slots = None
+        if max_inflight is not None:
+            import threading
+            self._slots = threading.BoundedSemaphore(max_inflight)
+        self._done_queue = None
+        if transient:
+            import queue
+            self._done_queue = queue.Queue()
+        self._batcher = None
+        if batchsize is not None:
+            if not isinstance(self.executor.backend, SerialExecutor):
+                self._batcher = _TaskBatcher(self.executor, batchsize)
 
     def __len__(self):
         return len(self.jobs)
@@ -360,12 +630,56 @@ class JobPool(object):
         Returns:
             concurrent.futures.Future:
                 a future representing the job
+
+        Example:
+            >>> # Bound the number of pending jobs
+            >>> import ubelt as ub
+            >>> import time
+            >>> pool = ub.JobPool('thread', max_workers=2, max_inflight=4)
+            >>> for idx in range(10):
+            ...     pool.submit(time.sleep, 0.01)
+            ...     num_pending = sum(not job.done() for job in pool.jobs)
+            ...     assert num_pending <= 4
+            >>> pool.shutdown()
         """
-        job = self.executor.submit(func, *args, **kwargs)
+        if self._slots is not None:
+            if not self._slots.acquire(blocking=False):
+                # Buffered jobs would never finish, so send them first
+                self.flush()
+                self._slots.acquire()
+            try:
+                job = self._submit(func, *args, **kwargs)
+            except BaseException:
+                self._slots.release()
+                raise
+            job.add_done_callback(self._release_slot)
+        else:
+            job = self._submit(func, *args, **kwargs)
+        if self._done_queue is not None:
+            job.add_done_callback(self._done_queue.put)
         self.jobs.append(job)
         return job
 
+    def _submit(self, func, *args, **kwargs):
+        if self._batcher is None:
+            return self.executor.submit(func, *args, **kwargs)
+        else:
+            return self._batcher.submit(func, *args, **kwargs)
+
+    def _release_slot(self, job):
+        self._slots.release()
+
+    def flush(self):
+        """
+        Sends any jobs buffered for batching to the workers. This happens
+        automatically when results are requested.
+        """
+        if self._batcher is not None:
+            self._batcher.flush()
+
     def shutdown(self):
+        if self._batcher is not None:
+            self._batcher.close()
         self.jobs = None
         return self.executor.shutdown()
 
@@ -374,18 +688,18 @@ class JobPool(object):
         return self
 
     def __exit__(self, a, b, c):
+        if self._batcher is not None:
+            self._batcher.close()
         self.executor.__exit__(a, b, c)
 
-    # TODO: add some way to clear completed jobs?
-    # def clear_completed
-
     def as_completed(self, timeout=None, desc=None, progkw=None):
         """
         Generates completed jobs in an arbitrary order
 
         Args:
             timeout (float | None):
-                Specify the the maximum number of seconds to wait for a job.
+                Specify the the maximum number of seconds to wait, counted
+                from the time of the call, for all jobs to complete.
 
             desc (str | None):
                 if specified, reports progress with a
@@ -398,6 +712,10 @@ class JobPool(object):
             concurrent.futures.Future:
                 The completed future object containing the results of a job.
 
+        Raises:
+            concurrent.futures.TimeoutError:
+                if a job is not complete before the timeout
+
         CommandLine:
             xdoctest -m ubelt.util_futures JobPool.as_completed
 
@@ -421,7 +739,11 @@ class JobPool(object):
             >>> pool.shutdown()
         """
         import ubelt as ub
-        job_iter = as_completed(self.jobs)
+        self.flush()
+        if self.transient:
+            job_iter = self._iter_transient(timeout)
+        else:
+            job_iter = as_completed(self.jobs, timeout=timeout)
         if desc is not None:
             if progkw is None:
                 progkw = {}
@@ -431,6 +753,124 @@ class JobPool(object):
         for job in job_iter:
             yield job
 
+    def _iter_transient(self, timeout=None):
+        """
+        Yields jobs in the order they finish, removing each from the pool
+        """
+        import queue
+        import time
+        if timeout is not None:
+            # Like concurrent.futures.as_completed, the timeout applies to
+            # the entire iteration, not to each job.
+            deadline = time.monotonic() + timeout
+        for _ in range(len(self.jobs)):
+            if timeout is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+            try:
+                job = self._done_queue.get(timeout=timeout)
+            except queue.Empty:
+                raise concurrent.futures.TimeoutError from None
+            # The oldest jobs are likely at the front, so this is cheap
+            self.jobs.remove(job)
+            yield job
+
+    def _window(self):
+        """
+        The number of jobs :func:`JobPool.imap` keeps in flight
+        """
+        if self.max_inflight is not None:
+            return self.max_inflight
+        window = max(2 * self.max_workers, 1)
+        if self._batcher is not None:
+            # Leave room for full batches
+            window *= self._batcher.batchsize
+        return window
+
+    def imap(self, func, *iterables):
+        """
+        Lazily maps a function over iterables and yields results in order.
+
+        Unlike :func:`JobPool.submit`, jobs are not added to the pool. The
+        inputs are consumed as jobs finish, so only a bounded number of jobs
+        (``max_inflight`` or twice the number of workers times the batch
+        size) exist at one time, which allows streaming over an arbitrarily
+        large input.
+
+        Args:
+            func (Callable[..., Any]):
+                A callable that will take as many arguments as there are passed
+                iterables.
+
+            *iterables: iterables of arguments, which may be generators
+
+        Yields:
+            Any: the result of each call in the order of the inputs
+
+        Example:
+            >>> import ubelt as ub
+            >>> import itertools as it
+            >>> pool = ub.JobPool('thread', max_workers=4, max_inflight=8)
+            >>> inputs = it.count()
+            >>> results = pool.imap(pow, inputs, it.repeat(2))
+            >>> print(list(it.islice(results, 10)))
+            [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+            >>> pool.shutdown()
+        """
+        from collections import deque
+        pending = deque()
+        for args in zip(*iterables):
+            if len(pending) >= self._window():
+                yield pending.popleft().result()
+            pending.append(self._submit(func, *args))
+        while pending:
+            yield pending.popleft().result()
+
+    def imap_unordered(self, func, *iterables):
+        """
+        Like :func:`JobPool.imap`, but yields results as soon as they are
+        finished.
+
+        Args:
+            func (Callable[..., Any]):
+                A callable that will take as many arguments as there are passed
+                iterables.
+
+            *iterables: iterables of arguments, which may be generators
+
+        Yields:
+            Any: the result of each call in the order they finish
+
+        Example:
+            >>> import ubelt as ub
+            >>> pool = ub.JobPool('thread', max_workers=4)
+            >>> results = pool.imap_unordered(pow, range(10), [2] * 10)
+            >>> print(sorted(results))
+            [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+            >>> pool.shutdown()
+        """
+        import queue
+        done_queue = queue.Queue()
+        num_pending = 0
+
+        def _next_done():
+            try:
+                return done_queue.get_nowait()
+            except queue.Empty:
+                # Buffered jobs would never finish, so send them first
+                self.flush()
+                return done_queue.get()
+
+        for args in zip(*iterables):
+            if num_pending >= self._window():
+                yield _next_done().result()
+                num_pending -= 1
+            job = self._submit(func, *args)
+            job.add_done_callback(done_queue.put)
+            num_pending += 1
+        while num_pending:
+            yield _next_done().result()
+            num_pending -= 1
+
     def join(self, **kwargs):
         """
         Like :method:`JobPool.as_completed`, but executes the `result` method
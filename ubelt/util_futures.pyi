@@ -66,9 +66,17 @@ class Executor:
 
 class JobPool:
     executor: Incomplete
+    max_workers: int
+    max_inflight: Union[int, None]
+    transient: bool
     jobs: Incomplete
 
-    def __init__(self, mode: str = ..., max_workers: int = ...) -> None:
+    def __init__(self,
+                 mode: str = ...,
+                 max_workers: int = ...,
+                 max_inflight: Union[int, None] = None,
+                 transient: bool = False,
+                 batchsize: Union[int, str, None] = None) -> None:
         ...
 
     def __len__(self):
@@ -78,6 +86,9 @@ class JobPool:
                **kwargs) -> concurrent.futures.Future:
         ...
 
+    def flush(self) -> None:
+        ...
+
     def shutdown(self):
         ...
 
@@ -95,6 +106,14 @@ class JobPool:
     ) -> Generator[concurrent.futures.Future, None, None]:
         ...
 
+    def imap(self, func: Callable[..., Any],
+             *iterables) -> Generator[Any, None, None]:
+        ...
+
+    def imap_unordered(self, func: Callable[..., Any],
+                       *iterables) -> Generator[Any, None, None]:
+        ...
+
     def join(self, **kwargs) -> List[Any]:
         ...
 
@@ -56,10 +56,12 @@ Note:
 """
 import hashlib
 import math
+from abc import get_cache_token
 from collections import OrderedDict
 from ubelt.util_const import NoParam
 
-__all__ = ['hash_data', 'hash_file']
+__all__ = ['hash_data', 'hash_data_many', 'hash_file', 'hash_file_chunks',
+           'hash_files']
 
 # incremented when we make a change that modifies hashes
 HASH_VERSION = 2  # type: int
@@ -106,6 +108,14 @@ DEFAULT_HASHER = hashlib.sha512  # most robust algo, but slower than others
 _COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT = True
 
 
+# The maximum number of bytes copied at once when streaming a non-contiguous
+# numpy array into a hasher
+_NUMPY_STREAM_CHUNKSIZE = 2 ** 20
+
+# The default size of a leaf in a tree hash (64MB)
+_TREE_CHUNKSIZE = 2 ** 26
+
+
 # Note: the Hasher refers to hashlib._hashlib.HASH
 # but this does not play well with type annotations
 # try:
@@ -317,6 +327,11 @@ class HashableExtensions(object):
         self.iterable_checks = []
         self._lazy_queue = []  # type: List[Callable]  # NOQA
 
+        # Maps types to their resolved hash function (or None if there is no
+        # registered function), so dispatch only needs to be resolved once.
+        self._dispatch_cache = {}  # type: Dict[type, Callable | None]  # NOQA
+        self._abc_token = None
+
         # New singledispatch registry implementation
         from functools import singledispatch
         def _hash_dispatch(data):
@@ -417,6 +432,7 @@ class HashableExtensions(object):
         def _decor_closure(hash_func):
             for hash_type in hash_types:
                 self._hash_dispatch.register(hash_type)(hash_func)
+            self._dispatch_cache.clear()
             return hash_func
         return _decor_closure
 
@@ -474,19 +490,45 @@ class HashableExtensions(object):
             >>> f3 = self.lookup(data)
             >>> print(f3(data))
         """
+        query_hash_type = data.__class__
+        hash_func = self._lookup_type(query_hash_type)
+        if hash_func is None:
+            raise TypeError(
+                'No registered hash func for hashable type={!r}'.format(
+                    query_hash_type))
+        return hash_func
+
+    def _lookup_type(self, query_hash_type):
+        """
+        Like :func:`HashableExtensions.lookup`, but takes a type and returns
+        None if no hash function is registered for it.
+
+        Args:
+            query_hash_type (type): the type of the data to hash
+
+        Returns:
+            Callable | None
+        """
         # Evaluate the lazy queue if anything is in it
         if self._lazy_queue:
             for func in self._lazy_queue:
                 func()
             self._lazy_queue = []
-        query_hash_type = data.__class__
-        # TODO: recognize some special dunder method instead
-        # of strictly using this registry.
-        hash_func = self._hash_dispatch.dispatch(query_hash_type)
-        if getattr(hash_func, '__is_base__', False):
-            raise TypeError(
-                'No registered hash func for hashable type={!r}'.format(
-                    query_hash_type))
+        # Registering a virtual subclass with an ABC (e.g. numbers.Integral)
+        # can change the dispatch result for an existing type.
+        abc_token = get_cache_token()
+        if self._abc_token != abc_token:
+            self._dispatch_cache.clear()
+            self._abc_token = abc_token
+        try:
+            hash_func = self._dispatch_cache[query_hash_type]
+        except KeyError:
+            # TODO: recognize some special dunder method instead
+            # of strictly using this registry.
+            hash_func = self._hash_dispatch.dispatch(query_hash_type)
+            if getattr(hash_func, '__is_base__', False):
+                hash_func = None
+            self._dispatch_cache[query_hash_type] = hash_func
         return hash_func
 
     def add_iterable_check(self, func):
@@ -494,8 +536,35 @@ class HashableExtensions(object):
         Registers a function that detects when a type is iterable
         """
         self.iterable_checks.append(func)
+        self._dispatch_cache.clear()
         return func
 
+    def _sequence_streamer(self, prefix, to_sequence):
+        """
+        Creates a function that feeds a hasher the same bytes as
+        ``prefix + b''.join(_hashable_sequence(to_sequence(data)))`` without
+        building them in memory first.
+
+        The result is meant to be attached to a registered hash function as
+        its ``__stream__`` attribute, which is used by :func:`_update_hasher`
+        in place of the hash function itself.
+
+        Args:
+            prefix (bytes): the type prefix used by the hash function
+            to_sequence (Callable): converts data into the sequence to hash
+
+        Returns:
+            Callable[[Hasher, object, bool], None]
+        """
+        def _stream(hasher, data, types):
+            if types:
+                hasher.update(prefix)
+            # See: [util_hash.Note.1]
+            _update_hasher(hasher, to_sequence(data),
+                           types=_COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT,
+                           extensions=self)
+        return _stream
+
     def _register_numpy_extensions(self):
         """
         Registers custom functions to hash numpy data structures.
@@ -532,18 +601,44 @@ class HashableExtensions(object):
                 raise TypeError(msg)
             else:
                 # tobytes() views the array in 1D (via ravel())
-                # encode the shape as well
-                # See: [util_hash.Note.1]
-                header = b''.join(_hashable_sequence(
-                    (len(data.shape), data.shape), extensions=self,
-                    types=_COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT))
-                dtype = b''.join(_hashable_sequence(
-                    data.dtype.descr, extensions=self,
-                    types=_COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT))
-                hashable = header + dtype + data.tobytes()
+                hashable = _numpy_header(data) + data.tobytes()
             prefix = b'NDARR'
             return prefix, hashable
 
+        def _numpy_header(data):
+            # encode the shape and dtype as well as the raw data
+            # See: [util_hash.Note.1]
+            header = b''.join(_hashable_sequence(
+                (len(data.shape), data.shape), extensions=self,
+                types=_COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT))
+            dtype = b''.join(_hashable_sequence(
+                data.dtype.descr, extensions=self,
+                types=_COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT))
+            return header + dtype
+
+        def _stream_numpy_array(hasher, data, types):
+            if data.dtype.kind == 'O':
+                msg = 'directly hashing ndarrays with dtype=object is unstable'
+                raise TypeError(msg)
+            if types:
+                hasher.update(b'NDARR')
+            hasher.update(_numpy_header(data))
+            if data.flags['C_CONTIGUOUS']:
+                # Hash the underlying buffer without copying it
+                hasher.update(data.reshape(-1).view(np.uint8))
+            else:
+                # Copy a bounded number of leading-axis rows at a time. The
+                # concatenated rows are the same bytes as ``data.tobytes()``.
+                row_nbytes = max(data[0:1].nbytes, 1)
+                step = max(1, _NUMPY_STREAM_CHUNKSIZE // row_nbytes)
+                for start in range(0, len(data), step):
+                    chunk = np.ascontiguousarray(data[start:start + step])
+                    hasher.update(chunk.reshape(-1).view(np.uint8))
+
+        _convert_numpy_array.__stream__ = _stream_numpy_array
+        # Lets batch hashing compute the shared header only once
+        _convert_numpy_array.__numpy_header__ = _numpy_header
+
         @self.register(np.random.RandomState)
         def _convert_numpy_random_state(data):
             """
@@ -562,6 +657,9 @@ class HashableExtensions(object):
             prefix = b'RNG'
             return prefix, hashable
 
+        _convert_numpy_random_state.__stream__ = self._sequence_streamer(
+            b'RNG', lambda data: data.get_state())
+
     def _register_builtin_class_extensions(self):
         """
         Register hashing extensions for a selection of classes included in
@@ -664,8 +762,7 @@ class HashableExtensions(object):
             prefix = b'UUID'
             return prefix, hashable
 
-        @self.register(set)
-        def _convert_set(data):
+        def _ordered_set(data):
             try:
                 # what raises a TypeError differs between Python 2 and 3
                 ordered_ = sorted(data)
@@ -674,6 +771,11 @@ class HashableExtensions(object):
                 data_ = list(data)
                 sortx = ub.argsort(data_, key=str)
                 ordered_ = [data_[k] for k in sortx]
+            return ordered_
+
+        @self.register(set)
+        def _convert_set(data):
+            ordered_ = _ordered_set(data)
             # See: [util_hash.Note.1]
             hashable = b''.join(_hashable_sequence(
                 ordered_, extensions=self,
@@ -681,8 +783,7 @@ class HashableExtensions(object):
             prefix = b'SET'
             return prefix, hashable
 
-        @self.register(dict)
-        def _convert_dict(data):
+        def _ordered_dict_items(data):
             try:
                 ordered_ = sorted(data.items())
                 # what raises a TypeError differs between Python 2 and 3
@@ -690,6 +791,11 @@ class HashableExtensions(object):
                 import ubelt as ub
                 sortx = ub.argsort(data, key=str)
                 ordered_ = [(k, data[k]) for k in sortx]
+            return ordered_
+
+        @self.register(dict)
+        def _convert_dict(data):
+            ordered_ = _ordered_dict_items(data)
             # See: [util_hash.Note.1]
             hashable = b''.join(_hashable_sequence(
                 ordered_, extensions=self,
@@ -710,6 +816,9 @@ class HashableExtensions(object):
             prefix = b'ODICT'
             return prefix, hashable
 
+        def _slice_parts(data):
+            return [data.start, data.stop, data.step]
+
         @self.register(slice)
         def _convert_slice(data):
             """
@@ -718,11 +827,22 @@ class HashableExtensions(object):
             """
             # See: [util_hash.Note.1]
             hashable = b''.join(_hashable_sequence(
-                [data.start, data.stop, data.step], extensions=self,
+                _slice_parts(data), extensions=self,
                 types=_COMPATIBLE_HASHABLE_SEQUENCE_TYPES_DEFAULT))
             prefix = b'SLICE'
             return prefix, hashable
 
+        # Nested containers are streamed into the hasher instead of being
+        # converted to bytes up front.
+        _convert_set.__stream__ = self._sequence_streamer(
+            b'SET', _ordered_set)
+        _convert_dict.__stream__ = self._sequence_streamer(
+            b'DICT', _ordered_dict_items)
+        _convert_ordered_dict.__stream__ = self._sequence_streamer(
+            b'ODICT', lambda data: list(data.items()))
+        _convert_slice.__stream__ = self._sequence_streamer(
+            b'SLICE', _slice_parts)
+
         self.register(pathlib.Path)(lambda x: (b'PATH', str(x).encode('utf-8')))
         # other data structures
 
@@ -794,6 +914,48 @@ def _hashable_sequence(data, types=False, extensions=None):
     return hasher.sequence
 
 
+def _convert_none(data):
+    return b'NULL', b'NONE'
+
+
+def _convert_bytes(data):
+    return b'TXT', data
+
+
+def _convert_str(data):
+    # convert unicode into bytes
+    return b'TXT', data.encode('utf-8')
+
+
+def _convert_int(data):
+    # warnings.warn('Hashing ints is slow, numpy is preferred')
+    # hashable = data.to_bytes(8, byteorder='big')
+    return b'INT', _int_to_bytes(data)
+
+
+def _convert_float(data):
+    data_ = float(data)  # convert to a base-float
+    try:
+        a, b = data_.as_integer_ratio()
+    except (ValueError, OverflowError):
+        hashable = str(data_).encode('utf-8')  # handle and nan, inf
+    else:
+        hashable = _int_to_bytes(a) + b'/' +  _int_to_bytes(b)
+    return b'FLT', hashable
+
+
+# Precomputed conversions for the exact builtin scalar types. These are never
+# iterable and are not dispatched through :class:`HashableExtensions`.
+_SCALAR_CONVERTERS = {
+    type(None): _convert_none,
+    bytes: _convert_bytes,
+    str: _convert_str,
+    int: _convert_int,
+    bool: _convert_int,
+    float: _convert_float,
+}
+
+
 def _convert_to_hashable(data, types=True, extensions=None):
     r"""
     Converts ``data`` into a hashable byte representation if an appropriate
@@ -829,30 +991,17 @@ def _convert_to_hashable(data, types=True, extensions=None):
         >>> assert _convert_to_hashable(+0.) == (b'FLT', b'\x00/\x01')
     """
     # HANDLE MOST COMMON TYPES FIRST
-    if data is None:
-        hashable = b'NONE'
-        prefix = b'NULL'
+    converter = _SCALAR_CONVERTERS.get(data.__class__, None)
+    if converter is not None:
+        prefix, hashable = converter(data)
     elif isinstance(data, bytes):
-        hashable = data
-        prefix = b'TXT'
+        prefix, hashable = _convert_bytes(data)
     elif isinstance(data, str):
-        # convert unicode into bytes
-        hashable = data.encode('utf-8')
-        prefix = b'TXT'
+        prefix, hashable = _convert_str(data)
     elif isinstance(data, int):
-        # warnings.warn('Hashing ints is slow, numpy is preferred')
-        hashable = _int_to_bytes(data)
-        # hashable = data.to_bytes(8, byteorder='big')
-        prefix = b'INT'
+        prefix, hashable = _convert_int(data)
     elif isinstance(data, float):
-        data_ = float(data)  # convert to a base-float
-        try:
-            a, b = data_.as_integer_ratio()
-        except (ValueError, OverflowError):
-            hashable = str(data_).encode('utf-8')  # handle and nan, inf
-        else:
-            hashable = _int_to_bytes(a) + b'/' +  _int_to_bytes(b)
-        prefix = b'FLT'
+        prefix, hashable = _convert_float(data)
     else:
         if extensions is None:
             extensions = _HASHABLE_EXTENSIONS
@@ -887,7 +1036,13 @@ def _update_hasher(hasher, data, types=True, extensions=None):
         extensions = _HASHABLE_EXTENSIONS
 
     # Determine if the data should be hashed directly or iterated through
-    if isinstance(data, (tuple, list, zip)):
+    converter = _SCALAR_CONVERTERS.get(data.__class__, None)
+    if converter is not None:
+        # Builtin scalars never need iteration
+        prefix, hashable = converter(data)
+        hasher.update(prefix + hashable if types else hashable)
+        return
+    elif isinstance(data, (tuple, list, zip)):
         needs_iteration = True
     else:
         needs_iteration = any(check(data) for check in
@@ -905,13 +1060,16 @@ def _update_hasher(hasher, data, types=True, extensions=None):
         hasher.update(ITER_PREFIX)
         # first, try to nest quickly without recursive calls
         # (this works if all data in the sequence is a non-iterable)
+        needs_recursion = False
         try:
             for item in iter_:
-                prefix, hashable = _convert_to_hashable(item, types,
-                                                        extensions=extensions)
-                binary_data = prefix + hashable + SEP
-                hasher.update(binary_data)
+                if not _stream_to_hasher(hasher, item, types, extensions,
+                                         SEP):
+                    needs_recursion = True
+                    break
         except TypeError:
+            needs_recursion = True
+        if needs_recursion:
             # need to use recursive calls
             # Update based on current item
             _update_hasher(hasher, item, types, extensions=extensions)
@@ -921,10 +1079,48 @@ def _update_hasher(hasher, data, types=True, extensions=None):
                 hasher.update(SEP)
         hasher.update(ITER_SUFFIX)
     else:
+        if not _stream_to_hasher(hasher, data, types, extensions, b''):
+            # Raises the appropriate TypeError
+            extensions.lookup(data)
+
+
+def _stream_to_hasher(hasher, data, types, extensions, suffix):
+    """
+    Feeds the hasher the bytes of :func:`_convert_to_hashable` followed by a
+    suffix. If the registered hash function for ``data`` has a ``__stream__``
+    attribute, then the bytes are fed incrementally, which avoids building a
+    byte representation of large nested data in memory.
+
+    Returns:
+        bool: False if there is no registered hash function for ``data``, in
+        which case the hasher is not updated.
+    """
+    converter = _SCALAR_CONVERTERS.get(data.__class__, None)
+    if converter is not None:
+        prefix, hashable = converter(data)
+        if types:
+            hasher.update(prefix + hashable + suffix)
+        else:
+            hasher.update(hashable + suffix)
+    elif isinstance(data, (bytes, str, int, float)):
         prefix, hashable = _convert_to_hashable(data, types,
                                                 extensions=extensions)
-        binary_data = prefix + hashable
-        hasher.update(binary_data)
+        hasher.update(prefix + hashable + suffix)
+    else:
+        hash_func = extensions._lookup_type(data.__class__)
+        if hash_func is None:
+            return False
+        stream_func = getattr(hash_func, '__stream__', None)
+        if stream_func is None:
+            prefix, hashable = hash_func(data)
+            if not types:
+                prefix = b''
+            hasher.update(prefix + hashable + suffix)
+        else:
+            stream_func(hasher, data, types)
+            if suffix:
+                hasher.update(suffix)
+    return True
 
 
 def _convert_hexstr_base(hexstr, base):
@@ -1071,8 +1267,120 @@ def hash_data(data, hasher=NoParam, base=NoParam, types=False, convert=False,
     return text
 
 
+def hash_data_many(items, hasher=NoParam, base=NoParam, types=False,
+                   extensions=None):
+    """
+    Hash each item in a collection of data.
+
+    This is equivalent to ``[hash_data(item, ...) for item in items]``, but
+    the hasher, base, and extensions are only resolved once, and new hashers
+    are created by copying a prototype. Items that are all the same primitive
+    type (e.g. all strings) and the rows of numpy arrays take a faster path.
+
+    Args:
+        items (Iterable[object]):
+            the data to hash. If this is a numpy array, each element along
+            the first axis is hashed.
+
+        hasher (str | Hasher | NoParamType):
+            string code or a hash algorithm from hashlib. See
+            :func:`hash_data` for details. Defaults to 'sha512'.
+
+        base (List[str] | str | NoParamType):
+            list of symbols or shorthand key.
+            Valid keys are 'abc', 'hex', and 'dec'. Defaults to 'hex'
+
+        types (bool):
+            If True data types are included in the hash, otherwise only the
+            raw data is hashed. Defaults to False.
+
+        extensions (HashableExtensions | None):
+            a custom :class:`HashableExtensions` instance that can overwrite
+            or define how different types of objects are hashed.
+
+    Returns:
+        List[str]: the hash of each item
+
+    Example:
+        >>> import ubelt as ub
+        >>> items = ['a', 'b', 'c']
+        >>> hashes = ub.hash_data_many(items, hasher='sha1')
+        >>> assert hashes == [ub.hash_data(item, hasher='sha1') for item in items]
+        >>> records = [(1, 'a'), {'b': 2.5}, None]
+        >>> hashes = ub.hash_data_many(records, types=True, base='abc')
+        >>> assert hashes == [ub.hash_data(r, types=True, base='abc') for r in records]
+
+    Example:
+        >>> # xdoctest: +REQUIRES(module:numpy)
+        >>> import ubelt as ub
+        >>> import numpy as np
+        >>> rows = np.arange(12).reshape(4, 3)
+        >>> hashes = ub.hash_data_many(rows)
+        >>> assert hashes == [ub.hash_data(row) for row in rows]
+        >>> hashes = ub.hash_data_many(rows.ravel())
+        >>> assert hashes == [ub.hash_data(x) for x in rows.ravel()]
+    """
+    base = _rectify_base(base)
+    # Note, if the hasher is an instance, each item is hashed with a copy of
+    # its current state.
+    proto = _rectify_hasher(hasher)()
+    new_hasher = proto.copy
+    if extensions is None:
+        extensions = _HASHABLE_EXTENSIONS
+
+    if type(items).__module__ == 'numpy' and type(items).__name__ == 'ndarray':
+        if items.dtype.kind in 'iufUS' and items.ndim == 1:
+            # Numpy scalars are hashed like their python equivalents
+            items = items.tolist()
+        elif items.dtype.kind != 'O' and items.ndim > 1 and len(items):
+            hash_func = extensions.lookup(items[0])
+            numpy_header = getattr(hash_func, '__numpy_header__', None)
+            if numpy_header is not None:
+                # All rows share the same shape and dtype, so we only need to
+                # build their header once.
+                head = numpy_header(items[0])
+                if types:
+                    head = b'NDARR' + head
+                proto.update(head)
+                import numpy as np
+                results = []
+                for row in items:
+                    if not row.flags['C_CONTIGUOUS']:
+                        row = np.ascontiguousarray(row)
+                    item_hasher = new_hasher()
+                    item_hasher.update(row.reshape(-1).view(np.uint8))
+                    results.append(_digest_hasher(item_hasher, base))
+                return results
+    else:
+        items = list(items)
+
+    item_types = set(map(type, items))
+    results = []
+    if item_types == {str}:
+        prefix = b'TXT' if types else b''
+        for item in items:
+            item_hasher = new_hasher()
+            item_hasher.update(prefix + item.encode('utf-8'))
+            results.append(_digest_hasher(item_hasher, base))
+    elif len(item_types) == 1 and item_types.issubset(_SCALAR_CONVERTERS):
+        converter = _SCALAR_CONVERTERS[item_types.pop()]
+        for item in items:
+            prefix, hashable = converter(item)
+            item_hasher = new_hasher()
+            item_hasher.update(prefix + hashable if types else hashable)
+            results.append(_digest_hasher(item_hasher, base))
+    else:
+        for item in items:
+            item_hasher = new_hasher()
+            _update_hasher(item_hasher, item, types=types,
+                           extensions=extensions)
+            results.append(_digest_hasher(item_hasher, base))
+    return results
+
+
 def hash_file(fpath, blocksize=1048576, stride=1, maxbytes=None,
-              hasher=NoParam, base=NoParam):
+              hasher=NoParam, base=NoParam, backend='auto', cache=False,
+              tree=False, chunksize=_TREE_CHUNKSIZE, max_workers=0):
     """
     Hashes the data in a file on disk.
 
@@ -1109,6 +1417,37 @@ def hash_file(fpath, blocksize=1048576, stride=1, maxbytes=None,
             list of symbols or shorthand key.
             Valid keys are 'abc', 'hex', and 'dec'. Defaults to 'hex'.
 
+        backend (str):
+            How the file is read. Can be 'readinto', which reuses a single
+            preallocated buffer, or 'mmap', which memory maps the file and
+            can be faster for large local files. The choice of backend does
+            not change the resulting hash. Defaults to 'auto', which is
+            currently 'readinto'.
+
+        cache (bool | FileHashCache):
+            If truthy, lookup the hash in a persistent :class:`FileHashCache`
+            before reading the file, and store it there afterwards. If True
+            the default cache in the ubelt application cache directory is
+            used. The cache is only used if the hasher is specified by name
+            or class. Defaults to False.
+
+        tree (bool):
+            If True, the file is split into chunks of ``chunksize`` bytes that
+            are hashed independently (and possibly in parallel) and combined
+            into the root of a Merkle tree. This is a different digest scheme
+            than the default, so the result will not agree with standard UNIX
+            commands. See :func:`hash_file_chunks` for details. Tree hashes
+            always use the 'readinto' backend and do not support strides.
+            Defaults to False.
+
+        chunksize (int):
+            The number of bytes in each leaf of the tree when ``tree=True``.
+            The result depends on this value. Defaults to 2 ** 26 (64MB).
+
+        max_workers (int):
+            The number of threads used to hash the chunks when ``tree=True``.
+            If 0, the chunks are hashed serially. Defaults to 0.
+
     Note:
         For better hashes keep stride = 1.
         For faster hashes set stride > 1.
@@ -1151,6 +1490,37 @@ def hash_file(fpath, blocksize=1048576, stride=1, maxbytes=None,
         >>> assert h1 == h0
         >>> assert h2 == h4
 
+        >>> # The mmap backend gives the same results
+        >>> h5 = ub.hash_file(fpath, hasher='sha1', base='hex', maxbytes=16, blocksize=18, stride=2, backend='mmap')
+        >>> assert h5 == h4
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash').ensuredir()
+        >>> fpath = dpath / 'tmp3.txt'
+        >>> fpath.write_text('cache me')
+        >>> cache = ub.util_hash.FileHashCache(dpath / 'demo_hash_cache.sqlite')
+        >>> cache.clear()
+        >>> h1 = ub.hash_file(fpath, hasher='sha1', cache=cache)
+        >>> assert len(cache) == 1
+        >>> # The second call does not need to read the file
+        >>> h2 = ub.hash_file(fpath, hasher='sha1', cache=cache)
+        >>> assert h1 == h2
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash').ensuredir()
+        >>> fpath = dpath / 'tmp_tree.txt'
+        >>> fpath.write_text('abcdefghijklmnop')
+        >>> # A tree hash can hash chunks of a large file in parallel
+        >>> h1 = ub.hash_file(fpath, hasher='sha1', tree=True, chunksize=5)
+        >>> h2 = ub.hash_file(fpath, hasher='sha1', tree=True, chunksize=5,
+        >>>                   max_workers=2)
+        >>> assert h1 == h2
+        >>> # But it is a distinct digest scheme
+        >>> assert h1 != ub.hash_file(fpath, hasher='sha1')
+        >>> assert h1 != ub.hash_file(fpath, hasher='sha1', tree=True, chunksize=6)
+
     Example:
         >>> import ubelt as ub
         >>> from os.path import join
@@ -1178,45 +1548,668 @@ def hash_file(fpath, blocksize=1048576, stride=1, maxbytes=None,
         >>>     assert want.endswith(got)
     """
     base = _rectify_base(base)
+    hash_cache = None
+    if cache is not False and cache is not None:
+        # Hasher instances may carry state, so we cannot cache their result
+        if not hasattr(hasher, 'hexdigest'):
+            hash_cache = _rectify_file_hash_cache(cache)
     hasher = _rectify_hasher(hasher)()
+    if tree and stride > 1:
+        raise ValueError('tree hashes do not support stride > 1')
+
+    if hash_cache is not None:
+        import os
+        params = hash_cache._params(hasher, blocksize, stride, maxbytes)
+        if tree:
+            # Tree hashes are a distinct scheme that depends on the chunksize
+            params = ('tree{}:{}'.format(chunksize, params[0]),) + params[1:]
+        stat = os.stat(fpath)
+        hex_text = hash_cache._lookup_stats([stat], params)[0]
+        if hex_text is not None:
+            return _convert_hexstr_base(hex_text, base)
+
+    if tree:
+        leaves = _hash_file_chunk_digests(
+            fpath, chunksize, hasher, blocksize=blocksize, maxbytes=maxbytes,
+            max_workers=max_workers)
+        hex_text = _merkle_root(leaves, hasher).hex()
+    else:
+        if backend == 'auto' or backend == 'readinto':
+            _update_hasher_readinto(hasher, fpath, blocksize, stride,
+                                    maxbytes)
+        elif backend == 'mmap':
+            _update_hasher_mmap(hasher, fpath, blocksize, stride, maxbytes)
+        else:
+            raise KeyError('unknown backend: {}'.format(backend))
+        if hash_cache is None:
+            # Get the hashed representation
+            text = _digest_hasher(hasher, base)
+            return text
+        hex_text = hasher.hexdigest()
+
+    if hash_cache is not None:
+        # Only store the result if the file did not change while hashing
+        if hash_cache._stat_key(os.stat(fpath)) == hash_cache._stat_key(stat):
+            hash_cache._store_stats([(stat, hex_text)], params)
+    return _convert_hexstr_base(hex_text, base)
+
+
+def _update_hasher_readinto(hasher, fpath, blocksize, stride, maxbytes,
+                            offset=0):
+    """
+    Feeds the contents of a file into a hasher by reading into a single
+    preallocated buffer. This avoids allocating a new bytes object for each
+    block. If ``offset`` is specified, reading starts at that byte.
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_hash import _update_hasher_readinto
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash').ensuredir()
+        >>> fpath = dpath / 'tmp_readinto.txt'
+        >>> fpath.write_text('abcdefghijklmnop')
+        >>> hasher = hashlib.sha1()
+        >>> _update_hasher_readinto(hasher, fpath, 3, 2, 5)
+        >>> assert hasher.hexdigest() == hashlib.sha1(b'abcghi'[0:5]).hexdigest()
+    """
+    buf = bytearray(blocksize)
+    view = memoryview(buf)
     with open(fpath, 'rb') as file:
-        buf = file.read(blocksize)
-        # We separate implementations for speed. Haven't benchmarked, but the
-        # idea is to keep the inner loop extremely tight
+        if offset:
+            file.seek(offset)
+        # Bind methods locally to keep the inner loop tight
+        readinto = file.readinto
+        update = hasher.update
+        skip = blocksize * (stride - 1)
         if maxbytes is None:
+            nread = readinto(buf)
             if stride > 1:
                 # skip blocks when stride is greater than 1
-                while len(buf) > 0:
-                    hasher.update(buf)
-                    file.seek(blocksize * (stride - 1), 1)
-                    buf = file.read(blocksize)
+                while nread > 0:
+                    update(view[:nread])
+                    file.seek(skip, 1)
+                    nread = readinto(buf)
             else:
                 # otherwise hash the entire file
-                while len(buf) > 0:
-                    hasher.update(buf)
-                    buf = file.read(blocksize)
+                while nread > 0:
+                    update(view[:nread])
+                    nread = readinto(buf)
         else:
             # In this case we hash at most ``maxbytes``
             maxremain = maxbytes
-            if stride > 1:
-                while len(buf) > 0 and maxremain > 0:
-                    buf = buf[:maxremain]
-                    maxremain -= len(buf)
-                    hasher.update(buf)
-                    if maxremain > 0:
-                        file.seek(blocksize * (stride - 1), 1)
-                        buf = file.read(blocksize)
+            while maxremain > 0:
+                if maxremain < blocksize:
+                    nread = readinto(view[:maxremain])
+                else:
+                    nread = readinto(buf)
+                if nread <= 0:
+                    break
+                update(view[:nread])
+                maxremain -= nread
+                if stride > 1 and maxremain > 0:
+                    file.seek(skip, 1)
+    view.release()
+
+
+def _update_hasher_mmap(hasher, fpath, blocksize, stride, maxbytes):
+    """
+    Feeds the contents of a file into a hasher using a read-only memory map,
+    which lets the hasher consume the page cache directly.
+
+    Example:
+        >>> import ubelt as ub
+        >>> from ubelt.util_hash import _update_hasher_mmap
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash').ensuredir()
+        >>> fpath = dpath / 'tmp_mmap.txt'
+        >>> fpath.write_text('abcdefghijklmnop')
+        >>> hasher = hashlib.sha1()
+        >>> _update_hasher_mmap(hasher, fpath, 3, 2, 5)
+        >>> assert hasher.hexdigest() == hashlib.sha1(b'abcghi'[0:5]).hexdigest()
+        >>> # Empty files cannot be mapped, but can be hashed
+        >>> fpath = ub.touch(dpath / 'tmp_mmap_empty.txt')
+        >>> hasher = hashlib.sha1()
+        >>> _update_hasher_mmap(hasher, fpath, 3, 1, None)
+        >>> assert hasher.hexdigest() == hashlib.sha1(b'').hexdigest()
+    """
+    import mmap
+    import os
+    with open(fpath, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mem:
+            view = memoryview(mem)
+            try:
+                update = hasher.update
+                step = blocksize * stride
+                maxremain = size if maxbytes is None else maxbytes
+                pos = 0
+                while pos < size and maxremain > 0:
+                    nbytes = min(blocksize, maxremain)
+                    chunk = view[pos:pos + nbytes]
+                    update(chunk)
+                    maxremain -= len(chunk)
+                    chunk.release()
+                    pos += step
+            finally:
+                view.release()
+
+
+def hash_file_chunks(fpath, chunksize=_TREE_CHUNKSIZE, hasher=NoParam,
+                     base=NoParam, blocksize=1048576, maxbytes=None,
+                     indices=None, max_workers=0, mode='thread'):
+    """
+    Hashes fixed-size chunks of a file independently.
+
+    These are the leaves of the Merkle tree used by
+    ``hash_file(..., tree=True)``. Keeping the leaf digests around makes it
+    possible to re-verify a file or resume a partial download by only
+    checking the chunks that changed.
+
+    The digest scheme is as follows. The file is split into chunks of
+    ``chunksize`` bytes (the last chunk may be shorter, and an empty file has
+    a single empty chunk). The digest of each leaf is ``H(b'\\x00' + chunk)``.
+    Adjacent pairs of digests are combined into ``H(b'\\x01' + left +
+    right)`` level by level, and an odd digest at the end of a level is
+    promoted to the next level unchanged. The single remaining digest is the
+    root returned by ``hash_file(..., tree=True)``.
+
+    Args:
+        fpath (PathLike):
+            location of the file to be hashed.
+
+        chunksize (int):
+            The number of bytes in each chunk. Defaults to 2 ** 26 (64MB).
+
+        hasher (str | Hasher | NoParamType):
+            string code or a hash algorithm from hashlib. See
+            :func:`hash_file` for details. Defaults to 'sha512'.
+
+        base (List[str] | str | NoParamType):
+            list of symbols or shorthand key.
+            Valid keys are 'abc', 'hex', and 'dec'. Defaults to 'hex'.
+
+        blocksize (int):
+            Amount of data to read at a time within each chunk. Does not
+            influence the result. Defaults to 2 ** 20.
+
+        maxbytes (int | None):
+            if specified, only hash the leading `maxbytes` of data in the file.
+
+        indices (Iterable[int] | None):
+            if specified, only hash the chunks with these indices.
+
+        max_workers (int):
+            number of parallel workers. If 0, chunks are hashed serially.
+            Defaults to 0.
+
+        mode (str):
+            the backend used to parallelize the work. Can be 'thread',
+            'process', or 'serial'. In 'process' mode the hasher must be
+            available by name in :mod:`hashlib`. Defaults to 'thread'.
+
+    Returns:
+        List[str]: the hash of each requested chunk
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash').ensuredir()
+        >>> fpath = dpath / 'tmp_chunks.txt'
+        >>> fpath.write_text('abcdefghijklmnop')
+        >>> leaves = ub.hash_file_chunks(fpath, chunksize=5, hasher='sha1')
+        >>> assert len(leaves) == 4
+        >>> # Modify the file and find the chunks that changed
+        >>> fpath.write_text('abcdefghijkXmnop')
+        >>> new_leaves = ub.hash_file_chunks(fpath, chunksize=5, hasher='sha1')
+        >>> changed = [idx for idx, (old, new) in enumerate(zip(leaves, new_leaves))
+        >>>            if old != new]
+        >>> assert changed == [2]
+        >>> # We can rehash only specific chunks
+        >>> subset = ub.hash_file_chunks(fpath, chunksize=5, hasher='sha1',
+        >>>                              indices=[0, 3])
+        >>> assert subset == [leaves[0], leaves[3]]
+    """
+    base = _rectify_base(base)
+    hasher = _rectify_hasher(hasher)()
+    leaves = _hash_file_chunk_digests(
+        fpath, chunksize, hasher, blocksize=blocksize, maxbytes=maxbytes,
+        indices=indices, max_workers=max_workers, mode=mode)
+    return [_convert_hexstr_base(leaf.hex(), base) for leaf in leaves]
+
+
+def _hash_file_chunk_digests(fpath, chunksize, hasher, blocksize=1048576,
+                             maxbytes=None, indices=None, max_workers=0,
+                             mode='thread'):
+    """
+    Computes the raw leaf digests used by :func:`hash_file_chunks`.
+
+    Args:
+        hasher (Hasher): a prototype hasher instance that is copied for each
+            chunk.
+
+    Returns:
+        List[bytes]
+    """
+    import os
+    from ubelt.util_futures import JobPool
+    if chunksize <= 0:
+        raise ValueError('chunksize must be positive')
+    total = os.stat(fpath).st_size
+    if maxbytes is not None:
+        total = min(total, maxbytes)
+    num_chunks = max(1, -(-total // chunksize))
+    if indices is None:
+        indices = range(num_chunks)
+    if mode == 'process':
+        # Hasher instances cannot be pickled, so send the name instead
+        hasher_for = lambda: hasher.name  # NOQA
+    else:
+        hasher_for = hasher.copy
+    pool = JobPool(mode=mode, max_workers=max_workers)
+    with pool:
+        for index in indices:
+            if index < 0 or index >= num_chunks:
+                raise IndexError('chunk index {} out of range'.format(index))
+            offset = index * chunksize
+            nbytes = min(chunksize, total - offset)
+            pool.submit(_hash_file_chunk, fpath, offset, nbytes, hasher_for(),
+                        blocksize)
+        leaves = [job.result() for job in pool.jobs]
+    return leaves
+
+
+def _hash_file_chunk(fpath, offset, nbytes, hasher, blocksize):
+    """
+    Returns the leaf digest of a single chunk of a file.
+
+    Args:
+        hasher (str | Hasher): a fresh hasher or the name of one
+
+    Returns:
+        bytes
+    """
+    hasher = _rectify_hasher(hasher)()
+    hasher.update(b'\x00')
+    if nbytes > 0:
+        _update_hasher_readinto(hasher, fpath, min(blocksize, nbytes), 1,
+                                nbytes, offset=offset)
+    return hasher.digest()
+
+
+def _merkle_root(leaves, hasher):
+    """
+    Combines leaf digests into the root of a Merkle tree.
+
+    Args:
+        leaves (List[bytes]): the leaf digests
+        hasher (Hasher): a prototype hasher instance that is copied for each
+            internal node.
+
+    Returns:
+        bytes
+
+    Example:
+        >>> from ubelt.util_hash import _merkle_root
+        >>> leaves = [bytes([i]) for i in range(3)]
+        >>> h01 = hashlib.sha1(bytes([1, 0, 1])).digest()
+        >>> want = hashlib.sha1(bytes([1]) + h01 + bytes([2])).digest()
+        >>> assert _merkle_root(leaves, hashlib.sha1()) == want
+    """
+    level = list(leaves)
+    while len(level) > 1:
+        next_level = []
+        for idx in range(0, len(level) - 1, 2):
+            node = hasher.copy()
+            node.update(b'\x01' + level[idx] + level[idx + 1])
+            next_level.append(node.digest())
+        if len(level) % 2:
+            # An odd digest is promoted to the next level unchanged
+            next_level.append(level[-1])
+        level = next_level
+    return level[0]
+
+
+def hash_files(fpaths, hasher=NoParam, base=NoParam, max_workers=0,
+               mode='thread', ordered=True, desc=None, progkw=None, **kwargs):
+    """
+    Hashes multiple files on disk in parallel.
+
+    This is a thin wrapper that executes :func:`hash_file` for each path in a
+    :class:`ubelt.util_futures.JobPool`. Because :mod:`hashlib` releases the
+    GIL when hashing large buffers, the thread backend is usually enough to
+    saturate disk bandwidth.
+
+    Args:
+        fpaths (Iterable[PathLike]):
+            locations of the files to be hashed.
+
+        hasher (str | Hasher | NoParamType):
+            string code or a hash algorithm from hashlib. See
+            :func:`hash_file` for details. If a hasher instance is given, a
+            copy of it is used for each file. Defaults to 'sha512'.
+
+        base (List[str] | str | NoParamType):
+            list of symbols or shorthand key.
+            Valid keys are 'abc', 'hex', and 'dec'. Defaults to 'hex'.
+
+        max_workers (int):
+            number of parallel workers. If 0, files are hashed serially.
+            Defaults to 0.
+
+        mode (str):
+            the backend used to parallelize the work. Can be 'thread',
+            'process', or 'serial'. Defaults to 'thread'.
+
+        ordered (bool):
+            if True, results are generated in the same order as the input
+            paths, otherwise they are generated as soon as they complete.
+            Defaults to True.
+
+        desc (str | None):
+            if specified, reports progress with a
+            :class:`ubelt.progiter.ProgIter` object.
+
+        progkw (dict | None):
+            extra keyword arguments to :class:`ubelt.progiter.ProgIter`.
+
+        **kwargs:
+            passed to :func:`hash_file` (e.g. blocksize, stride, maxbytes).
+
+    Yields:
+        Tuple[PathLike, str]:
+            each input path and the text representing its hashed data
+
+    Note:
+        The hashes are computed lazily as the generator is consumed. In
+        ``mode='process'`` the hasher must be specified as a string code or a
+        picklable hasher class.
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash-files').ensuredir()
+        >>> fpaths = []
+        >>> for idx in range(10):
+        >>>     fpath = dpath / 'file_{}.txt'.format(idx)
+        >>>     fpath.write_text('data {}'.format(idx))
+        >>>     fpaths.append(fpath)
+        >>> results = list(ub.hash_files(fpaths, hasher='sha1', max_workers=4))
+        >>> assert [p for p, _ in results] == fpaths
+        >>> assert results[0][1] == ub.hash_file(fpaths[0], hasher='sha1')
+        >>> # Results can also be generated as they finish
+        >>> unordered = dict(ub.hash_files(fpaths, hasher='sha1', max_workers=4,
+        >>>                                ordered=False, desc='hashing'))
+        >>> assert unordered == dict(results)
+    """
+    from ubelt.util_futures import JobPool
+    if hasattr(hasher, 'hexdigest'):
+        # The same hasher instance cannot be reused for multiple files
+        hasher_for = hasher.copy
+    else:
+        # Pass the hasher spec through so it can be pickled in process mode
+        hasher_for = lambda: hasher  # NOQA
+    pool = JobPool(mode=mode, max_workers=max_workers)
+    with pool:
+        job_to_fpath = {}
+        for fpath in fpaths:
+            job = pool.submit(hash_file, fpath, hasher=hasher_for(),
+                              base=base, **kwargs)
+            job_to_fpath[job] = fpath
+        if ordered:
+            job_iter = iter(pool.jobs)
+            if desc is not None:
+                from ubelt.progiter import ProgIter
+                if progkw is None:
+                    progkw = {}
+                job_iter = ProgIter(job_iter, desc=desc, total=len(pool),
+                                    **progkw)
+        else:
+            job_iter = pool.as_completed(desc=desc, progkw=progkw)
+        for job in job_iter:
+            yield job_to_fpath[job], job.result()
+
+
+class FileHashCache(object):
+    """
+    A persistent on-disk cache of file hashes.
+
+    Entries are keyed on the device, inode, size, and modification time (in
+    nanoseconds) of a file as well as the hasher, blocksize, stride, and
+    maxbytes used to compute its hash. If any of the file stats change, the
+    cached entry is ignored and replaced the next time the file is hashed.
+
+    The cache is stored in a sqlite database, so multiple processes can
+    safely read and write to it at the same time. When more than
+    ``max_entries`` are stored the least recently used entries are removed.
+
+    Args:
+        fpath (str | PathLike | None):
+            Location of the cache database. Defaults to a file in the ubelt
+            application cache directory.
+
+        max_entries (int):
+            The maximum number of hashes to keep. Defaults to 1,000,000.
+
+    Note:
+        Like make, this assumes that a file with the same inode, size, and
+        mtime has the same contents. On filesystems with a coarse timestamp
+        resolution, a file that is rewritten in place with data of the same
+        size immediately after it was hashed could be missed.
+
+    Note:
+        The locking used by sqlite is not reliable on some network
+        filesystems. If you hash files on NFS, keep the cache database on a
+        local disk.
+
+    Example:
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/test-hash-cache').ensuredir()
+        >>> fpaths = [dpath / 'file_{}.txt'.format(i) for i in range(3)]
+        >>> for fpath in fpaths:
+        >>>     fpath.write_text(fpath.name)
+        >>> self = ub.util_hash.FileHashCache(dpath / 'cache.sqlite', max_entries=2)
+        >>> self.clear()
+        >>> assert self.lookup_many(fpaths, hasher='sha1') == [None] * 3
+        >>> hashes = [ub.hash_file(p, hasher='sha1', cache=self) for p in fpaths]
+        >>> # Only the most recently used entries are kept
+        >>> assert len(self) == 2
+        >>> assert self.lookup_many(fpaths, hasher='sha1') == [None] + hashes[1:]
+        >>> # Modifying a file invalidates its entry
+        >>> fpaths[2].write_text('new contents')
+        >>> assert self.lookup(fpaths[2], hasher='sha1') is None
+    """
+
+    def __init__(self, fpath=None, max_entries=1000000):
+        import threading
+        if fpath is None:
+            from ubelt.util_path import Path
+            dpath = Path.appdir('ubelt', 'hash_cache').ensuredir()
+            fpath = dpath / 'file_hashes.sqlite'
+        self.fpath = fpath
+        self.max_entries = max_entries
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Connections and locks cannot be sent to other processes
+        return {'fpath': self.fpath, 'max_entries': self.max_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _connect(self):
+        """
+        Returns a connection for the current process, creating it if needed.
+        """
+        import os
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            import sqlite3
+            conn = sqlite3.connect(os.fspath(self.fpath), timeout=60,
+                                   isolation_level=None,
+                                   check_same_thread=False)
+            try:
+                # WAL mode lets readers proceed while another process writes
+                conn.execute('PRAGMA journal_mode=WAL')
+            except sqlite3.OperationalError:  # nocover
+                pass
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS file_hashes ('
+                'dev INTEGER, ino INTEGER, hasher TEXT, blocksize INTEGER, '
+                'stride INTEGER, maxbytes INTEGER, size INTEGER, '
+                'mtime_ns INTEGER, hexdigest TEXT, last_access REAL, '
+                'PRIMARY KEY (dev, ino, hasher, blocksize, stride, maxbytes))')
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS file_hashes_last_access '
+                'ON file_hashes (last_access)')
+            self._conn = conn
+            self._pid = pid
+        return self._conn
+
+    @staticmethod
+    def _stat_key(stat):
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _params(hasher, blocksize, stride, maxbytes):
+        """
+        Normalizes the parameters that influence a file hash.
+
+        Args:
+            hasher (Hasher): a fresh hasher instance
+        """
+        # The blocksize only influences the hash when a stride is used
+        blocksize = blocksize if stride > 1 else 0
+        maxbytes = -1 if maxbytes is None else maxbytes
+        return (hasher.name, blocksize, stride, maxbytes)
+
+    def _lookup_stats(self, stats, params):
+        import time
+        now = time.time()
+        hexdigests = []
+        hits = []
+        with self._lock:
+            conn = self._connect()
+            for stat in stats:
+                dev, ino, size, mtime_ns = self._stat_key(stat)
+                row = conn.execute(
+                    'SELECT size, mtime_ns, hexdigest FROM file_hashes WHERE '
+                    'dev=? AND ino=? AND hasher=? AND blocksize=? AND '
+                    'stride=? AND maxbytes=?', (dev, ino) + params).fetchone()
+                if row is not None and row[0:2] == (size, mtime_ns):
+                    hexdigests.append(row[2])
+                    hits.append((now, dev, ino) + params)
+                else:
+                    hexdigests.append(None)
+            if hits:
+                # Mark the entries as recently used
+                conn.executemany(
+                    'UPDATE file_hashes SET last_access=? WHERE '
+                    'dev=? AND ino=? AND hasher=? AND blocksize=? AND '
+                    'stride=? AND maxbytes=?', hits)
+        return hexdigests
+
+    def _store_stats(self, items, params):
+        import time
+        now = time.time()
+        rows = [
+            self._stat_key(stat)[0:2] + params + self._stat_key(stat)[2:4] +
+            (hexdigest, now)
+            for stat, hexdigest in items
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO file_hashes VALUES '
+                    '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                num = conn.execute(
+                    'SELECT COUNT(*) FROM file_hashes').fetchone()[0]
+                excess = num - self.max_entries
+                if excess > 0:
+                    # Evict the least recently used entries
+                    conn.execute(
+                        'DELETE FROM file_hashes WHERE rowid IN ('
+                        'SELECT rowid FROM file_hashes '
+                        'ORDER BY last_access LIMIT ?)', (excess,))
+            except Exception:  # nocover
+                conn.execute('ROLLBACK')
+                raise
             else:
-                while len(buf) > 0 and maxremain > 0:
-                    buf = buf[:maxremain]
-                    maxremain -= len(buf)
-                    hasher.update(buf)
-                    if maxremain > 0:
-                        buf = file.read(blocksize)
+                conn.execute('COMMIT')
 
-    # Get the hashed representation
-    text = _digest_hasher(hasher, base)
-    return text
+    def lookup_many(self, fpaths, hasher=NoParam, blocksize=1048576, stride=1,
+                    maxbytes=None):
+        """
+        Lookup the cached hashes of multiple files.
+
+        Args:
+            fpaths (Iterable[PathLike]): locations of the files
+            hasher (str | Hasher | NoParamType): see :func:`hash_file`
+            blocksize (int): see :func:`hash_file`
+            stride (int): see :func:`hash_file`
+            maxbytes (int | None): see :func:`hash_file`
+
+        Returns:
+            List[str | None]:
+                the hex digest of each file or None if it is not cached, or
+                the file does not exist.
+        """
+        import os
+        params = self._params(_rectify_hasher(hasher)(), blocksize, stride,
+                              maxbytes)
+        stats = []
+        for fpath in fpaths:
+            try:
+                stats.append(os.stat(fpath))
+            except FileNotFoundError:
+                stats.append(None)
+        found = self._lookup_stats([s for s in stats if s is not None],
+                                   params)
+        found_iter = iter(found)
+        return [None if s is None else next(found_iter) for s in stats]
+
+    def lookup(self, fpath, hasher=NoParam, blocksize=1048576, stride=1,
+               maxbytes=None):
+        """
+        Lookup the cached hash of a single file.
+
+        See :func:`FileHashCache.lookup_many` for details.
+
+        Returns:
+            str | None: the hex digest of the file or None
+        """
+        return self.lookup_many([fpath], hasher=hasher, blocksize=blocksize,
+                                stride=stride, maxbytes=maxbytes)[0]
+
+    def __len__(self):
+        with self._lock:
+            conn = self._connect()
+            return conn.execute('SELECT COUNT(*) FROM file_hashes').fetchone()[0]
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM file_hashes')
+
+
+_FILE_HASH_CACHE = None
+
+
+def _rectify_file_hash_cache(cache):
+    """
+    Returns the default :class:`FileHashCache` if cache is True, otherwise
+    cache is assumed to be a :class:`FileHashCache` and returned as is.
+    """
+    global _FILE_HASH_CACHE
+    if cache is True:
+        if _FILE_HASH_CACHE is None:
+            _FILE_HASH_CACHE = FileHashCache()
+        cache = _FILE_HASH_CACHE
+    return cache
 
 
 # Give the hash_data function itself a reference to the default extensions
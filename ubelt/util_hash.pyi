@@ -7,6 +7,8 @@ from typing import List
 from os import PathLike
 from _typeshed import Incomplete
 from typing import TypeVar
+from typing import Iterable
+from typing import Generator
 
 Hasher = TypeVar("Hasher")
 HASH_VERSION: int
@@ -76,10 +78,79 @@ def hash_data(data: object,
     ...
 
 
+def hash_data_many(items: Iterable[object],
+                   hasher: Union[str, Hasher, NoParamType] = NoParam,
+                   base: Union[List[str], str, NoParamType] = NoParam,
+                   types: bool = False,
+                   extensions: Union[HashableExtensions, None] = None) -> List[str]:
+    ...
+
+
 def hash_file(fpath: PathLike,
               blocksize: int = 1048576,
               stride: int = 1,
               maxbytes: Union[int, None] = None,
               hasher: Union[str, Hasher, NoParamType] = NoParam,
-              base: Union[List[str], str, NoParamType] = NoParam):
+              base: Union[List[str], str, NoParamType] = NoParam,
+              backend: str = 'auto',
+              cache: Union[bool, FileHashCache] = False,
+              tree: bool = False,
+              chunksize: int = ...,
+              max_workers: int = 0):
     ...
+
+
+def hash_file_chunks(fpath: PathLike,
+                     chunksize: int = ...,
+                     hasher: Union[str, Hasher, NoParamType] = NoParam,
+                     base: Union[List[str], str, NoParamType] = NoParam,
+                     blocksize: int = 1048576,
+                     maxbytes: Union[int, None] = None,
+                     indices: Union[Iterable[int], None] = None,
+                     max_workers: int = 0,
+                     mode: str = 'thread') -> List[str]:
+    ...
+
+
+def hash_files(fpaths: Iterable[PathLike],
+               hasher: Union[str, Hasher, NoParamType] = NoParam,
+               base: Union[List[str], str, NoParamType] = NoParam,
+               max_workers: int = 0,
+               mode: str = 'thread',
+               ordered: bool = True,
+               desc: Union[str, None] = None,
+               progkw: Union[dict, None] = None,
+               **kwargs) -> Generator[Tuple[PathLike, str], None, None]:
+    ...
+
+
+class FileHashCache:
+    fpath: Incomplete
+    max_entries: int
+
+    def __init__(self,
+                 fpath: Union[str, PathLike, None] = None,
+                 max_entries: int = 1000000) -> None:
+        ...
+
+    def lookup_many(self,
+                    fpaths: Iterable[PathLike],
+                    hasher: Union[str, Hasher, NoParamType] = NoParam,
+                    blocksize: int = 1048576,
+                    stride: int = 1,
+                    maxbytes: Union[int, None] = None) -> List[str | None]:
+        ...
+
+    def lookup(self,
+               fpath: PathLike,
+               hasher: Union[str, Hasher, NoParamType] = NoParam,
+               blocksize: int = 1048576,
+               stride: int = 1,
+               maxbytes: Union[int, None] = None) -> str | None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def clear(self) -> None:
+        ...
@@ -10,6 +10,9 @@ In Python 3.8+ :func:`memoize` and :func:`memoize_method` work similarly to the
 standard library :func:`functools.cache` and :func:`functools.memoize_method`,
 but the ubelt version makes use of :func:`ubelt.util_hash.hash_data`, which
 is slower, but handles inputs containing mutable containers.
+Passing ``key='fast'`` uses a cheaper non-cryptographic key for such inputs.
+Passing ``disk=True`` to :func:`memoize` also persists results between
+processes.
 
 Example:
     >>> import ubelt as ub
@@ -44,8 +47,10 @@ Example:
     >>> self.my_property2
     >>> self.my_property2
 """
+import collections
 import functools
 import sys
+import time
 from ubelt import util_hash
 
 
@@ -65,10 +70,16 @@ def _hashable(item):
         return item
 
 
-def _make_signature_key(args, kwargs):
+def _make_signature_key(args, kwargs, typed=False):
     """
     Transforms function args into a key that can be used by the cache
 
+    Args:
+        args (Tuple): positional arguments
+        kwargs (Dict): keyword arguments
+        typed (bool): if True, arguments of different types (e.g. 1 and 1.0)
+            produce different keys.
+
     Example:
         >>> from ubelt.util_memoize import _make_signature_key
         >>> args = (4, [1, 2])
@@ -103,10 +114,646 @@ def _make_signature_key(args, kwargs):
         msg = ('Signature is not hashable: '
                'args={} kwargs{}'.format(args, kwargs))
         raise TypeError(msg)
+    if typed:
+        key += (tuple(type(v) for v in args),
+                tuple(type(v) for v in kwargs.values()))
     return key
 
 
-def memoize(func):
+# Containers with more items than this are hashed by the fast signature key
+# instead of being frozen into nested tuples.
+_FREEZE_MAX_ITEMS = 64
+
+
+class _IdentityKey(object):
+    """
+    A key that is only equal to another key for the same object. It holds a
+    reference to the object, so its id cannot be reused while the key is in a
+    cache.
+
+    Example:
+        >>> from ubelt.util_memoize import _IdentityKey
+        >>> a, b = [1], [1]
+        >>> assert _IdentityKey(a) == _IdentityKey(a)
+        >>> assert _IdentityKey(a) != _IdentityKey(b)
+        >>> assert len({_IdentityKey(a), _IdentityKey(a)}) == 1
+    """
+    __slots__ = ('obj', '_id')
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._id = id(obj)
+
+    def __hash__(self):
+        return self._id
+
+    def __eq__(self, other):
+        return type(other) is _IdentityKey and other.obj is self.obj
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return '<_IdentityKey {} at {:#x}>'.format(
+            type(self.obj).__name__, self._id)
+
+
+def _fast_hasher():
+    """
+    Returns the fastest non-cryptographic hasher that is available
+    """
+    return 'xxh64' if 'xxh64' in util_hash._HASHERS else 'sha1'
+
+
+def _freeze(item):
+    """
+    Returns the item if it is naturally hashable, otherwise returns a cheap
+    hashable stand-in. Small lists, tuples, dicts, and sets are frozen into
+    nested tuples and frozensets, numpy arrays are keyed by identity, and
+    anything else is hashed with a fast non-cryptographic hasher.
+
+    Example:
+        >>> from ubelt.util_memoize import _freeze
+        >>> assert _freeze(1) == 1
+        >>> assert _freeze([1, [2, 3]]) == _freeze([1, [2, 3]])
+        >>> assert _freeze([1, [2, 3]]) != _freeze([1, [2, 4]])
+        >>> assert _freeze({'a': [1], 'b': 2}) == _freeze({'b': 2, 'a': [1]})
+        >>> assert _freeze([1, 2]) != _freeze({1, 2})
+        >>> assert _freeze((1, [2])) == _freeze([1, [2]])
+        >>> assert isinstance(_freeze([[i] for i in range(100)]), str)
+    """
+    # Check for mutable containers first, which avoids the cost of raising
+    # an exception in hash for each of them.
+    if isinstance(item, list):
+        return _freeze_sequence(item)
+    elif isinstance(item, dict):
+        try:
+            items = frozenset(item.items())
+        except TypeError:
+            if len(item) > _FREEZE_MAX_ITEMS:
+                return util_hash.hash_data(item, hasher=_fast_hasher())
+            items = frozenset([(k, _freeze(v)) for k, v in item.items()])
+        return (dict, items)
+    elif isinstance(item, set):
+        return (set, frozenset(item))
+    try:
+        hash(item)
+    except TypeError:
+        pass
+    else:
+        return item
+    if isinstance(item, tuple):
+        return _freeze_sequence(item)
+    np = sys.modules.get('numpy', None)
+    if np is not None and isinstance(item, np.ndarray):
+        return _IdentityKey(item)
+    return util_hash.hash_data(item, hasher=_fast_hasher())
+
+
+def _freeze_sequence(item):
+    """
+    Helper for :func:`_freeze` that handles lists and tuples
+    """
+    frozen = tuple(item)
+    try:
+        hash(frozen)
+    except TypeError:
+        if len(item) > _FREEZE_MAX_ITEMS:
+            return util_hash.hash_data(item, hasher=_fast_hasher())
+        frozen = tuple([_freeze(v) for v in item])
+    return (list, frozen)
+
+
+def _make_fast_signature_key(args, kwargs, typed=False):
+    """
+    A cheaper variant of :func:`_make_signature_key`, which avoids computing
+    a cryptographic hash of unhashable arguments.
+
+    Small containers are frozen into nested tuples, larger containers are
+    hashed with xxh64 (or sha1 if :mod:`xxhash` is not installed), and numpy
+    arrays are keyed by identity. Unlike the default key, an array that is
+    modified inplace will continue to map to its previously cached result.
+
+    Args:
+        args (Tuple): positional arguments
+        kwargs (Dict): keyword arguments
+        typed (bool): if True, arguments of different types (e.g. 1 and 1.0)
+            produce different keys.
+
+    Example:
+        >>> from ubelt.util_memoize import _make_fast_signature_key
+        >>> key1 = _make_fast_signature_key((4, [1, 2]), {'a': {'b': 1}})
+        >>> key2 = _make_fast_signature_key((4, [1, 2]), {'a': {'b': 1}})
+        >>> assert key1 == key2 and hash(key1) == hash(key2)
+        >>> assert key1 != _make_fast_signature_key((4, [1, 3]), {'a': {'b': 1}})
+
+    Example:
+        >>> # xdoctest: +REQUIRES(module:numpy)
+        >>> from ubelt.util_memoize import _make_fast_signature_key
+        >>> import numpy as np
+        >>> arr1 = np.zeros(3)
+        >>> arr2 = np.zeros(3)
+        >>> assert _make_fast_signature_key((arr1,), {}) == _make_fast_signature_key((arr1,), {})
+        >>> assert _make_fast_signature_key((arr1,), {}) != _make_fast_signature_key((arr2,), {})
+    """
+    kwitems = kwargs.items()
+    if (sys.version_info.major, sys.version_info.minor) < (3, 7):  # nocover
+        kwitems = sorted(kwitems)
+    kwitems = tuple(kwitems)
+    key = args, kwitems
+    try:
+        hash(key)
+    except TypeError:
+        try:
+            key = _freeze(args), _freeze(kwitems)
+        except TypeError:
+            msg = ('Signature is not hashable: '
+                   'args={} kwargs{}'.format(args, kwargs))
+            raise TypeError(msg)
+    if typed:
+        key += (tuple(type(v) for v in args),
+                tuple(type(v) for v in kwargs.values()))
+    return key
+
+
+def _rectify_key_func(key):
+    """
+    Returns a function that maps ``(args, kwargs, typed)`` to a cache key.
+
+    Args:
+        key (str | Callable):
+            'hash', 'fast', or a callable that is passed the arguments of
+            the memoized function and returns a hashable key.
+
+    Returns:
+        Callable
+    """
+    if key == 'hash':
+        return _make_signature_key
+    elif key == 'fast':
+        return _make_fast_signature_key
+    elif callable(key):
+        def _make_custom_key(args, kwargs, typed=False):
+            return key(*args, **kwargs)
+        return _make_custom_key
+    else:
+        raise KeyError('unknown key: {!r}'.format(key))
+
+
+# Indicates that a key is not in a memoization cache
+_MISSING = object()
+
+CacheInfo = collections.namedtuple('CacheInfo', [
+    'hits', 'misses', 'maxsize', 'currsize', 'evictions', 'nbytes'])
+
+
+class _MemoCache(object):
+    """
+    The storage used by :func:`memoize` and :class:`memoize_method`.
+
+    Entries are kept in a dictionary. If ``maxsize`` is specified, the
+    dictionary is ordered by recency of use and the least recently used entry
+    is evicted when it is full. If ``ttl`` is specified, entries expire that
+    many seconds after they were stored. All operations are O(1) (amortized).
+
+    The approximate number of bytes used by the cached values is tracked
+    using :func:`sys.getsizeof`, which does not include the size of objects
+    referenced by a value.
+
+    If ``lock`` is True, :func:`_MemoCache.get_or_compute` is thread-safe
+    and "single-flight": if several threads request the same missing key at
+    once, the value is computed by one of them and the others wait for it.
+
+    Args:
+        maxsize (int | None): maximum number of entries
+        ttl (float | None): number of seconds before an entry expires
+        lock (bool): if True, make get_or_compute thread-safe
+
+    Example:
+        >>> from ubelt.util_memoize import _MemoCache, _MISSING
+        >>> self = _MemoCache(maxsize=2)
+        >>> self.store('a', 1)
+        >>> self.store('b', 2)
+        >>> assert self.lookup('a') == 1
+        >>> self.store('c', 3)
+        >>> # 'b' was the least recently used
+        >>> assert self.lookup('b') is _MISSING
+        >>> info = self.info()
+        >>> print(info)
+        >>> assert info[0:5] == (1, 1, 2, 2, 1)
+        >>> # Entries can also expire
+        >>> import time
+        >>> self = _MemoCache(ttl=0.01)
+        >>> self.store('a', 1)
+        >>> time.sleep(0.02)
+        >>> assert self.lookup('a') is _MISSING
+    """
+
+    def __init__(self, maxsize=None, ttl=None, lock=False):
+        import threading
+        if maxsize is not None and maxsize < 0:
+            maxsize = 0
+        if lock:
+            self._lock = threading.Lock()
+        else:
+            self._lock = None
+        # Protects the bookkeeping of stored entries even when ``lock`` is
+        # False, so concurrent misses only cause redundant computation.
+        self._store_lock = threading.Lock()
+        # Maps keys that are being computed to a future of their value
+        self._inflight = {}
+        # Maps keys that are being computed to an asyncio task
+        self._tasks = {}
+        self.maxsize = maxsize
+        self.ttl = ttl
+        if maxsize is None and ttl is None:
+            self.data = {}
+        else:
+            self.data = collections.OrderedDict()
+        self._expires = {}
+        self._sizes = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def lookup(self, key):
+        """
+        Returns:
+            object: the cached value or ``_MISSING``
+        """
+        value = self.data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return value
+        if self.ttl is not None or self.maxsize is not None:
+            with self._store_lock:
+                if self.ttl is not None and \
+                        self._expires.get(key, 0) <= time.monotonic():
+                    if self._remove(key):
+                        self.evictions += 1
+                    self.misses += 1
+                    return _MISSING
+                if self.maxsize is not None and key in self.data:
+                    self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def store(self, key, value):
+        if self.maxsize == 0:
+            return
+        data = self.data
+        size = sys.getsizeof(value, 0)
+        with self._store_lock:
+            self._remove(key)
+            data[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            if self.ttl is not None:
+                now = time.monotonic()
+                self._expires[key] = now + self.ttl
+                if self.maxsize is None:
+                    # Without reordering on lookup, the oldest entries are
+                    # first
+                    while data:
+                        old_key = next(iter(data))
+                        if self._expires.get(old_key, 0) > now:
+                            break
+                        self._remove(old_key)
+                        self.evictions += 1
+            if self.maxsize is not None:
+                while len(data) > self.maxsize:
+                    old_key = next(iter(data))
+                    self._remove(old_key)
+                    self.evictions += 1
+
+    def get_or_compute(self, key, func, args, kwargs):
+        """
+        Returns the cached value of ``key`` or computes and stores it.
+
+        Args:
+            key (Hashable): the cache key
+            func (Callable): computes the value when called with
+                ``*args`` and ``**kwargs``
+            args (Tuple): positional arguments for func
+            kwargs (Dict): keyword arguments for func
+
+        Returns:
+            object: the value
+
+        Example:
+            >>> from ubelt.util_memoize import _MemoCache
+            >>> self = _MemoCache(lock=True)
+            >>> assert self.get_or_compute('a', int, ('1',), {}) == 1
+            >>> assert self.get_or_compute('a', int, ('2',), {}) == 1
+        """
+        lock = self._lock
+        if lock is None:
+            value = self.lookup(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                self.store(key, value)
+            return value
+
+        from concurrent.futures import Future
+        import threading
+        with lock:
+            value = self.lookup(key)
+            if value is not _MISSING:
+                return value
+            future = self._inflight.get(key, None)
+            if future is None:
+                future = self._inflight[key] = Future()
+                future._owner = threading.get_ident()
+                is_owner = True
+            else:
+                # Sharing an in-flight result is not a miss
+                self.misses -= 1
+                self.hits += 1
+                is_owner = False
+
+        if not is_owner:
+            if future._owner == threading.get_ident():
+                # A recursive call for the same key cannot wait for itself
+                return func(*args, **kwargs)
+            return future.result()
+
+        try:
+            value = func(*args, **kwargs)
+        except BaseException as ex:
+            with lock:
+                del self._inflight[key]
+            future.set_exception(ex)
+            raise
+        with lock:
+            self.store(key, value)
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    async def aget_or_compute(self, key, func, args, kwargs):
+        """
+        Like :func:`_MemoCache.get_or_compute`, but for a coroutine function.
+
+        The awaited result is cached. Concurrent callers of a missing key
+        await the same task, so the coroutine only runs once. Cancelling one
+        caller does not cancel the task for the others.
+
+        Args:
+            key (Hashable): the cache key
+            func (Callable): coroutine function that computes the value when
+                called with ``*args`` and ``**kwargs``
+            args (Tuple): positional arguments for func
+            kwargs (Dict): keyword arguments for func
+
+        Returns:
+            object: the value
+
+        Example:
+            >>> from ubelt.util_memoize import _MemoCache
+            >>> import asyncio
+            >>> async def compute(x):
+            >>>     await asyncio.sleep(0.01)
+            >>>     return x * 2
+            >>> self = _MemoCache()
+            >>> async def main():
+            >>>     return await asyncio.gather(*[
+            >>>         self.aget_or_compute('a', compute, (1,), {})
+            >>>         for _ in range(3)])
+            >>> loop = asyncio.new_event_loop()
+            >>> assert loop.run_until_complete(main()) == [2, 2, 2]
+            >>> loop.close()
+            >>> assert self.info()[0:2] == (2, 1)
+        """
+        import asyncio
+        value = self.lookup(key)
+        if value is not _MISSING:
+            return value
+        task = self._tasks.get(key, None)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(functools.partial(self._finish_task, key))
+        else:
+            # Sharing an in-flight result is not a miss
+            self.misses -= 1
+            self.hits += 1
+        return await asyncio.shield(task)
+
+    def _finish_task(self, key, task):
+        """
+        Stores the result of a finished task from
+        :func:`_MemoCache.aget_or_compute`.
+        """
+        if self._tasks.get(key, None) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is None:
+            self.store(key, task.result())
+
+    def _remove(self, key):
+        """
+        Removes an entry if it exists. The caller must hold the store lock.
+
+        Returns:
+            bool: True if the entry existed
+        """
+        existed = self.data.pop(key, _MISSING) is not _MISSING
+        self.nbytes -= self._sizes.pop(key, 0)
+        self._expires.pop(key, None)
+        return existed
+
+    def info(self):
+        """
+        Returns:
+            CacheInfo: usage statistics
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self.data), self.evictions, self.nbytes)
+
+    def clear(self):
+        with self._store_lock:
+            self.data.clear()
+            self._expires.clear()
+            self._sizes.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+
+class _DiskMemoCache(object):
+    """
+    The persistent layer used by :func:`memoize` when ``disk=True``.
+
+    Each result is stored by a :class:`ubelt.util_cache.Cacher` that depends
+    on the hash of the call signature and a fingerprint of the function,
+    which is its ``version`` if given and otherwise a hash of its source code.
+
+    Args:
+        func (Callable): the function whose results are stored
+
+        dpath (str | PathLike | None): the cache directory. Defaults to
+            ``ubelt/memoize`` in the application cache directory.
+
+        version (str | None): identifies the implementation of ``func``.
+            If None, a hash of the source code of ``func`` is used.
+
+        lock (bool | float): passed to :class:`ubelt.util_cache.Cacher` so
+            only one process computes a missing result.
+
+    Example:
+        >>> from ubelt.util_memoize import _DiskMemoCache
+        >>> import ubelt as ub
+        >>> dpath = ub.Path.appdir('ubelt/tests/disk-memo-cache').delete()
+        >>> self = _DiskMemoCache(pow, dpath=dpath, version='1')
+        >>> assert self.get_or_compute(pow, (2, 3), {}) == 8
+        >>> assert self.get_or_compute(pow, (2, 3), {}) == 8
+        >>> info = self.info()
+        >>> assert info.hits == 1 and info.misses == 1 and info.currsize == 1
+        >>> self.clear()
+        >>> assert self.info().currsize == 0
+    """
+
+    def __init__(self, func, dpath=None, version=None, lock=False):
+        import re
+        if dpath is None:
+            from ubelt import util_platform
+            dpath = util_platform.get_app_cache_dir('ubelt', 'memoize')
+        name = '{}.{}'.format(getattr(func, '__module__', None),
+                              getattr(func, '__qualname__', func.__name__))
+        if version is None:
+            version = _function_fingerprint(func)
+        self.dpath = dpath
+        # Replace characters like the angle brackets in "<locals>"
+        self.fname = re.sub(r'[^\w.-]', '_', name)
+        self.version = str(version)
+        self.lock = lock
+        self.hits = 0
+        self.misses = 0
+
+    def _cacher(self, args, kwargs):
+        from ubelt.util_cache import Cacher
+        depends = util_hash.hash_data([self.version, args, kwargs])
+        return Cacher(self.fname, depends=depends, dpath=self.dpath,
+                      verbose=0, lock=self.lock)
+
+    def get_or_compute(self, func, args, kwargs):
+        """
+        Returns the stored result of the call or computes and stores it.
+
+        Args:
+            func (Callable): computes the value when called with
+                ``*args`` and ``**kwargs``
+            args (Tuple): positional arguments for func
+            kwargs (Dict): keyword arguments for func
+
+        Returns:
+            object: the value
+        """
+        cacher = self._cacher(args, kwargs)
+        try:
+            value = cacher.load()
+        except IOError:
+            pass
+        else:
+            self.hits += 1
+            return value
+        if cacher.lock:
+            with cacher._file_lock():
+                # Another process may have computed the value while we were
+                # waiting for the lock.
+                try:
+                    value = cacher.load()
+                except IOError:
+                    pass
+                else:
+                    self.hits += 1
+                    return value
+                self.misses += 1
+                value = func(*args, **kwargs)
+                cacher._save(value)
+        else:
+            self.misses += 1
+            value = func(*args, **kwargs)
+            cacher.save(value)
+        return value
+
+    async def aget_or_compute(self, func, args, kwargs):
+        """
+        Like :func:`_DiskMemoCache.get_or_compute`, but for a coroutine
+        function. File I/O runs in the default executor of the event loop.
+        """
+        cacher = self._cacher(args, kwargs)
+        try:
+            value = await cacher.aload()
+        except IOError:
+            pass
+        else:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = await func(*args, **kwargs)
+        await cacher.asave(value)
+        return value
+
+    def _existing_fpaths(self):
+        from ubelt.util_cache import Cacher
+        cacher = Cacher(self.fname, dpath=self.dpath, verbose=0)
+        return list(cacher.existing_versions())
+
+    def info(self):
+        """
+        Returns:
+            CacheInfo: usage statistics, where ``currsize`` and ``nbytes``
+                describe all results of this function that exist on disk.
+        """
+        import os
+        fpaths = self._existing_fpaths()
+        nbytes = sum(os.stat(fpath).st_size for fpath in fpaths)
+        return CacheInfo(self.hits, self.misses, None, len(fpaths), 0, nbytes)
+
+    def clear(self):
+        """
+        Removes all results of this function from disk
+        """
+        import os
+        for fpath in self._existing_fpaths():
+            for suffix in ['', '.meta', '.lock']:
+                try:
+                    os.remove(fpath + suffix)
+                except FileNotFoundError:
+                    pass
+        self.hits = 0
+        self.misses = 0
+
+
+def _function_fingerprint(func):
+    """
+    Returns a hash of the source code of a function, or of its bytecode if the
+    source is not available.
+
+    Example:
+        >>> from ubelt.util_memoize import _function_fingerprint
+        >>> def func1(x):
+        >>>     return x + 1
+        >>> def func2(x):
+        >>>     return x + 2
+        >>> assert _function_fingerprint(func1) != _function_fingerprint(func2)
+    """
+    import inspect
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        code = getattr(func, '__code__', None)
+        if code is None:
+            source = func.__qualname__
+        else:
+            source = [code.co_code, code.co_consts]
+    return util_hash.hash_data(source, hasher='sha1')
+
+
+def memoize(func=None, maxsize=None, ttl=None, typed=False, lock=False,
+            key='hash', disk=False, dpath=None, version=None):
     """
     memoization decorator that respects args and kwargs
 
@@ -114,12 +761,66 @@ def memoize(func):
     currently faster than memoize for simple functions [FunctoolsCache]_.
     However, memoize can handle more general non-natively hashable inputs.
 
+    The wrapper has a ``cache_info`` method that returns the number of hits,
+    misses, and evictions as well as the current size and an estimate of the
+    memory used by the cached values. The ``cache_clear`` method removes all
+    cached values.
+
     Args:
-        func (Callable): live python function
+        func (Callable | None): live python function. If None, returns a
+            decorator with the specified options.
+
+        maxsize (int | None): if specified, at most this many results are
+            cached and the least recently used results are evicted first.
+
+        ttl (float | None): if specified, cached results expire after this
+            many seconds.
+
+        typed (bool): if True, arguments of different types are cached
+            separately (e.g. ``f(1)`` and ``f(1.0)``). Defaults to False.
+
+        lock (bool): if True, the cache is thread-safe and each result is
+            computed exactly once: when several threads call the function
+            with the same missing arguments, one computes the result and the
+            others wait for it. If the computation raises an exception, the
+            waiting callers receive the same exception. Defaults to False.
+
+        key (str | Callable):
+            how the arguments are turned into a cache key. The default
+            'hash' uses :func:`ubelt.util_hash.hash_data` on any argument that
+            is not natively hashable. The cheaper 'fast' option freezes small
+            containers into tuples, hashes large ones with a
+            non-cryptographic hasher, and keys numpy arrays by identity (so
+            inplace modifications of an array are not detected). A callable
+            is passed the same arguments as ``func`` and must return a
+            hashable key. Defaults to 'hash'.
+
+        disk (bool): if True, results are also saved to disk with
+            :class:`ubelt.util_cache.Cacher`, so they persist between
+            processes. The in-memory cache (which is bounded by ``maxsize``
+            and ``ttl``) is checked first and the disk is only read on a miss.
+            The file of each result depends on a hash of the arguments, which
+            must be supported by :func:`ubelt.util_hash.hash_data`, and on the
+            ``version``. The wrapper gains ``disk_info`` and ``disk_clear``
+            methods for the disk layer. Defaults to False.
+
+        dpath (str | PathLike | None): the directory for ``disk=True``.
+            Defaults to ``ubelt/memoize`` in the application cache directory.
+
+        version (str | None): identifies the implementation of ``func`` for
+            ``disk=True``. Results saved with a different version are not
+            used. If unspecified, a hash of the source code of ``func`` is
+            used, so editing the function invalidates its results.
 
     Returns:
         Callable: memoized wrapper
 
+    Note:
+        If ``func`` is a coroutine function, the wrapper is also a coroutine
+        function and the awaited result is cached. Concurrent callers with
+        the same missing arguments await a single shared task, so the
+        ``lock`` option is not needed within an event loop.
+
     References:
         .. [WikiMemoize] https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize
         .. [FunctoolsCache] https://docs.python.org/3/library/functools.html
@@ -146,15 +847,167 @@ def memoize(func):
         >>> assert foo('a') == 0 and foo('c') == 1
         >>> assert incr[0] == 6
         >>> assert foo_memo('a') == 'b' and foo_memo('c') == 'd'
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Options can be specified to bound the size of the cache
+        >>> @ub.memoize(maxsize=2, typed=True)
+        >>> def square(x):
+        >>>     return x ** 2
+        >>> square(1), square(1.0), square(2), square(2)
+        >>> info = square.cache_info()
+        >>> print(info)
+        >>> assert info.hits == 1 and info.misses == 3 and info.evictions == 1
+        >>> square.cache_clear()
+        >>> assert square.cache_info().currsize == 0
+
+    Example:
+        >>> import ubelt as ub
+        >>> import time
+        >>> # With lock=True concurrent callers share one computation
+        >>> calls = []
+        >>> @ub.memoize(lock=True)
+        >>> def slow_square(x):
+        >>>     calls.append(x)
+        >>>     time.sleep(0.01)
+        >>>     return x ** 2
+        >>> with ub.JobPool('thread', max_workers=8) as pool:
+        >>>     jobs = [pool.submit(slow_square, 3) for _ in range(8)]
+        >>>     results = [job.result() for job in jobs]
+        >>> assert results == [9] * 8
+        >>> assert calls == [3]
+
+    Example:
+        >>> import ubelt as ub
+        >>> # The fast key avoids a cryptographic hash of unhashable inputs
+        >>> @ub.memoize(key='fast')
+        >>> def total(items):
+        >>>     return sum(items)
+        >>> assert total([1, 2, 3]) == 6
+        >>> assert total([1, 2, 3]) == 6
+        >>> assert total.cache_info().hits == 1
+        >>> # A custom key function receives the arguments of the function
+        >>> @ub.memoize(key=lambda items: len(items))
+        >>> def first(items):
+        >>>     return items[0]
+        >>> assert first([1, 2]) == 1 and first([3, 4]) == 1
+
+    Example:
+        >>> import ubelt as ub
+        >>> import asyncio
+        >>> # Coroutine functions cache the awaited result
+        >>> calls = []
+        >>> @ub.memoize
+        >>> async def fetch(x):
+        >>>     calls.append(x)
+        >>>     await asyncio.sleep(0.01)
+        >>>     return x * 2
+        >>> async def main():
+        >>>     first = await asyncio.gather(*[fetch(3) for _ in range(4)])
+        >>>     second = await fetch(3)
+        >>>     return first, second
+        >>> loop = asyncio.new_event_loop()
+        >>> first, second = loop.run_until_complete(main())
+        >>> loop.close()
+        >>> assert first == [6] * 4 and second == 6
+        >>> assert calls == [3]
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Results can persist on disk between processes
+        >>> dpath = ub.Path.appdir('ubelt/tests/memoize-disk').delete()
+        >>> calls = []
+        >>> def expensive(x, scale=1):
+        >>>     calls.append(x)
+        >>>     return x * scale
+        >>> memo1 = ub.memoize(expensive, disk=True, dpath=dpath, version='1')
+        >>> assert memo1(2, scale=3) == 6
+        >>> assert memo1(2, scale=3) == 6
+        >>> # A new wrapper (e.g. in another process) reads from disk
+        >>> memo2 = ub.memoize(expensive, disk=True, dpath=dpath, version='1')
+        >>> assert memo2(2, scale=3) == 6
+        >>> assert calls == [2]
+        >>> print(memo2.cache_info())
+        >>> print(memo2.disk_info())
+        >>> assert memo2.cache_info().misses == 1
+        >>> assert memo2.disk_info().hits == 1
+        >>> # Changing the version invalidates the results
+        >>> memo3 = ub.memoize(expensive, disk=True, dpath=dpath, version='2')
+        >>> assert memo3(2, scale=3) == 6
+        >>> assert calls == [2, 2]
+        >>> memo3.disk_clear()
     """
-    cache = {}
-    @functools.wraps(func)
-    def memoizer(*args, **kwargs):
-        key = _make_signature_key(args, kwargs)
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
-    memoizer.cache = cache
+    if func is None:
+        return functools.partial(memoize, maxsize=maxsize, ttl=ttl,
+                                 typed=typed, lock=lock, key=key, disk=disk,
+                                 dpath=dpath, version=version)
+    import inspect
+    make_key = _rectify_key_func(key)
+    is_coroutine = inspect.iscoroutinefunction(func)
+    # The function called on a miss of the in-memory cache
+    if disk:
+        disk_cache = _DiskMemoCache(func, dpath=dpath, version=version,
+                                    lock=lock)
+
+        async def _adisk_compute(*args, **kwargs):
+            return await disk_cache.aget_or_compute(func, args, kwargs)
+
+        def _disk_compute(*args, **kwargs):
+            return disk_cache.get_or_compute(func, args, kwargs)
+
+        compute = _adisk_compute if is_coroutine else _disk_compute
+    else:
+        compute = func
+    if is_coroutine:
+        lock = False
+    memo_cache = _MemoCache(maxsize=maxsize, ttl=ttl, lock=lock)
+    lookup = memo_cache.lookup
+    store = memo_cache.store
+
+    if is_coroutine:
+        aget_or_compute = memo_cache.aget_or_compute
+
+        @functools.wraps(func)
+        async def memoizer(*args, **kwargs):
+            cache_key = make_key(args, kwargs, typed)
+            return await aget_or_compute(cache_key, compute, args, kwargs)
+    elif lock:
+        get_or_compute = memo_cache.get_or_compute
+
+        @functools.wraps(func)
+        def memoizer(*args, **kwargs):
+            cache_key = make_key(args, kwargs, typed)
+            return get_or_compute(cache_key, compute, args, kwargs)
+    elif maxsize is None and ttl is None:
+        # Inline the lookup in the common unbounded case
+        data = memo_cache.data
+
+        @functools.wraps(func)
+        def memoizer(*args, **kwargs):
+            cache_key = make_key(args, kwargs, typed)
+            value = data.get(cache_key, _MISSING)
+            if value is _MISSING:
+                memo_cache.misses += 1
+                value = compute(*args, **kwargs)
+                store(cache_key, value)
+            else:
+                memo_cache.hits += 1
+            return value
+    else:
+        @functools.wraps(func)
+        def memoizer(*args, **kwargs):
+            cache_key = make_key(args, kwargs, typed)
+            value = lookup(cache_key)
+            if value is _MISSING:
+                value = compute(*args, **kwargs)
+                store(cache_key, value)
+            return value
+    memoizer.cache = memo_cache.data
+    memoizer.cache_info = memo_cache.info
+    memoizer.cache_clear = memo_cache.clear
+    if disk:
+        memoizer.disk_info = disk_cache.info
+        memoizer.disk_clear = disk_cache.clear
     return memoizer
 
 
@@ -162,6 +1015,31 @@ class memoize_method(object):
     """
     memoization decorator for a method that respects args and kwargs
 
+    Each instance has its own cache. The options are the same as
+    :func:`memoize`, and the ``cache_info`` and ``cache_clear`` methods of a
+    bound memoized method refer to the cache of that instance.
+
+    Args:
+        func (Callable | None): the method to wrap. If None, returns a
+            decorator with the specified options.
+
+        maxsize (int | None): the maximum number of cached results per
+            instance.
+
+        ttl (float | None): if specified, cached results expire after this
+            many seconds.
+
+        typed (bool): if True, arguments of different types are cached
+            separately.
+
+        lock (bool): if True, each instance cache is thread-safe and each
+            result is computed exactly once. See :func:`memoize`.
+            Coroutine methods are handled as in :func:`memoize`.
+
+        key (str | Callable): 'hash', 'fast', or a callable that is passed
+            the arguments of the method (excluding ``self``) and returns a
+            hashable key. See :func:`memoize`.
+
     References:
         .. [ActiveState_Miller_2010] http://code.activestate.com/recipes/577452-a-memoize-decorator-for-instance-methods
 
@@ -199,12 +1077,56 @@ class memoize_method(object):
         >>> assert incr[0] == 7
         >>> self2.foo_memo('a')
         >>> assert incr[0] == 7
+
+    Example:
+        >>> import ubelt as ub
+        >>> class Foo(object):
+        >>>     @ub.memoize_method(maxsize=1)
+        >>>     def double(self, x):
+        >>>         return x * 2
+        >>> self = Foo()
+        >>> self.double(1), self.double(1), self.double(2)
+        >>> info = self.double.cache_info()
+        >>> assert info.hits == 1 and info.evictions == 1
+        >>> self.double.cache_clear()
+        >>> assert self.double.cache_info().currsize == 0
+
+    Example:
+        >>> import ubelt as ub
+        >>> # Accessing the method from different instances (even in
+        >>> # different threads) does not interfere
+        >>> class Foo(object):
+        >>>     def __init__(self, n):
+        >>>         self.n = n
+        >>>     @ub.memoize_method(lock=True)
+        >>>     def plus(self, x):
+        >>>         return self.n + x
+        >>> a, b = Foo(1), Foo(10)
+        >>> plus_a, plus_b = a.plus, b.plus
+        >>> assert plus_a(1) == 2 and plus_b(1) == 11
+        >>> assert Foo.plus(a, 5) == 6
     """
-    def __init__(self, func):
+    def __new__(cls, func=None, maxsize=None, ttl=None, typed=False,
+                lock=False, key='hash'):
+        if func is None:
+            return functools.partial(cls, maxsize=maxsize, ttl=ttl,
+                                     typed=typed, lock=lock, key=key)
+        return super().__new__(cls)
+
+    def __init__(self, func, maxsize=None, ttl=None, typed=False,
+                 lock=False, key='hash'):
         self._func = func
         self._cache_name = '_cache__' + func.__name__
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._typed = typed
+        import inspect
+        self._make_key = _rectify_key_func(key)
+        self._is_coroutine = inspect.iscoroutinefunction(func)
+        self._lock = False if self._is_coroutine else lock
         # Mimic attributes of a bound method
         self.__func__ = func
+        functools.update_wrapper(self, func)
 
     def __get__(self, instance, cls=None):
         """
@@ -214,21 +1136,88 @@ class memoize_method(object):
         Args:
             instance (object): the instance of the class with the memoized method
             cls (type): the type of the instance
+
+        Returns:
+            _BoundMemoizedMethod | memoize_method:
+                the method bound to the instance, or this descriptor if it
+                was accessed from the class.
         """
-        self._instance = instance
-        return self
+        if instance is None:
+            return self
+        return _BoundMemoizedMethod(self, instance)
 
-    def __call__(self, *args, **kwargs):
+    def _memo_cache(self, instance):
         """
-        The wrapped function call
+        Returns the cache that belongs to an instance
         """
-        cache = self._instance.__dict__.setdefault(self._cache_name, {})
-        key = _make_signature_key(args, kwargs)
-        if key in cache:
-            return cache[key]
-        else:
-            value = cache[key] = self._func(self._instance, *args, **kwargs)
+        try:
+            return instance.__dict__[self._cache_name]
+        except KeyError:
+            memo_cache = _MemoCache(maxsize=self._maxsize, ttl=self._ttl,
+                                    lock=self._lock)
+            # setdefault is atomic, so racing threads agree on the cache
+            return instance.__dict__.setdefault(self._cache_name, memo_cache)
+
+    def __call__(self, instance, *args, **kwargs):
+        """
+        The wrapped function call with an explicit instance
+        """
+        try:
+            memo_cache = instance.__dict__[self._cache_name]
+        except KeyError:
+            memo_cache = self._memo_cache(instance)
+        key = self._make_key(args, kwargs, self._typed)
+        if self._is_coroutine:
+            # Returns an awaitable like calling the coroutine function would
+            return memo_cache.aget_or_compute(key, self._func,
+                                              (instance,) + args, kwargs)
+        if memo_cache._lock is None:
+            value = memo_cache.lookup(key)
+            if value is _MISSING:
+                value = self._func(instance, *args, **kwargs)
+                memo_cache.store(key, value)
             return value
+        return memo_cache.get_or_compute(key, self._func,
+                                         (instance,) + args, kwargs)
+
+
+class _BoundMemoizedMethod(functools.partial):
+    """
+    A :class:`memoize_method` bound to an instance. Like a builtin bound
+    method, a new one of these is created on each attribute access, so the
+    descriptor itself does not store any per-instance state. Subclassing
+    :class:`functools.partial` keeps the construction cheap.
+    """
+    __slots__ = ()
+
+    @property
+    def __self__(self):
+        return self.args[0]
+
+    @property
+    def __func__(self):
+        return self.func._func
+
+    @property
+    def __name__(self):
+        return self.func._func.__name__
+
+    def cache_info(self):
+        """
+        Returns:
+            CacheInfo: usage statistics of the cache of the bound instance
+        """
+        return self.func._memo_cache(self.args[0]).info()
+
+    def cache_clear(self):
+        """
+        Removes all cached results of the bound instance
+        """
+        self.func._memo_cache(self.args[0]).clear()
+
+    def __repr__(self):
+        return '<memoized bound method {} of {!r}>'.format(
+            self.func._func.__qualname__, self.args[0])
 
 
 def memoize_property(fget):
@@ -1,21 +1,82 @@
+from functools import partial
+from os import PathLike
 from typing import Callable
+from typing import NamedTuple
+from typing import Union
 from _typeshed import Incomplete
 
 
-def memoize(func: Callable) -> Callable:
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Union[int, None]
+    currsize: int
+    evictions: int
+    nbytes: int
+
+
+def memoize(func: Union[Callable, None] = None,
+            maxsize: Union[int, None] = None,
+            ttl: Union[float, None] = None,
+            typed: bool = False,
+            lock: bool = False,
+            key: Union[str, Callable] = 'hash',
+            disk: bool = False,
+            dpath: Union[str, PathLike, None] = None,
+            version: Union[str, None] = None) -> Callable:
     ...
 
 
 class memoize_method:
     __func__: Incomplete
 
-    def __init__(self, func) -> None:
+    def __new__(cls,
+                func: Union[Callable, None] = None,
+                maxsize: Union[int, None] = None,
+                ttl: Union[float, None] = None,
+                typed: bool = False,
+                lock: bool = False,
+                key: Union[str, Callable] = 'hash'):
+        ...
+
+    def __init__(self,
+                 func: Callable,
+                 maxsize: Union[int, None] = None,
+                 ttl: Union[float, None] = None,
+                 typed: bool = False,
+                 lock: bool = False,
+                 key: Union[str, Callable] = 'hash') -> None:
+        ...
+
+    def __get__(
+        self,
+        instance: object,
+        cls: type = None
+    ) -> Union[_BoundMemoizedMethod, memoize_method]:
+        ...
+
+    def __call__(self, instance: object, *args, **kwargs):
+        ...
+
+
+class _BoundMemoizedMethod(partial):
+
+    @property
+    def __self__(self) -> object:
+        ...
+
+    @property
+    def __func__(self) -> Callable:
+        ...
+
+    @property
+    def __name__(self) -> str:
         ...
 
-    def __get__(self, instance: object, cls: type = None):
+    def cache_info(self) -> CacheInfo:
         ...
 
-    def __call__(self, *args, **kwargs):
+    def cache_clear(self) -> None:
         ...
 
 